@@ -1,19 +1,281 @@
-from flask import Flask, jsonify, request
+import json
+import os
+import time
+from typing import Optional
+
+from flask import Flask, Response, jsonify, request, stream_with_context
 from http import HTTPStatus
-from src.controller import simulador
+from src.aleatoriedade import nova_seed
+from src.armazem import FILTROS, ArmazemResultados, armazenar_lote
+from src.cache import CacheResultados, chave_cache
+from src.controller import gerar_resultados, simulador, simular_lote
+from src.core import Jogo
+from src.instrumentacao import Metricas, perfilar_lote
+from src.jobs import FilaCheia, GerenciadorJobs, Job
+from src.servico import PoolSimulacao, TempoEsgotado, respeitar_prazo
 
 
 app = Flask(__name__)
 
+MAX_JOGOS_LOTE = 1_000_000
+MOTORES = ("objetos", "vetorizado")
+FORMATOS = ("json", "ndjson")
+MAX_JOGOS_JOB = 100_000_000
+MAX_JOGOS_PERFIL = 20_000
+MODOS_PERFIL = ("cprofile", "amostragem")
+MAX_TOP_PERFIL = 200
+# Teto do trabalho por partida aceito pela API (o prazo por requisição vem de
+# SIMULADOR_API_TIMEOUT quando o pool de processos está ligado)
+MAX_CASAS = int(os.environ.get("SIMULADOR_MAX_CASAS", 100_000))
+MAX_JOGADORES = int(os.environ.get("SIMULADOR_MAX_JOGADORES", 1_000))
+
+# Instrumentação por fase é opt-in: desligada, as rotas usam Jogo puro
+METRICAS: Optional[Metricas] = Metricas() if os.environ.get("SIMULADOR_METRICAS", "").strip().lower() in (
+    "1", "true", "sim", "yes") else None
+
+_gerenciador_jobs: Optional[GerenciadorJobs] = None
+_cache: Optional[CacheResultados] = None
+_armazem: Optional[ArmazemResultados] = None
+_pool: Optional[PoolSimulacao] = None
+
+
+def _parametro_bool(nome: str, default: bool = False) -> bool:
+    valor = request.args.get(nome)
+    if valor is None:
+        return default
+    return valor.strip().lower() in ("1", "true", "sim", "yes")
+
+
+def _erro(mensagem: str, status: HTTPStatus):
+    return jsonify({"sucesso": False, "erro": mensagem}), status
+
+
+def _validar_configuracao(qtd_casas: int, jogadores: int) -> Optional[str]:
+    if not 1 <= qtd_casas <= MAX_CASAS or not 1 <= jogadores <= MAX_JOGADORES:
+        return f"Parâmetros inválidos: 1 <= qtd_casas <= {MAX_CASAS} e 1 <= jogadores <= {MAX_JOGADORES}"
+    return None
+
+
+def _validar_lote(n: int, qtd_casas: int, jogadores: int, motor: str, max_jogos: int) -> Optional[str]:
+    if not 1 <= n <= max_jogos:
+        return f"Parâmetros inválidos: 1 <= n <= {max_jogos}"
+    erro = _validar_configuracao(qtd_casas, jogadores)
+    if erro:
+        return erro
+    if motor not in MOTORES:
+        return f"Motor inválido: use um de {', '.join(MOTORES)}"
+    return None
+
+
+def gerenciador_jobs() -> GerenciadorJobs:
+    # Criado na primeira requisição de job: importar o app não sobe threads
+    # nem processos
+    global _gerenciador_jobs
+    if _gerenciador_jobs is None:
+        processos = os.environ.get("SIMULADOR_JOBS_PROCESSOS")
+        _gerenciador_jobs = GerenciadorJobs(
+            max_concorrentes=int(os.environ.get("SIMULADOR_JOBS_CONCORRENTES", 2)),
+            max_fila=int(os.environ.get("SIMULADOR_JOBS_FILA", 16)),
+            processos=int(processos) if processos else None,
+        )
+    return _gerenciador_jobs
+
+
+def cache_resultados() -> CacheResultados:
+    global _cache
+    if _cache is None:
+        ttl = os.environ.get("SIMULADOR_CACHE_TTL", "300")
+        _cache = CacheResultados(
+            max_itens=int(os.environ.get("SIMULADOR_CACHE_ITENS", 256)),
+            ttl=float(ttl) if ttl else None,
+            diretorio=os.environ.get("SIMULADOR_CACHE_DIR") or None,
+            max_itens_disco=int(os.environ.get("SIMULADOR_CACHE_ITENS_DISCO", 4096)),
+        )
+    return _cache
+
+
+def armazem_resultados() -> Optional[ArmazemResultados]:
+    # Desligado sem SIMULADOR_ARMAZEM: nenhum arquivo é criado
+    global _armazem
+    if _armazem is None and os.environ.get("SIMULADOR_ARMAZEM"):
+        _armazem = ArmazemResultados(os.environ["SIMULADOR_ARMAZEM"])
+    return _armazem
+
+
+def pool_simulacao() -> Optional[PoolSimulacao]:
+    # Desligado sem SIMULADOR_API_PROCESSOS: as simulações rodam na thread da
+    # requisição, como no servidor de desenvolvimento
+    global _pool
+    if _pool is None and os.environ.get("SIMULADOR_API_PROCESSOS"):
+        fila = os.environ.get("SIMULADOR_API_FILA")
+        timeout = os.environ.get("SIMULADOR_API_TIMEOUT", "30")
+        _pool = PoolSimulacao(
+            processos=int(os.environ["SIMULADOR_API_PROCESSOS"]),
+            max_fila=int(fila) if fila else None,
+            timeout=float(timeout) if timeout else None,
+        )
+    return _pool
+
+
+def _executar(funcao, *args, com_metricas: bool = False, **kwargs):
+    # `funcao` precisa ser de nível de módulo para ir ao pool; com_metricas
+    # repassa METRICAS (no pool, os contadores voltam do worker e são somados)
+    metricas = METRICAS if com_metricas else None
+    pool = pool_simulacao()
+    if pool is None:
+        if com_metricas:
+            kwargs["metricas"] = metricas
+        return funcao(*args, **kwargs)
+    return pool.executar(funcao, *args, metricas=metricas, **kwargs)
+
+
+@app.errorhandler(FilaCheia)
+def servidor_ocupado(e):
+    resposta, status = _erro(str(e), HTTPStatus.SERVICE_UNAVAILABLE)
+    resposta.headers["Retry-After"] = "1"
+    return resposta, status
+
+
+@app.errorhandler(TempoEsgotado)
+def tempo_esgotado(e):
+    return _erro(str(e), HTTPStatus.GATEWAY_TIMEOUT)
+
+
+def _com_cache(seed: Optional[int], calcular, rota: str, **parametros):
+    # Sem seed o resultado é aleatório a cada chamada e não é guardado
+    inicio = time.perf_counter()
+    if seed is None:
+        resultado, nivel = calcular(), "ignorado"
+    else:
+        chave = chave_cache(rota, seed=seed, **parametros)
+        resultado, nivel = cache_resultados().obter_ou_calcular(chave, calcular)
+    if isinstance(resultado, dict):
+        # Cópia: o dict guardado no cache não muda. Num acerto os tempos da
+        # execução original não descrevem esta resposta; duracao_segundos
+        # passa a ser o tempo de atendimento e jogos_por_segundo sai
+        resultado = dict(resultado, cache=nivel in ("memoria", "disco"))
+        if resultado["cache"]:
+            resultado.pop("jogos_por_segundo", None)
+            if "duracao_segundos" in resultado:
+                resultado["duracao_segundos"] = time.perf_counter() - inicio
+    resposta = jsonify(resultado)
+    resposta.headers["X-Cache"] = nivel
+    return resposta, HTTPStatus.OK
+
 
 @app.route('/jogo/simular', methods=['GET'])
 def simular_jogo():
     try:
         qtd_casas = request.args.get("qtd_casas", default=20, type=int)
         jogadores = request.args.get("jogadores", default=4, type=int)
-        resultado = simulador(qtd_casas, jogadores)
-        return jsonify(resultado), HTTPStatus.OK
+        seed = request.args.get("seed", default=None, type=int)
 
+        erro = _validar_configuracao(qtd_casas, jogadores)
+        if erro:
+            return _erro(erro, HTTPStatus.BAD_REQUEST)
+        return _com_cache(seed, lambda: _executar(simulador, qtd_casas, jogadores, seed=seed, com_metricas=True),
+                          "simular", qtd_casas=qtd_casas, jogadores=jogadores)
+
+    except (FilaCheia, TempoEsgotado):
+        raise
+    except Exception as e:
+        return jsonify({
+            "sucesso": False,
+            "erro": "Erro interno ao processar simulação"
+        }), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+def _resposta_ndjson(n: int, qtd_casas: int, jogadores: int, seed, motor: str) -> Response:
+    # O streaming roda na thread da requisição, mas com o pool ligado ocupa uma
+    # vaga da admissão dele (FilaCheia -> 503 antes do primeiro byte) e
+    # respeita o mesmo prazo. A vaga volta quando a resposta é fechada, mesmo
+    # que o cliente desista no meio
+    pool = pool_simulacao()
+    prazo = pool.reservar() if pool is not None else None
+
+    if motor == "vetorizado":
+        from src.vetorizado import gerar_resultados_vetorizado
+        resultados = gerar_resultados_vetorizado(n, qtd_casas, jogadores, seed=seed)
+    else:
+        resultados = gerar_resultados(n, qtd_casas, jogadores, seed=seed)
+
+    esgotado = False
+
+    def linhas():
+        # Uma linha por partida assim que ela termina; nada do lote fica em
+        # memória. Com o status já enviado, o prazo estourado encerra o
+        # stream com uma última linha de erro
+        nonlocal esgotado
+        try:
+            for resultado in respeitar_prazo(resultados, prazo):
+                yield json.dumps(resultado, ensure_ascii=False) + "\n"
+        except TempoEsgotado as e:
+            esgotado = True
+            yield json.dumps({"sucesso": False, "erro": str(e)}, ensure_ascii=False) + "\n"
+
+    resposta = Response(stream_with_context(linhas()), mimetype="application/x-ndjson")
+    if pool is not None:
+        resposta.call_on_close(lambda: pool.liberar(esgotada=esgotado))
+    return resposta
+
+
+@app.route('/jogo/simular/lote', methods=['GET'])
+def simular_lote_jogos():
+    try:
+        n = request.args.get("n", default=1000, type=int)
+        qtd_casas = request.args.get("qtd_casas", default=20, type=int)
+        jogadores = request.args.get("jogadores", default=4, type=int)
+        detalhes = _parametro_bool("detalhes")
+        motor = request.args.get("motor", default="objetos")
+        seed = request.args.get("seed", default=None, type=int)
+        formato = request.args.get("formato", default="json")
+
+        erro = _validar_lote(n, qtd_casas, jogadores, motor, MAX_JOGOS_LOTE)
+        if erro:
+            return _erro(erro, HTTPStatus.BAD_REQUEST)
+        if formato not in FORMATOS:
+            return _erro(f"Formato inválido: use um de {', '.join(FORMATOS)}", HTTPStatus.BAD_REQUEST)
+
+        if formato == "ndjson":
+            return _resposta_ndjson(n, qtd_casas, jogadores, seed, motor)
+
+        if _parametro_bool("armazenar"):
+            armazem = armazem_resultados()
+            if armazem is None:
+                return _erro("Armazém desativado: defina SIMULADOR_ARMAZEM", HTTPStatus.CONFLICT)
+            if detalhes:
+                return _erro("detalhes não é suportado com armazenar; consulte /jogo/armazem",
+                             HTTPStatus.BAD_REQUEST)
+            # Grava cada partida; não passa pelo cache porque tem efeito
+            # colateral. O armazém tem um único escritor, então a gravação
+            # fica neste processo, mas ocupa uma vaga do pool e respeita o prazo
+            pool = pool_simulacao()
+            if pool is None:
+                return jsonify(armazenar_lote(armazem, n, qtd_casas, jogadores, seed, motor=motor)), HTTPStatus.OK
+            prazo = pool.reservar()
+            esgotada = False
+            try:
+                resposta = armazenar_lote(armazem, n, qtd_casas, jogadores, seed, motor=motor, prazo=prazo)
+            except TempoEsgotado:
+                esgotada = True
+                raise
+            finally:
+                pool.liberar(esgotada=esgotada)
+            return jsonify(resposta), HTTPStatus.OK
+
+        def calcular():
+            if motor == "vetorizado":
+                # Import tardio: numpy só é carregado quando o motor é usado
+                from src.vetorizado import simular_vetorizado
+                return _executar(simular_vetorizado, n, qtd_casas, jogadores, seed=seed, detalhes=detalhes)
+            return _executar(simular_lote, n, qtd_casas, jogadores, detalhes=detalhes, seed=seed,
+                             com_metricas=True)
+
+        return _com_cache(seed, calcular, "lote", n=n, qtd_casas=qtd_casas, jogadores=jogadores,
+                          detalhes=detalhes, motor=motor)
+
+    except (FilaCheia, TempoEsgotado):
+        raise
     except Exception as e:
         return jsonify({
             "sucesso": False,
@@ -21,9 +283,253 @@ def simular_jogo():
         }), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@app.route('/jogo/simular/adaptativo', methods=['GET'])
+def simular_adaptativo():
+    try:
+        max_jogos = request.args.get("max_jogos", default=100_000, type=int)
+        qtd_casas = request.args.get("qtd_casas", default=20, type=int)
+        jogadores = request.args.get("jogadores", default=4, type=int)
+        precisao = request.args.get("precisao", default=None, type=float)
+        comparar = request.args.get("comparar", default=None)
+        confianca = request.args.get("confianca", default=0.95, type=float)
+        motor = request.args.get("motor", default="objetos")
+        seed = request.args.get("seed", default=None, type=int)
+
+        erro = _validar_lote(max_jogos, qtd_casas, jogadores, motor, MAX_JOGOS_LOTE)
+        if erro:
+            return _erro(erro, HTTPStatus.BAD_REQUEST)
+        if comparar is not None:
+            comparar = tuple(nome.strip() for nome in comparar.split(","))
+            if len(comparar) != 2:
+                return _erro("comparar deve ter duas estratégias separadas por vírgula", HTTPStatus.BAD_REQUEST)
+
+        from src.adaptativo import Criterio, estimar, estrategias_em_jogo
+        try:
+            Criterio(precisao, comparar, confianca, estrategias_em_jogo(jogadores))
+        except ValueError as e:
+            return _erro(f"Parâmetros inválidos: {e}", HTTPStatus.BAD_REQUEST)
+
+        def calcular():
+            return _executar(estimar, qtd_casas, jogadores, precisao, comparar, confianca, max_jogos, seed=seed,
+                             processos=1, motor=motor)
+
+        return _com_cache(seed, calcular, "adaptativo", max_jogos=max_jogos, qtd_casas=qtd_casas,
+                          jogadores=jogadores, precisao=precisao, comparar=comparar, confianca=confianca,
+                          motor=motor)
+
+    except (FilaCheia, TempoEsgotado):
+        raise
+    except Exception as e:
+        return _erro("Erro interno ao processar simulação", HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@app.route('/jogo/analise', methods=['GET'])
+def analisar_tabuleiro():
+    try:
+        qtd_casas = request.args.get("qtd_casas", default=20, type=int)
+        jogadores = request.args.get("jogadores", default=4, type=int)
+        seed = request.args.get("seed", default=None, type=int)
+        turnos = request.args.get("turnos", default=None, type=int)
+
+        erro = _validar_configuracao(qtd_casas, jogadores)
+        if erro:
+            return _erro(erro, HTTPStatus.BAD_REQUEST)
+        # Nenhuma partida passa de MAX_RODADAS turnos; um horizonte maior só
+        # serviria para estourar a conta
+        if turnos is not None and not 0 <= turnos <= Jogo.MAX_RODADAS:
+            return _erro(f"Parâmetros inválidos: 0 <= turnos <= {Jogo.MAX_RODADAS}", HTTPStatus.BAD_REQUEST)
+
+        # Import tardio: numpy só é carregado quando a análise é usada
+        from src.markov import analisar, tabuleiro_da_seed
+        if seed is None:
+            seed = nova_seed()
+        resposta = analisar(tabuleiro_da_seed(qtd_casas, seed), jogadores, turnos)
+        resposta["seed"] = seed
+        return jsonify(resposta), HTTPStatus.OK
+
+    except Exception as e:
+        return _erro("Erro interno ao analisar tabuleiro", HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@app.route('/jogo/armazem', methods=['GET'])
+def consultar_armazem():
+    armazem = armazem_resultados()
+    if armazem is None:
+        return _erro("Armazém desativado: defina SIMULADOR_ARMAZEM", HTTPStatus.CONFLICT)
+    try:
+        filtros = {}
+        for coluna in FILTROS:
+            if coluna in ("composicao", "vencedor"):
+                filtros[coluna] = request.args.get(coluna)
+            elif coluna == "termino_por_tempo":
+                filtros[coluna] = _parametro_bool(coluna) if coluna in request.args else None
+            else:
+                filtros[coluna] = request.args.get(coluna, default=None, type=int)
+        return jsonify(armazem.consultar(**filtros)), HTTPStatus.OK
+
+    except Exception as e:
+        return _erro("Erro interno ao consultar armazém", HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@app.route('/jogo/armazem/execucoes', methods=['GET'])
+def listar_execucoes():
+    armazem = armazem_resultados()
+    if armazem is None:
+        return _erro("Armazém desativado: defina SIMULADOR_ARMAZEM", HTTPStatus.CONFLICT)
+    return jsonify(armazem.execucoes()), HTTPStatus.OK
+
+
+@app.route('/jogo/jobs', methods=['POST'])
+def criar_job():
+    try:
+        corpo = request.get_json(silent=True) or {}
+        try:
+            n = int(corpo.get("n", 1000))
+            qtd_casas = int(corpo.get("qtd_casas", 20))
+            jogadores = int(corpo.get("jogadores", 4))
+            seed = None if corpo.get("seed") is None else int(corpo["seed"])
+        except (TypeError, ValueError):
+            return _erro("Parâmetros devem ser inteiros", HTTPStatus.BAD_REQUEST)
+        motor = corpo.get("motor", "objetos")
+
+        erro = _validar_lote(n, qtd_casas, jogadores, motor, MAX_JOGOS_JOB)
+        if erro:
+            return _erro(erro, HTTPStatus.BAD_REQUEST)
+
+        job = gerenciador_jobs().submeter(Job(n, qtd_casas, jogadores, seed, motor))
+        resposta = job.progresso()
+        resposta["links"] = {
+            "progresso": f"/jogo/jobs/{job.id}",
+            "resultado": f"/jogo/jobs/{job.id}/resultado",
+        }
+        return jsonify(resposta), HTTPStatus.ACCEPTED
+
+    except FilaCheia as e:
+        return _erro(str(e), HTTPStatus.SERVICE_UNAVAILABLE)
+    except Exception as e:
+        return _erro("Erro interno ao criar job", HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+@app.route('/jogo/jobs/<job_id>', methods=['GET'])
+def progresso_job(job_id: str):
+    job = gerenciador_jobs().obter(job_id)
+    if job is None:
+        return _erro("Job não encontrado", HTTPStatus.NOT_FOUND)
+    return jsonify(job.progresso()), HTTPStatus.OK
+
+
+@app.route('/jogo/jobs/<job_id>/resultado', methods=['GET'])
+def resultado_job(job_id: str):
+    job = gerenciador_jobs().obter(job_id)
+    if job is None:
+        return _erro("Job não encontrado", HTTPStatus.NOT_FOUND)
+    if job.estado != Job.CONCLUIDO:
+        return jsonify(job.progresso()), HTTPStatus.CONFLICT
+    return jsonify(job.resultado()), HTTPStatus.OK
+
+
+@app.route('/jogo/jobs/<job_id>', methods=['DELETE'])
+def cancelar_job(job_id: str):
+    job = gerenciador_jobs().cancelar(job_id)
+    if job is None:
+        return _erro("Job não encontrado", HTTPStatus.NOT_FOUND)
+    return jsonify(job.progresso()), HTTPStatus.OK
+
+
+@app.route('/jogo/cache', methods=['GET'])
+def estatisticas_cache():
+    return jsonify(cache_resultados().estatisticas()), HTTPStatus.OK
+
+
+@app.route('/jogo/cache', methods=['DELETE'])
+def limpar_cache():
+    cache_resultados().limpar()
+    return jsonify(cache_resultados().estatisticas()), HTTPStatus.OK
+
+
+@app.route('/metrics', methods=['GET'])
+def metricas():
+    resposta = {
+        "instrumentacao_ativa": METRICAS is not None,
+        "simulacao": METRICAS.resumo() if METRICAS is not None else None,
+        "cache": cache_resultados().estatisticas(),
+        "pool": pool_simulacao().estatisticas() if pool_simulacao() is not None else None,
+    }
+    if request.args.get("formato") == "prometheus":
+        linhas = METRICAS.prometheus() if METRICAS is not None else ""
+        cache = resposta["cache"]
+        for nome in ("acertos_memoria", "acertos_disco", "falhas", "expirados", "despejos", "despejos_disco"):
+            linhas += f"# TYPE simulador_cache_{nome}_total counter\nsimulador_cache_{nome}_total {cache[nome]}\n"
+        pool = resposta["pool"]
+        if pool is not None:
+            linhas += f"# TYPE simulador_pool_em_andamento gauge\nsimulador_pool_em_andamento {pool['em_andamento']}\n"
+            for nome in ("concluidas", "recusadas", "esgotadas"):
+                linhas += f"# TYPE simulador_pool_{nome}_total counter\nsimulador_pool_{nome}_total {pool[nome]}\n"
+        return Response(linhas, mimetype="text/plain; version=0.0.4")
+    return jsonify(resposta), HTTPStatus.OK
+
+
+@app.route('/jogo/perfil', methods=['GET'])
+def perfilar():
+    try:
+        n = request.args.get("n", default=1000, type=int)
+        qtd_casas = request.args.get("qtd_casas", default=20, type=int)
+        jogadores = request.args.get("jogadores", default=4, type=int)
+        seed = request.args.get("seed", default=None, type=int)
+        modo = request.args.get("modo", default="amostragem")
+        top = request.args.get("top", default=25, type=int)
+
+        erro = _validar_lote(n, qtd_casas, jogadores, "objetos", MAX_JOGOS_PERFIL)
+        if erro:
+            return _erro(erro, HTTPStatus.BAD_REQUEST)
+        if modo not in MODOS_PERFIL:
+            return _erro(f"Modo inválido: use um de {', '.join(MODOS_PERFIL)}", HTTPStatus.BAD_REQUEST)
+        if not 1 <= top <= MAX_TOP_PERFIL:
+            return _erro(f"top deve estar entre 1 e {MAX_TOP_PERFIL}", HTTPStatus.BAD_REQUEST)
+
+        return jsonify(_executar(perfilar_lote, n, qtd_casas, jogadores, seed, modo, top)), HTTPStatus.OK
+
+    except (FilaCheia, TempoEsgotado):
+        raise
+    except Exception as e:
+        return _erro("Erro interno ao perfilar simulação", HTTPStatus.INTERNAL_SERVER_ERROR)
+
+
+def servir(host: str, porta: int, threads: Optional[int] = None):
+    # Modo de produção: sem debug/reloader, simulações no pool de processos e
+    # um servidor WSGI multi-thread. As threads só esperam o pool, então
+    # bastam vagas para todas as simulações aceitas e mais algumas para
+    # responder 503 rápido quando a fila enche
+    os.environ.setdefault("SIMULADOR_API_PROCESSOS", str(os.cpu_count() or 1))
+    pool = pool_simulacao()
+    if threads is None:
+        threads = pool.processos + pool.max_fila + 4 if pool is not None else 2 * (os.cpu_count() or 1) + 4
+    try:
+        from waitress import serve
+    except ImportError:
+        from werkzeug.serving import make_server
+        print(f"waitress não instalado; usando o servidor multi-thread do werkzeug em {host}:{porta}")
+        make_server(host, porta, app, threaded=True).serve_forever()
+        return
+    serve(app, host=host, port=porta, threads=threads)
+
+
 if __name__ == '__main__':
-    app.run(
-        host='0.0.0.0',
-        port=8080,
-        debug=True
-    )
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sobe a API do simulador.")
+    parser.add_argument("--producao", action="store_true",
+                        help="sem debug, simulações num pool de processos com fila limitada")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--threads", type=int, default=None, help="threads do servidor WSGI em --producao")
+    args = parser.parse_args()
+
+    if args.producao:
+        servir(args.host, args.porta, args.threads)
+    else:
+        app.run(
+            host=args.host,
+            port=args.porta,
+            debug=True
+        )
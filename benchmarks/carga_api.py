@@ -0,0 +1,107 @@
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from benchmarks.suite import _percentil
+
+ESPERA_OCUPADO = 0.05
+
+
+def _porta_livre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _aguardar(porta: int, limite: float = 30.0):
+    inicio = time.monotonic()
+    while time.monotonic() - inicio < limite:
+        try:
+            conexao = http.client.HTTPConnection("127.0.0.1", porta, timeout=5)
+            conexao.request("GET", "/metrics")
+            conexao.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"servidor não respondeu na porta {porta}")
+
+
+def medir(processos: int, caminho: str, concorrencia: int, duracao: float) -> Dict[str, object]:
+    # Servidor de produção em outro processo (python app.py --producao), como
+    # seria implantado; processos=0 desliga o pool e simula na thread da
+    # requisição, para comparação
+    porta = _porta_livre()
+    ambiente = dict(os.environ, SIMULADOR_API_PROCESSOS=str(processos) if processos else "")
+    servidor = subprocess.Popen([sys.executable, "app.py", "--producao", "--host", "127.0.0.1",
+                                 "--porta", str(porta)], env=ambiente,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _aguardar(porta)
+        fim = time.perf_counter() + duracao
+        latencias: List[float] = []
+        status: Dict[int, int] = {}
+
+        def cliente():
+            conexao = http.client.HTTPConnection("127.0.0.1", porta, timeout=120)
+            while time.perf_counter() < fim:
+                inicio = time.perf_counter()
+                conexao.request("GET", caminho)
+                resposta = conexao.getresponse()
+                resposta.read()
+                codigo = resposta.status
+                status[codigo] = status.get(codigo, 0) + 1
+                if codigo == 200:
+                    latencias.append(time.perf_counter() - inicio)
+                elif codigo == 503:
+                    # Cliente educado: recua em vez de martelar o servidor ocupado
+                    time.sleep(ESPERA_OCUPADO)
+            conexao.close()
+
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+            for futuro in [executor.submit(cliente) for _ in range(concorrencia)]:
+                futuro.result()
+        decorrido = time.perf_counter() - inicio
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+    return {
+        "processos": processos,
+        "concorrencia": concorrencia,
+        "vazao": len(latencias) / decorrido,
+        "p50_ms": _percentil(latencias, 50) * 1e3 if latencias else None,
+        "p99_ms": _percentil(latencias, 99) * 1e3 if latencias else None,
+        "status": status,
+    }
+
+
+def main(argv=None):
+    nucleos = os.cpu_count() or 1
+    padrao = sorted({0, 1, *[2 ** k for k in range(1, nucleos.bit_length()) if 2 ** k <= nucleos], nucleos})
+    parser = argparse.ArgumentParser(description="Teste de carga local do modo de produção da API.")
+    parser.add_argument("--processos", type=int, nargs="+", default=padrao,
+                        help="tamanhos de pool a medir (0 = sem pool)")
+    parser.add_argument("--caminho", default="/jogo/simular/lote?n=50")
+    parser.add_argument("--concorrencia", type=int, default=None, help="clientes simultâneos (padrão: 2x núcleos)")
+    parser.add_argument("--duracao", type=float, default=10.0, help="segundos por tamanho de pool")
+    args = parser.parse_args(argv)
+
+    concorrencia = args.concorrencia or 2 * nucleos
+    print(f"{args.caminho}, {concorrencia} clientes, {args.duracao:g}s por medida, {nucleos} núcleos")
+    print(f"{'processos':>9} {'req/s':>9} {'p50':>9} {'p99':>9}  status")
+    for processos in args.processos:
+        r = medir(processos, args.caminho, concorrencia, args.duracao)
+        p50 = f"{r['p50_ms']:.0f}ms" if r["p50_ms"] is not None else "-"
+        p99 = f"{r['p99_ms']:.0f}ms" if r["p99_ms"] is not None else "-"
+        print(f"{processos if processos else 'sem pool':>9} {r['vazao']:>9.1f} {p50:>9} {p99:>9}  {r['status']}")
+
+
+if __name__ == "__main__":
+    main()
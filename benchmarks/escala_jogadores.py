@@ -0,0 +1,52 @@
+import argparse
+import time
+from typing import Dict, List
+
+from src.controller import executar
+from src.core import Jogo, Jogador
+from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
+
+ESTRATEGIAS = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+
+
+def custo_por_turno(qtd_jogadores: int, qtd_casas: int = 20, min_turnos: int = 50_000) -> Dict[str, float]:
+    # Executa partidas completas até somar min_turnos jogadas e divide o tempo
+    # total (inclui compras, aluguéis e eliminações) pelo número de jogadas
+    turnos = 0
+    jogos = 0
+    duracao = 0.0
+    seed = 0
+    while turnos < min_turnos:
+        jogadores = [Jogador(ESTRATEGIAS[i % len(ESTRATEGIAS)]) for i in range(qtd_jogadores)]
+        jogo = Jogo(jogadores, qtd_casas, seed=seed)
+        inicio = time.perf_counter()
+        executar(jogo)
+        duracao += time.perf_counter() - inicio
+        turnos += jogo.rodada
+        jogos += 1
+        seed += 1
+    return {
+        "jogadores": qtd_jogadores,
+        "jogos": jogos,
+        "turnos": turnos,
+        "ns_por_turno": duracao / turnos * 1e9,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o custo por turno conforme o número de jogadores cresce.")
+    parser.add_argument("--jogadores", type=int, nargs="+", default=[4, 16, 64, 256, 1000])
+    parser.add_argument("--qtd-casas", type=int, default=20)
+    parser.add_argument("--min-turnos", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    linhas: List[Dict[str, float]] = [
+        custo_por_turno(n, args.qtd_casas, args.min_turnos) for n in args.jogadores
+    ]
+    print(f"{'jogadores':>10} {'jogos':>8} {'turnos':>10} {'ns/turno':>10}")
+    for linha in linhas:
+        print(f"{linha['jogadores']:>10} {linha['jogos']:>8} {linha['turnos']:>10} {linha['ns_por_turno']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Dict, List
+
+from src.controller import executar
+from src.core import Jogo, Jogador
+from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
+
+ESTRATEGIAS = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+
+
+def _novos_jogadores(qtd: int) -> List[Jogador]:
+    return [Jogador(ESTRATEGIAS[i % len(ESTRATEGIAS)]) for i in range(qtd)]
+
+
+def memoria_finalizada(qtd_casas: int, qtd_jogadores: int, compacto: bool) -> int:
+    # Bytes alocados por uma partida finalizada (tabuleiro + jogadores)
+    jogadores = _novos_jogadores(qtd_jogadores)
+    gc.collect()
+    tracemalloc.start()
+    jogo = executar(Jogo(jogadores, qtd_casas, seed=0, compacto=compacto))
+    gc.collect()
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del jogo
+    return memoria
+
+
+def medir(qtd_casas: int, qtd_jogadores: int, compacto: bool, jogos: int = 3) -> Dict[str, object]:
+    # Tempo de montagem e custo por turno, em média sobre `jogos` partidas;
+    # a memória vem de uma execução à parte, porque tracemalloc distorce os tempos
+    montagem = duracao = 0.0
+    turnos = 0
+    for seed in range(jogos):
+        jogadores = _novos_jogadores(qtd_jogadores)
+        inicio = time.perf_counter()
+        jogo = Jogo(jogadores, qtd_casas, seed=seed, compacto=compacto)
+        montagem += time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        executar(jogo)
+        duracao += time.perf_counter() - inicio
+        turnos += jogo.rodada
+    return {
+        "casas": qtd_casas,
+        "jogadores": qtd_jogadores,
+        "compacto": compacto,
+        "bytes_por_jogo": memoria_finalizada(qtd_casas, qtd_jogadores, compacto),
+        "ms_montagem": montagem / jogos * 1e3,
+        "ns_por_turno": duracao / turnos * 1e9,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara Tabuleiro e TabuleiroCompacto conforme o tabuleiro cresce.")
+    parser.add_argument("--qtd-casas", type=int, nargs="+", default=[20, 1000, 100_000, 1_000_000])
+    parser.add_argument("--jogadores", type=int, nargs="+", default=[4, 1000])
+    parser.add_argument("--jogos", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    linhas: List[Dict[str, object]] = [
+        medir(casas, jogadores, compacto, args.jogos)
+        for casas in args.qtd_casas for jogadores in args.jogadores for compacto in (False, True)
+    ]
+    print(f"{'casas':>10} {'jogadores':>10} {'tabuleiro':>10} {'bytes/jogo':>14} {'montagem':>11} {'ns/turno':>10}")
+    for linha in linhas:
+        tipo = "compacto" if linha["compacto"] else "objetos"
+        print(f"{linha['casas']:>10} {linha['jogadores']:>10} {tipo:>10} {linha['bytes_por_jogo']:>14,.0f} "
+              f"{linha['ms_montagem']:>9.2f}ms {linha['ns_por_turno']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
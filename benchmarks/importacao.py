@@ -0,0 +1,65 @@
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Caminho sem terminal nem janela: o que workers do pool, a API e os CLIs de
+# lote importam. Nenhum deles deve carregar rich ou tkinter
+MODULOS_HEADLESS = ["src.core", "src.controller", "src.runner"]
+APRESENTACAO = ("rich", "tkinter")
+
+
+def _importtime(modulo: str) -> float:
+    # Tempo cumulativo do próprio módulo segundo -X importtime, em ms: mede só
+    # o import, sem a partida do interpretador
+    saida = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                           capture_output=True, text=True, check=True).stderr
+    for linha in reversed(saida.splitlines()):
+        campos = [c.strip() for c in linha.split("|")]
+        if len(campos) == 3 and campos[2] == modulo:
+            return int(campos[1]) / 1000
+    raise RuntimeError(f"{modulo} não aparece na saída de -X importtime")
+
+
+def _carregados(modulo: str) -> List[str]:
+    codigo = (f"import sys, {modulo}; "
+              f"print(','.join(m for m in {APRESENTACAO!r} if m in sys.modules))")
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout
+    return [m for m in saida.strip().split(",") if m]
+
+
+def tempo_importacao(modulo: str, repeticoes: int = 10) -> Dict[str, object]:
+    # Cada amostra é um interpretador novo, como um worker recém-criado
+    amostras = [_importtime(modulo) for _ in range(repeticoes)]
+    return {
+        "modulo": modulo,
+        "mediana_ms": statistics.median(amostras),
+        "min_ms": min(amostras),
+        "apresentacao_carregada": _carregados(modulo),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de import do caminho sem interface.")
+    parser.add_argument("modulos", nargs="*", default=MODULOS_HEADLESS)
+    parser.add_argument("--repeticoes", type=int, default=10)
+    parser.add_argument("--limite-ms", type=float, default=None,
+                        help="falha (código 1) se a mediana de algum módulo passar deste valor")
+    args = parser.parse_args(argv)
+
+    falhou = False
+    print(f"{'módulo':<20} {'mediana':>10} {'mínimo':>10}  apresentação carregada")
+    for modulo in args.modulos:
+        medida = tempo_importacao(modulo, args.repeticoes)
+        carregada = ", ".join(medida["apresentacao_carregada"]) or "-"
+        print(f"{modulo:<20} {medida['mediana_ms']:>8.1f}ms {medida['min_ms']:>8.1f}ms  {carregada}")
+        if medida["apresentacao_carregada"]:
+            falhou = True
+        if args.limite_ms is not None and medida["mediana_ms"] > args.limite_ms:
+            falhou = True
+    sys.exit(1 if falhou else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import gc
+import tracemalloc
+
+from src.controller import executar
+from src.core import Jogo, Jogador
+from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
+
+ESTRATEGIAS = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+
+
+def bytes_por_jogo(qtd_jogos: int = 2000, qtd_casas: int = 20, qtd_jogadores: int = 4,
+                   finalizados: bool = False) -> float:
+    # Mantém qtd_jogos partidas vivas ao mesmo tempo e mede o total alocado
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+
+    jogos = []
+    for i in range(qtd_jogos):
+        jogadores = [Jogador(ESTRATEGIAS[k % len(ESTRATEGIAS)]) for k in range(qtd_jogadores)]
+        jogo = Jogo(jogadores, qtd_casas, seed=i)
+        if finalizados:
+            executar(jogo)
+        jogos.append(jogo)
+
+    gc.collect()
+    fim = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (fim - inicio) / qtd_jogos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede a memória ocupada por partida mantida em memória.")
+    parser.add_argument("--jogos", type=int, default=2000)
+    parser.add_argument("--qtd-casas", type=int, default=20)
+    parser.add_argument("--jogadores", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    novo = bytes_por_jogo(args.jogos, args.qtd_casas, args.jogadores)
+    finalizado = bytes_por_jogo(args.jogos, args.qtd_casas, args.jogadores, finalizados=True)
+    print(f"bytes por partida nova:       {novo:,.0f}")
+    print(f"bytes por partida finalizada: {finalizado:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
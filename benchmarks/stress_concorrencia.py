@@ -0,0 +1,110 @@
+import argparse
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from src.controller import executar
+from src.core import Jogo, Jogador
+from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
+
+ESTRATEGIAS = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+
+
+def novo_jogo(indice: int) -> Jogo:
+    # Tamanhos de tabuleiro e quantidades de jogadores diferentes por partida:
+    # qualquer vazamento de estado entre jogos aparece como posição fora do
+    # tabuleiro ou dono que não pertence à partida
+    qtd_casas = 5 + indice % 40
+    qtd_jogadores = 2 + indice % 7
+    jogadores = [Jogador(ESTRATEGIAS[i % len(ESTRATEGIAS)]) for i in range(qtd_jogadores)]
+    return Jogo(jogadores, qtd_casas)
+
+
+def verificar(jogo: Jogo, qtd_casas: int) -> List[str]:
+    erros = []
+    iniciais = set(jogo.jogadores_iniciais)
+
+    if len(jogo.tabuleiro) != qtd_casas:
+        erros.append(f"tabuleiro com {len(jogo.tabuleiro)} casas, esperado {qtd_casas}")
+    for jogador in jogo.jogadores_iniciais:
+        if not 0 <= jogador.posicao < qtd_casas:
+            erros.append(f"jogador #{jogador.id} na posição {jogador.posicao}")
+    for prop in jogo.tabuleiro:
+        if prop.proprietario is None:
+            continue
+        if prop.proprietario not in iniciais:
+            erros.append(f"propriedade #{prop.id} pertence a jogador de outra partida")
+        elif prop not in prop.proprietario.propriedades:
+            erros.append(f"propriedade #{prop.id} ausente da lista do dono")
+    for jogador in jogo.jogadores_iniciais:
+        if not jogo.esta_vivo(jogador) and jogador.propriedades:
+            erros.append(f"jogador #{jogador.id} eliminado ainda possui propriedades")
+    for jogador in jogo.jogadores:
+        for prop in jogador.propriedades:
+            if prop.proprietario is not jogador:
+                erros.append(f"jogador #{jogador.id} lista propriedade #{prop.id} que não é dele")
+
+    if not jogo.finished:
+        erros.append("partida não finalizada")
+    if jogo.vencedor not in iniciais:
+        erros.append("vencedor não pertence à partida")
+    if jogo.termino_por_tempo != (jogo.rodada >= jogo.max_rodadas and len(jogo.jogadores) > 1):
+        erros.append("termino_por_tempo inconsistente")
+    if jogo.rodada > jogo.max_rodadas:
+        erros.append(f"rodada {jogo.rodada} acima do limite")
+    return erros
+
+
+def _executar_e_verificar(indice: int) -> List[str]:
+    jogo = novo_jogo(indice)
+    executar(jogo)
+    return verificar(jogo, 5 + indice % 40)
+
+
+def stress_threads(qtd_jogos: int, threads: int) -> List[str]:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return [erro for erros in executor.map(_executar_e_verificar, range(qtd_jogos)) for erro in erros]
+
+
+async def _executar_async(indice: int) -> List[str]:
+    jogo = novo_jogo(indice)
+    # Cede o loop a cada jogada para intercalar todas as partidas
+    while not jogo.finished:
+        for jogador in list(jogo.jogadores):
+            if jogo.finished:
+                break
+            jogo.jogada(jogador, jogo.jogar_dado())
+            if not jogo.finished and jogo.esta_vivo(jogador):
+                jogo.comprar_propiedade(jogador)
+            await asyncio.sleep(0)
+    return verificar(jogo, 5 + indice % 40)
+
+
+async def stress_async(qtd_jogos: int) -> List[str]:
+    resultados = await asyncio.gather(*(_executar_async(i) for i in range(qtd_jogos)))
+    return [erro for erros in resultados for erro in erros]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa centenas de partidas concorrentes e valida cada uma.")
+    parser.add_argument("--jogos", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    # Troca de thread bem mais frequente que o padrão para forçar intercalação
+    sys.setswitchinterval(1e-6)
+
+    erros = stress_threads(args.jogos, args.threads)
+    erros += asyncio.run(stress_async(args.jogos))
+
+    if erros:
+        for erro in erros[:20]:
+            print(f"ERRO: {erro}")
+        print(f"{len(erros)} inconsistência(s) em {2 * args.jogos} partidas")
+        sys.exit(1)
+    print(f"OK: {2 * args.jogos} partidas concorrentes consistentes")
+
+
+if __name__ == "__main__":
+    main()
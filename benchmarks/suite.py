@@ -0,0 +1,268 @@
+import argparse
+import datetime
+import http.client
+import json
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from benchmarks.importacao import MODULOS_HEADLESS, tempo_importacao
+from benchmarks.memoria_jogo import bytes_por_jogo
+from src.controller import simulador
+from src.core import Jogo, Jogador
+from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
+
+ESTRATEGIAS = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+
+FORMATO = 1
+
+
+def _medida(nome: str, valor: float, unidade: str, maior_e_melhor: bool, **extra) -> Dict[str, object]:
+    return {"nome": nome, "valor": valor, "unidade": unidade, "maior_e_melhor": maior_e_melhor, **extra}
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    indice = max(0, min(len(ordenados) - 1, int(round(p / 100 * len(ordenados) + 0.5)) - 1))
+    return ordenados[indice]
+
+
+def medir_simulador(qtd_casas: int, jogadores: int, duracao_minima: float) -> Dict[str, object]:
+    # Seeds fixas e sequenciais: duas execuções medem exatamente as mesmas partidas
+    jogos = 0
+    inicio = time.perf_counter()
+    while True:
+        simulador(qtd_casas, jogadores, seed=jogos)
+        jogos += 1
+        decorrido = time.perf_counter() - inicio
+        if decorrido >= duracao_minima:
+            break
+    return _medida(f"simulador/casas={qtd_casas}/jogadores={jogadores}", jogos / decorrido,
+                   "jogos/s", True, jogos=jogos)
+
+
+def _custo_relogio(amostras: int = 100_000) -> float:
+    relogio = time.perf_counter_ns
+    inicio = relogio()
+    for _ in range(amostras):
+        relogio()
+    return (relogio() - inicio) / amostras
+
+
+def medir_operacoes(qtd_casas: int, jogadores: int, min_turnos: int) -> List[Dict[str, object]]:
+    # Mesmo laço de controller.executar, cronometrando cada chamada; o custo
+    # da leitura do relógio é descontado de cada amostra
+    relogio = time.perf_counter_ns
+    custo = _custo_relogio()
+    tempo_jogada = tempo_compra = 0
+    jogadas = compras = 0
+    seed = 0
+    while jogadas < min_turnos:
+        jogo = Jogo([Jogador(ESTRATEGIAS[i % len(ESTRATEGIAS)]) for i in range(jogadores)], qtd_casas, seed=seed)
+        seed += 1
+        while not jogo.finished:
+            for jogador in list(jogo.jogadores):
+                if jogo.finished:
+                    break
+                dado = jogo.jogar_dado()
+                inicio = relogio()
+                jogo.jogada(jogador, dado)
+                tempo_jogada += relogio() - inicio
+                jogadas += 1
+                if not jogo.finished and jogo.esta_vivo(jogador):
+                    inicio = relogio()
+                    jogo.comprar_propiedade(jogador)
+                    tempo_compra += relogio() - inicio
+                    compras += 1
+
+    sufixo = f"casas={qtd_casas}/jogadores={jogadores}"
+    return [
+        _medida(f"jogada/{sufixo}", max(0.0, tempo_jogada / jogadas - custo), "ns/chamada", False, chamadas=jogadas),
+        _medida(f"comprar_propiedade/{sufixo}", max(0.0, tempo_compra / compras - custo), "ns/chamada", False,
+                chamadas=compras),
+    ]
+
+
+def medir_memoria(qtd_casas: int, jogadores: int, jogos: int) -> List[Dict[str, object]]:
+    sufixo = f"casas={qtd_casas}/jogadores={jogadores}"
+    return [
+        _medida(f"memoria/nova/{sufixo}", bytes_por_jogo(jogos, qtd_casas, jogadores), "bytes/jogo", False),
+        _medida(f"memoria/finalizada/{sufixo}", bytes_por_jogo(jogos, qtd_casas, jogadores, finalizados=True),
+                "bytes/jogo", False),
+    ]
+
+
+def medir_lider(jogadores: int, consultas: int) -> Dict[str, object]:
+    # Uma mudança de saldo e uma consulta ao líder por vez, como um
+    # observador que acompanha a partida jogada a jogada
+    jogo = Jogo([Jogador(ESTRATEGIAS[i % len(ESTRATEGIAS)]) for i in range(jogadores)], seed=0)
+    vivos = jogo.jogadores
+    rng = random.Random(0)
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        rng.choice(vivos).alterar_saldo(rng.randint(-50, 50))
+        jogo.lider()
+    decorrido = time.perf_counter() - inicio
+    return _medida(f"lider/jogadores={jogadores}", consultas / decorrido, "consultas/s", True)
+
+
+def medir_importacao(repeticoes: int) -> List[Dict[str, object]]:
+    medidas = []
+    for modulo in MODULOS_HEADLESS:
+        medida = tempo_importacao(modulo, repeticoes)
+        medidas.append(_medida(f"importacao/{modulo}", medida["mediana_ms"], "ms", False,
+                               apresentacao_carregada=medida["apresentacao_carregada"]))
+    return medidas
+
+
+def medir_api(caminhos: List[str], requisicoes: int, concorrencia: int) -> List[Dict[str, object]]:
+    # Servidor werkzeug real numa thread e clientes HTTP em outras: mede o
+    # caminho completo (socket, roteamento, simulação e serialização JSON)
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    from app import app
+
+    class SemLog(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    servidor = make_server("127.0.0.1", 0, app, threaded=True, request_handler=SemLog)
+    porta = servidor.server_port
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+
+    def requisitar(caminho: str) -> float:
+        conexao = http.client.HTTPConnection("127.0.0.1", porta, timeout=60)
+        inicio = time.perf_counter()
+        conexao.request("GET", caminho)
+        resposta = conexao.getresponse()
+        resposta.read()
+        duracao = time.perf_counter() - inicio
+        conexao.close()
+        if resposta.status != 200:
+            raise RuntimeError(f"{caminho} respondeu {resposta.status}")
+        return duracao
+
+    medidas = []
+    try:
+        for caminho in caminhos:
+            requisitar(caminho)
+            with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+                inicio = time.perf_counter()
+                latencias = list(executor.map(requisitar, [caminho] * requisicoes))
+                decorrido = time.perf_counter() - inicio
+            for p in (50, 90, 99):
+                medidas.append(_medida(f"api{caminho}/p{p}", _percentil(latencias, p) * 1e3, "ms", False,
+                                       concorrencia=concorrencia))
+            medidas.append(_medida(f"api{caminho}/vazao", requisicoes / decorrido, "req/s", True,
+                                   concorrencia=concorrencia))
+    finally:
+        servidor.shutdown()
+    return medidas
+
+
+def _commit_atual() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar_suite(args: argparse.Namespace) -> Dict[str, object]:
+    medidas: List[Dict[str, object]] = []
+    for qtd_casas in args.qtd_casas:
+        for jogadores in args.jogadores:
+            medidas.append(medir_simulador(qtd_casas, jogadores, args.duracao))
+    medidas.extend(medir_operacoes(20, 4, args.min_turnos))
+    medidas.extend(medir_memoria(20, 4, args.jogos_memoria))
+    medidas.append(medir_lider(args.jogadores_lider, args.consultas_lider))
+    medidas.extend(medir_importacao(args.repeticoes_importacao))
+    if not args.sem_api:
+        caminhos = ["/jogo/simular", f"/jogo/simular/lote?n={args.lote}"]
+        medidas.extend(medir_api(caminhos, args.requisicoes, args.concorrencia))
+
+    return {
+        "formato": FORMATO,
+        "commit": _commit_atual(),
+        "data": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "medidas": medidas,
+    }
+
+
+def comparar(base: Dict[str, object], atual: Dict[str, object], tolerancia: float) -> List[Dict[str, object]]:
+    # Variação relativa por medida; positiva é sempre melhora, independente
+    # de a métrica ser vazão (maior é melhor) ou latência (menor é melhor)
+    anteriores = {m["nome"]: m for m in base["medidas"]}
+    linhas = []
+    for medida in atual["medidas"]:
+        anterior = anteriores.get(medida["nome"])
+        if anterior is None or not anterior["valor"]:
+            continue
+        razao = medida["valor"] / anterior["valor"]
+        melhora = razao - 1 if medida["maior_e_melhor"] else 1 / razao - 1 if razao else 0.0
+        linhas.append({
+            "nome": medida["nome"],
+            "unidade": medida["unidade"],
+            "antes": anterior["valor"],
+            "depois": medida["valor"],
+            "melhora": melhora,
+            "regressao": melhora < -tolerancia,
+        })
+    return linhas
+
+
+def _imprimir_comparacao(linhas: List[Dict[str, object]], base: Dict[str, object], atual: Dict[str, object]):
+    print(f"base {base.get('commit')} -> atual {atual.get('commit')}")
+    largura = max((len(linha["nome"]) for linha in linhas), default=10)
+    for linha in linhas:
+        marca = "  REGRESSÃO" if linha["regressao"] else ""
+        print(f"{linha['nome']:<{largura}} {linha['antes']:>14,.1f} {linha['depois']:>14,.1f} "
+              f"{linha['unidade']:<11} {linha['melhora']:>+8.1%}{marca}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o núcleo da simulação e a API e grava o resultado em JSON.")
+    parser.add_argument("--saida", default=None, help="arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--comparar", default=None, help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerancia", type=float, default=0.10,
+                        help="piora relativa aceita antes de marcar regressão (padrão 0.10)")
+    parser.add_argument("--qtd-casas", type=int, nargs="+", default=[20, 40, 100])
+    parser.add_argument("--jogadores", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--duracao", type=float, default=1.0, help="segundos por configuração do simulador")
+    parser.add_argument("--min-turnos", type=int, default=100_000)
+    parser.add_argument("--jogos-memoria", type=int, default=1000)
+    parser.add_argument("--jogadores-lider", type=int, default=10_000)
+    parser.add_argument("--consultas-lider", type=int, default=10_000)
+    parser.add_argument("--repeticoes-importacao", type=int, default=10)
+    parser.add_argument("--sem-api", action="store_true")
+    parser.add_argument("--requisicoes", type=int, default=500)
+    parser.add_argument("--concorrencia", type=int, default=8)
+    parser.add_argument("--lote", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    resultado = executar_suite(args)
+    texto = json.dumps(resultado, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto + "\n")
+    elif not args.comparar:
+        print(texto)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        linhas = comparar(base, resultado, args.tolerancia)
+        _imprimir_comparacao(linhas, base, resultado)
+        if any(linha["regressao"] for linha in linhas):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import argparse
+import time
+from typing import Dict
+
+from src.controller import simulador
+from src.vetorizado import simular_vetorizado
+
+
+def medir(qtd_casas: int = 20, jogadores: int = 4, jogos_vetorizado: int = 200_000,
+          jogos_objetos: int = 4000, repeticoes: int = 3) -> Dict[str, float]:
+    # Os dois motores são medidos alternadamente e fica a melhor repetição de
+    # cada um: a razão não depende de a máquina estar mais lenta num trecho
+    melhor_vetorizado = melhor_objetos = 0.0
+    for repeticao in range(repeticoes):
+        inicio = time.perf_counter()
+        simular_vetorizado(jogos_vetorizado, qtd_casas, jogadores, seed=repeticao)
+        melhor_vetorizado = max(melhor_vetorizado, jogos_vetorizado / (time.perf_counter() - inicio))
+
+        inicio = time.perf_counter()
+        for i in range(jogos_objetos):
+            simulador(qtd_casas, jogadores, seed=repeticao * jogos_objetos + i)
+        melhor_objetos = max(melhor_objetos, jogos_objetos / (time.perf_counter() - inicio))
+    return {
+        "vetorizado_jogos_por_segundo": melhor_vetorizado,
+        "objetos_jogos_por_segundo": melhor_objetos,
+        "aceleracao": melhor_vetorizado / melhor_objetos,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara o motor vetorizado com simulador() na mesma configuração.")
+    parser.add_argument("--qtd-casas", type=int, default=20)
+    parser.add_argument("--jogadores", type=int, default=4)
+    parser.add_argument("--jogos-vetorizado", type=int, default=200_000)
+    parser.add_argument("--jogos-objetos", type=int, default=4000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    resultado = medir(args.qtd_casas, args.jogadores, args.jogos_vetorizado, args.jogos_objetos, args.repeticoes)
+    print(f"vetorizado: {resultado['vetorizado_jogos_por_segundo']:,.0f} jogos/s")
+    print(f"objetos:    {resultado['objetos_jogos_por_segundo']:,.0f} jogos/s")
+    print(f"aceleração: {resultado['aceleracao']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
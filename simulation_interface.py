@@ -1,29 +1,52 @@
+import argparse
+import math
+import time
 import tkinter as tk
-from src.core import Jogo, Tabuleiro, Jogador
+from typing import Optional
+from src.core import Jogo, Jogador
 from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
+from src.registro import ArquivoPartidas, EstadoReplay
+from src.reproducao import ReproducaoAoVivo, ReproducaoGravada
 import random
 
 
-PLAYER_COLORS = ["#e74c3c", "#3498db", "#2ecc71", "#f39c12"]
+PLAYER_COLORS = ["#e74c3c", "#3498db", "#2ecc71", "#f39c12", "#9b59b6", "#1abc9c", "#e67e22", "#ecf0f1"]
 PLAYER_NAME_BY_STRATEGY = {
     "impulsivo": "Impulsivo",
     "exigente": "Exigente",
     "cauteloso": "Cauteloso",
     "aleatorio": "Aleatório",
 }
+# Multiplicadores sobre 1 turno por segundo
+VELOCIDADES = ["1x", "2x", "5x", "10x", "100x", "1000x", "10000x"]
+# Intervalo mínimo entre quadros: acima de ~30 turnos/s os turnos são
+# avançados em bloco e só o estado final de cada quadro é desenhado
+INTERVALO_QUADRO_MS = 33
+# Até este número de casas o tabuleiro é um anel; acima, uma grade
+MAX_CASAS_ANEL = 80
+# Acima disto a grade é uma imagem em vez de um retângulo do canvas por casa
+MAX_CASAS_RETANGULOS = 4096
+# Donos comparados em fatias (em C); só fatias com mudança são percorridas
+FATIA_DIFERENCA = 1024
+MAX_LINHAS_JOGADORES = 12
+TILE_SIZE_MAX = 84
+TILE_EMPTY = "#3b3b3b"
+
 
 class TabuleiroGUI(tk.Tk):
-    def __init__(self, jogo: 'Jogo'):
+    def __init__(self, jogo: Optional['Jogo'] = None, replay=None):
         super().__init__()
         self.title("Banco Imobiliário (Simplificado)")
         self.configure(bg="#0f0f0f")
         self.geometry("1100x760")
         self.resizable(False, False)
 
-        self.jogo = jogo
-        self.ordem_turnos = list(getattr(self.jogo, "ordem_turnos", self.jogo.jogadores))
-        self.turn_index = 0
-        self.last_dice = 0
+        self.fonte = ReproducaoGravada(replay) if replay is not None else ReproducaoAoVivo(jogo)
+        self.tocando = False
+        self._agendado = None
+        self._ultimo_tick = 0.0
+        self._credito = 0.0
+        self._renderizado: Optional[EstadoReplay] = None
 
         # Layout principal
         self.left_wrap = tk.Frame(self, bg="#0f0f0f", highlightthickness=0, bd=0)
@@ -37,10 +60,12 @@ class TabuleiroGUI(tk.Tk):
 
         self._build_sidebar()
 
-        self.tile_size = 84
-        self.tile_positions = []   
+        self.tile_size = TILE_SIZE_MAX
+        self.tile_positions = []
+        self.colunas_grade = 0
+        self.imagem_tabuleiro: Optional[tk.PhotoImage] = None
         self.board_left_top = (0, 0)
-        self.board_size = self.tile_size * 6 
+        self.board_size = self.tile_size * 6
         self.center_title_id = None
 
         self.tile_rects = []
@@ -50,19 +75,17 @@ class TabuleiroGUI(tk.Tk):
 
         # Monta layout centrado
         self.update_idletasks()
-        self._layout_board()
-        self._draw_board()
-        self._init_tokens()
-        self._refresh_sidebar()
-        self._refresh_ownership_colors()
-
-        # Inicia animação com delay de 1s
-        self.after(1000, self._step)
+        self._montar()
+        self._play()
 
     def _build_sidebar(self):
         def sep(parent):
             return tk.Frame(parent, height=1, bg="#303030", highlightthickness=0, bd=0)
 
+        def botao(parent, texto, comando):
+            return tk.Button(parent, text=texto, command=comando, bg="#2c2c2c", fg="#ffffff",
+                             activebackground="#3a3a3a", relief="flat")
+
         title = tk.Label(self.sidebar, text="Estado do Jogo", fg="#ffffff", bg="#181818",
                          font=("Segoe UI", 16, "bold"))
         title.pack(pady=(18, 8), anchor="w", padx=16)
@@ -73,6 +96,25 @@ class TabuleiroGUI(tk.Tk):
         self.lbl_dado = tk.Label(self.sidebar, text="Último dado: -", fg="#cfcfcf", bg="#181818", font=("Segoe UI", 12))
         self.lbl_dado.pack(anchor="w", padx=16, pady=(0, 10))
 
+        controles = tk.Frame(self.sidebar, bg="#181818")
+        controles.pack(fill="x", padx=16, pady=(0, 4))
+        self.btn_play = botao(controles, "Pausar", self._alternar_play)
+        self.btn_play.pack(side="left", fill="x", expand=True)
+        botao(controles, "Passo", self._passo).pack(side="left", padx=(6, 0))
+        self.var_velocidade = tk.StringVar(value=VELOCIDADES[0])
+        menu = tk.OptionMenu(controles, self.var_velocidade, *VELOCIDADES)
+        menu.configure(bg="#2c2c2c", fg="#ffffff", activebackground="#3a3a3a", relief="flat", highlightthickness=0)
+        menu.pack(side="left", padx=(6, 0))
+
+        salto = tk.Frame(self.sidebar, bg="#181818")
+        salto.pack(fill="x", padx=16, pady=(4, 4))
+        tk.Label(salto, text="Ir para rodada", fg="#cfcfcf", bg="#181818", font=("Segoe UI", 10)).pack(side="left")
+        self.entry_turno = tk.Entry(salto, width=8, bg="#2c2c2c", fg="#ffffff", insertbackground="#ffffff",
+                                    relief="flat")
+        self.entry_turno.pack(side="left", padx=6)
+        self.entry_turno.bind("<Return>", lambda _: self._ir_para())
+        botao(salto, "Ir", self._ir_para).pack(side="left")
+
         sep(self.sidebar).pack(fill="x", padx=12, pady=8)
 
         lbl_jogs = tk.Label(self.sidebar, text="Jogadores", fg="#ffffff", bg="#181818",
@@ -94,113 +136,179 @@ class TabuleiroGUI(tk.Tk):
                                      font=("Segoe UI", 12, "bold"), wraplength=250, justify="left")
         self.lbl_vencedor.pack(anchor="w", padx=16, pady=(6, 10))
 
-        self.btn_reiniciar = tk.Button(self.sidebar, text="Reiniciar", command=self._reiniciar,
-                                       bg="#2c2c2c", fg="#ffffff", activebackground="#3a3a3a",
-                                       relief="flat")
+        self.btn_reiniciar = botao(self.sidebar, "Reiniciar", self._reiniciar)
         self.btn_reiniciar.pack(padx=16, pady=(6, 12), fill="x")
 
+    def _montar(self):
+        self._renderizado = None
+        self.lbl_vencedor.config(text="")
+        self._layout_board()
+        self._draw_board()
+        self._init_tokens()
+        self._renderizar()
+
     def _layout_board(self):
         cw = int(self.canvas.winfo_width())
         ch = int(self.canvas.winfo_height())
-
-        left = (cw - self.board_size) // 2
-        top = (ch - self.board_size) // 2
+        n = self.fonte.qtd_casas
+        area = min(cw, ch) - 40
+        self.colunas_grade = 0
+
+        if n <= MAX_CASAS_ANEL:
+            # Anel quadrado com `lado` casas por lado: 4 * (lado - 1) >= n
+            lado = max(2, math.ceil(n / 4) + 1)
+            s = min(TILE_SIZE_MAX, area // lado)
+            self.board_size = s * lado
+            left = (cw - self.board_size) // 2
+            top = (ch - self.board_size) // 2
+            x0, y0 = left, top
+            pos = []
+            for i in range(lado):
+                pos.append((x0 + i*s, y0))
+            for i in range(1, lado - 1):
+                pos.append((x0 + (lado - 1)*s, y0 + i*s))
+            for i in range(lado - 1, -1, -1):
+                pos.append((x0 + i*s, y0 + (lado - 1)*s))
+            for i in range(lado - 2, 0, -1):
+                pos.append((x0, y0 + i*s))
+            pos = pos[:n]
+        else:
+            # Grade em serpentina: casas vizinhas continuam adjacentes. As
+            # posições saem de _posicao_casa, sem uma lista do tamanho do
+            # tabuleiro
+            colunas = math.ceil(math.sqrt(n))
+            linhas = math.ceil(n / colunas)
+            s = area / max(colunas, linhas)
+            if n > MAX_CASAS_RETANGULOS:
+                # Na imagem cada casa ocupa um quadrado de pixels inteiros
+                s = max(1, int(s))
+            self.board_size = s * max(colunas, linhas)
+            left = int(cw - s * colunas) // 2
+            top = int(ch - s * linhas) // 2
+            self.colunas_grade = colunas
+            pos = []
+
+        self.tile_size = s
         self.board_left_top = (left, top)
-
-        s = self.tile_size
-        x0, y0 = left, top
-        pos = []
-        for i in range(6):
-            pos.append((x0 + i*s, y0))
-        for i in range(1, 5):
-            pos.append((x0 + 5*s, y0 + i*s))
-        for i in range(5, -1, -1):
-            pos.append((x0 + i*s, y0 + 5*s))
-        for i in range(4, 0, -1):
-            pos.append((x0, y0 + i*s))
         self.tile_positions = pos
 
+    def _posicao_casa(self, indice: int):
+        if not self.colunas_grade:
+            return self.tile_positions[indice]
+        linha, coluna = divmod(indice, self.colunas_grade)
+        if linha % 2:
+            coluna = self.colunas_grade - 1 - coluna
+        left, top = self.board_left_top
+        return left + coluna * self.tile_size, top + linha * self.tile_size
+
     def _draw_board(self):
         self.canvas.delete("all")
         self.tile_rects.clear()
         self.tile_labels.clear()
+        self.token_items.clear()
+        self.imagem_tabuleiro = None
+
+        n = self.fonte.qtd_casas
+        if n > MAX_CASAS_RETANGULOS:
+            # Centenas de milhares de itens deixam o canvas lento para criar e
+            # redesenhar: o tabuleiro vira uma imagem pintada casa a casa
+            s = self.tile_size
+            linhas = math.ceil(n / self.colunas_grade)
+            self.imagem_tabuleiro = tk.PhotoImage(width=self.colunas_grade * s, height=linhas * s)
+            self.imagem_tabuleiro.put(TILE_EMPTY, to=(0, 0, self.colunas_grade * s, linhas * s))
+            for indice in range(n, linhas * self.colunas_grade):
+                self._pintar_casa(indice, self.canvas["bg"])
+            self.canvas.create_image(*self.board_left_top, image=self.imagem_tabuleiro, anchor="nw")
+            return
 
-        for idx, (x, y) in enumerate(self.tile_positions):
+        contorno = 2 if self.tile_size >= 12 else 0
+        for idx in range(n):
+            x, y = self._posicao_casa(idx)
             r = self.canvas.create_rectangle(
                 x, y, x + self.tile_size, y + self.tile_size,
-                fill="#3b3b3b", outline="#666666", width=2
+                fill=TILE_EMPTY, outline="#666666", width=contorno
             )
             self.tile_rects.append(r)
-            label = self.canvas.create_text(
-                x + self.tile_size/2, y + self.tile_size/2,
-                text=str(idx), fill="#d0d0d0", font=("Segoe UI", 11, "bold")
+            if self.tile_size >= 24:
+                label = self.canvas.create_text(
+                    x + self.tile_size/2, y + self.tile_size/2,
+                    text=str(idx), fill="#d0d0d0", font=("Segoe UI", 11, "bold")
+                )
+                self.tile_labels.append(label)
+
+        self.center_title_id = None
+        if not self.colunas_grade:
+            cx = self.board_left_top[0] + self.board_size/2
+            cy = self.board_left_top[1] + self.board_size/2
+            self.center_title_id = self.canvas.create_text(
+                cx, cy, text="Banco Imobiliário\n(Simplificado)",
+                fill="#f0f0f0", font=("Segoe UI", 20, "bold"), justify="center", anchor="center"
             )
-            self.tile_labels.append(label)
 
-        cx = self.board_left_top[0] + self.board_size/2
-        cy = self.board_left_top[1] + self.board_size/2
-        self.center_title_id = self.canvas.create_text(
-            cx, cy, text="Banco Imobiliário\n(Simplificado)",
-            fill="#f0f0f0", font=("Segoe UI", 20, "bold"), justify="center", anchor="center"
-        )
+    def _pintar_casa(self, indice: int, cor: str):
+        if self.imagem_tabuleiro is None:
+            self.canvas.itemconfig(self.tile_rects[indice], fill=cor)
+            return
+        x, y = self._posicao_casa(indice)
+        left, top = self.board_left_top
+        x, y = x - left, y - top
+        self.imagem_tabuleiro.put(cor, to=(x, y, x + self.tile_size, y + self.tile_size))
 
     def _init_tokens(self):
-        for data in self.token_items.values():
-            self.canvas.delete(data["oval"])
-            self.canvas.delete(data["text"])
-        self.token_items.clear()
-
         for child in self.players_frame.winfo_children():
             child.destroy()
         self.player_rows.clear()
 
-        for jogador in self._ordem_inicial():
-            color = PLAYER_COLORS[(jogador.id - 1) % len(PLAYER_COLORS)]
-            self._create_player_row(jogador, color)
-            self._create_token(jogador, color)
+        estrategias = self.fonte.estrategias
+        for assento, estrategia in enumerate(estrategias):
+            color = PLAYER_COLORS[assento % len(PLAYER_COLORS)]
+            if assento < MAX_LINHAS_JOGADORES:
+                self._create_player_row(assento, estrategia, color)
+            self._create_token(assento, color)
 
-    def _ordem_inicial(self):
-        return list(self.ordem_turnos) if self.ordem_turnos else list(self.jogo.jogadores)
+        if len(estrategias) > MAX_LINHAS_JOGADORES:
+            tk.Label(self.players_frame, text=f"+ {len(estrategias) - MAX_LINHAS_JOGADORES} jogadores",
+                     fg="#8a8a8a", bg="#181818", font=("Segoe UI", 10)).pack(anchor="w", padx=5)
 
-    def _tile_center_with_offset(self, tile_index: int, jogador: 'Jogador'):
-        x, y = self.tile_positions[tile_index]
+    def _token_radius(self) -> float:
+        return max(2, min(12, self.tile_size * 0.15))
+
+    def _tile_center_with_offset(self, tile_index: int, assento: int):
+        x, y = self._posicao_casa(tile_index)
         cx, cy = x + self.tile_size/2, y + self.tile_size/2
-        offsets = [(-16, -16), (16, -16), (-16, 16), (16, 16)]
-        dx, dy = offsets[(jogador.id - 1) % len(offsets)]
+        d = self.tile_size * 0.19
+        offsets = [(-d, -d), (d, -d), (-d, d), (d, d)]
+        dx, dy = offsets[assento % len(offsets)]
         return cx + dx, cy + dy
 
-    def _create_token(self, jogador: 'Jogador', color: str):
-        pos = getattr(jogador, "posicao", 0)
-        cx, cy = self._tile_center_with_offset(pos, jogador)
-        r = 12
-        oval = self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=color, outline="#111111", width=2)
-        text = self.canvas.create_text(cx, cy, text=str(jogador.id), fill="white", font=("Segoe UI", 10, "bold"))
-        self.token_items[jogador] = {"oval": oval, "text": text}
-
-    def _move_token_to(self, jogador: 'Jogador', new_tile_index: int):
-        if jogador not in self.token_items:
-            return
-        cx, cy = self._tile_center_with_offset(new_tile_index, jogador)
-        r = 12
-        ids = self.token_items[jogador]
+    def _create_token(self, assento: int, color: str):
+        cx, cy = self._tile_center_with_offset(0, assento)
+        r = self._token_radius()
+        oval = self.canvas.create_oval(cx - r, cy - r, cx + r, cy + r, fill=color, outline="#111111",
+                                       width=2 if r >= 8 else 0)
+        text = None
+        if r >= 8:
+            text = self.canvas.create_text(cx, cy, text=str(assento + 1), fill="white",
+                                           font=("Segoe UI", 10, "bold"))
+        self.token_items[assento] = {"oval": oval, "text": text}
+
+    def _move_token_to(self, assento: int, new_tile_index: int):
+        cx, cy = self._tile_center_with_offset(new_tile_index, assento)
+        r = self._token_radius()
+        ids = self.token_items[assento]
         self.canvas.coords(ids["oval"], cx - r, cy - r, cx + r, cy + r)
-        self.canvas.coords(ids["text"], cx, cy)
-
-    def _remove_token(self, jogador: 'Jogador'):
-        ids = self.token_items.pop(jogador, None)
-        if ids:
-            self.canvas.delete(ids["oval"])
-            self.canvas.delete(ids["text"])
-
-    def _refresh_ownership_colors(self):
-        for i, prop in enumerate(self.jogo.tabuleiro):
-            if prop.proprietario is None:
-                fill = "#3b3b3b"
-            else:
-                fill = PLAYER_COLORS[(prop.proprietario.id - 1) % len(PLAYER_COLORS)]
-            self.canvas.itemconfig(self.tile_rects[i], fill=fill)
-
-    def _create_player_row(self, jogador: 'Jogador', color: str):
+        if ids["text"] is not None:
+            self.canvas.coords(ids["text"], cx, cy)
+
+    def _show_token(self, assento: int, visivel: bool):
+        # Eliminados são escondidos, não apagados: voltar no tempo os traz de volta
+        estado = "normal" if visivel else "hidden"
+        ids = self.token_items[assento]
+        self.canvas.itemconfig(ids["oval"], state=estado)
+        if ids["text"] is not None:
+            self.canvas.itemconfig(ids["text"], state=estado)
+
+    def _create_player_row(self, assento: int, estrategia: str, color: str):
         row = tk.Frame(self.players_frame, bg="#181818")
         row.pack(fill="x", pady=4)
 
@@ -208,126 +316,173 @@ class TabuleiroGUI(tk.Tk):
         dot.pack(side="left", padx=(5, 6))
         dot.create_oval(2, 2, 12, 12, fill=color, outline=color)
 
-        est_nome = getattr(jogador.estrategia, "nome", "desconhecida")
-        legivel = PLAYER_NAME_BY_STRATEGY.get(est_nome, est_nome)
+        legivel = PLAYER_NAME_BY_STRATEGY.get(estrategia, estrategia)
 
-        lbl_name = tk.Label(row, text=f"#{jogador.id} - {legivel}", fg="#ffffff", bg="#181818",
+        lbl_name = tk.Label(row, text=f"#{assento + 1} - {legivel}", fg="#ffffff", bg="#181818",
                             font=("Segoe UI", 11, "bold"))
         lbl_name.pack(side="left")
 
-        lbl_saldo = tk.Label(row, text=f"Saldo: ${jogador.saldo}", fg="#d8d8d8", bg="#181818", font=("Segoe UI", 10))
+        lbl_saldo = tk.Label(row, text="", fg="#d8d8d8", bg="#181818", font=("Segoe UI", 10))
         lbl_saldo.pack(side="right", padx=6)
 
-        self.player_rows[jogador] = {"frame": row, "saldo": lbl_saldo}
-
-    def _refresh_sidebar(self):
-        self.lbl_rodada.config(text=f"Rodada: {getattr(self.jogo, 'rodada', 0)}")
-        self.lbl_dado.config(text=f"Último dado: {self.last_dice if self.last_dice else '-'}")
-
-        ativos = set(self.jogo.jogadores)
-        for jog, row in list(self.player_rows.items()):
-            if jog not in ativos:
-                row["frame"].destroy()
-                self._remove_token(jog)
-                del self.player_rows[jog]
-
-        for jog in self.jogo.jogadores:
-            if jog not in self.player_rows:
-                color = PLAYER_COLORS[(jog.id - 1) % len(PLAYER_COLORS)]
-                self._create_player_row(jog, color)
-                self._create_token(jog, color)
-            self.player_rows[jog]["saldo"].config(text=f"Saldo: ${jog.saldo}")
-
-    def _next_active_player(self):
-        if not self.jogo.jogadores:
-            return None
-        n = len(self.ordem_turnos)
-        tries = 0
-        while tries < n:
-            jogador = self.ordem_turnos[self.turn_index % n]
-            self.turn_index += 1
-            if jogador in self.jogo.jogadores:
-                return jogador
-            tries += 1
-        return None
-
-    def _step(self):
-        if self.jogo.finished:
-            self._on_finish()
+        self.player_rows[assento] = {"frame": row, "nome": lbl_name, "saldo": lbl_saldo}
+
+    def _renderizar(self):
+        # Desenha só o que mudou desde o último quadro
+        novo = self.fonte.estado()
+        antigo = self._renderizado
+
+        if antigo is None or novo.turno != antigo.turno:
+            self.lbl_rodada.config(text=f"Rodada: {novo.turno}")
+        if antigo is None or novo.ultimo_dado != antigo.ultimo_dado:
+            self.lbl_dado.config(text=f"Último dado: {novo.ultimo_dado if novo.ultimo_dado else '-'}")
+
+        for assento in range(len(novo.saldos)):
+            if antigo is None or novo.posicoes[assento] != antigo.posicoes[assento]:
+                self._move_token_to(assento, novo.posicoes[assento])
+            vivo = novo.vivos[assento]
+            if antigo is None or vivo != antigo.vivos[assento]:
+                self._show_token(assento, vivo)
+                row = self.player_rows.get(assento)
+                if row is not None:
+                    row["nome"].config(fg="#ffffff" if vivo else "#666666")
+            row = self.player_rows.get(assento)
+            if row is not None and (antigo is None or novo.saldos[assento] != antigo.saldos[assento]
+                                    or vivo != antigo.vivos[assento]):
+                row["saldo"].config(text=f"Saldo: ${novo.saldos[assento]}" if vivo else "Eliminado")
+
+        if antigo is not None and novo.alteradas is not None:
+            # Fonte ao vivo: ela já sabe quais casas mudaram de dono desde o
+            # último quadro (a lista de donos é a mesma entre quadros)
+            for i, dono in novo.alteradas.items():
+                self._pintar_casa(i, TILE_EMPTY if dono < 0 else PLAYER_COLORS[dono % len(PLAYER_COLORS)])
+        elif antigo is None or novo.proprietarios != antigo.proprietarios:
+            # O tabuleiro recém-desenhado está todo sem dono
+            donos = novo.proprietarios
+            anteriores = antigo.proprietarios if antigo is not None else [-1] * len(donos)
+            for inicio in range(0, len(donos), FATIA_DIFERENCA):
+                fim = inicio + FATIA_DIFERENCA
+                if donos[inicio:fim] == anteriores[inicio:fim]:
+                    continue
+                for i in range(inicio, min(fim, len(donos))):
+                    if donos[i] != anteriores[i]:
+                        dono = donos[i]
+                        self._pintar_casa(i, TILE_EMPTY if dono < 0 else PLAYER_COLORS[dono % len(PLAYER_COLORS)])
+
+        self._set_evento(self.fonte.ultimo_evento)
+        self._on_finish(novo)
+        self._renderizado = novo
+
+    def _velocidade(self) -> float:
+        return float(self.var_velocidade.get().rstrip("x"))
+
+    def _agendar(self, atraso_ms: int):
+        self._cancelar_agendamento()
+        self._agendado = self.after(atraso_ms, self._step)
+
+    def _cancelar_agendamento(self):
+        if self._agendado is not None:
+            self.after_cancel(self._agendado)
+            self._agendado = None
+
+    def _play(self):
+        if self.fonte.finalizado:
             return
+        self.tocando = True
+        self.btn_play.config(text="Pausar")
+        self._ultimo_tick = time.perf_counter()
+        self._credito = 0.0
+        self._agendar(max(INTERVALO_QUADRO_MS, int(1000 / self._velocidade())))
+
+    def _pause(self):
+        self.tocando = False
+        self.btn_play.config(text="Continuar")
+        self._cancelar_agendamento()
+
+    def _alternar_play(self):
+        if self.tocando:
+            self._pause()
+        else:
+            self._play()
 
-        jogador = self._next_active_player()
-        if jogador is None:
-            self._on_finish()
+    def _step(self):
+        self._agendado = None
+        if not self.tocando:
             return
 
-        dado = Tabuleiro.jogar_dado()
-        self.last_dice = dado
-
-        self.jogo.jogada(jogador, dado)
-
-        if not self.jogo.finished and (jogador in self.jogo.jogadores):
-            comprou = self.jogo.comprar_propiedade(jogador)
-            if comprou:
-                self._set_evento(f"Jogador #{jogador.id} comprou a propriedade #{self.jogo.tabuleiro[jogador.posicao].id}.")
-            else:
-                self._set_evento(f"Jogador #{jogador.id} não comprou a propriedade.")
-
-        if jogador in self.jogo.jogadores:
-            self._move_token_to(jogador, jogador.posicao)
-        else:
-            self._set_evento(f"Jogador #{jogador.id} foi eliminado!")
+        # Quantos turnos cabem no tempo decorrido desde o último quadro
+        agora = time.perf_counter()
+        velocidade = self._velocidade()
+        self._credito += (agora - self._ultimo_tick) * velocidade
+        self._ultimo_tick = agora
+        turnos = max(1, int(self._credito))
+        self._credito = max(0.0, self._credito - turnos)
 
-        self._refresh_ownership_colors()
-        self._refresh_sidebar()
+        self.fonte.avancar(turnos)
+        self._renderizar()
 
-        if self.jogo.finished:
-            self._on_finish()
+        if self.fonte.finalizado:
+            self._pause()
             return
-
-        self.after(1000, self._step)
+        self._agendar(max(INTERVALO_QUADRO_MS, int(1000 / velocidade)))
+
+    def _passo(self):
+        self._pause()
+        self.fonte.avancar(1)
+        self._renderizar()
+
+    def _ir_para(self):
+        try:
+            turno = int(self.entry_turno.get())
+        except ValueError:
+            self._set_evento("Informe um número de rodada.")
+            return
+        self._pause()
+        self.fonte.ir_para(max(0, turno))
+        self._renderizar()
 
     def _set_evento(self, texto: str):
         self.lbl_evento.config(text=texto)
 
-    def _on_finish(self):
-        vencedor = getattr(self.jogo, "vencedor", None)
-        if vencedor is None and self.jogo.jogadores:
-            vencedor = sorted(self.jogo.jogadores, key=lambda j: -j.saldo)[0]
-        if vencedor:
-            nome_est = getattr(vencedor.estrategia, "nome", "desconhecida").upper()
-            self.lbl_vencedor.config(text=f"VENCEDOR: Jogador #{vencedor.id} ({nome_est})")
-        else:
-            self.lbl_vencedor.config(text="Sem vencedor.")
+    def _on_finish(self, estado: EstadoReplay):
+        if estado.vencedor is None:
+            self.lbl_vencedor.config(text="")
+            return
+        nome_est = self.fonte.estrategias[estado.vencedor].upper()
+        sufixo = " por tempo" if estado.termino_por_tempo else ""
+        self.lbl_vencedor.config(text=f"VENCEDOR{sufixo.upper()}: Jogador #{estado.vencedor + 1} ({nome_est})")
 
     def _reiniciar(self):
-        estrategias = [j.estrategia.__class__ for j in self._ordem_inicial()]
-        novos_jogadores = [Jogador(est) for est in estrategias]
-        novo_jogo = Jogo(novos_jogadores)
-
-        self.jogo = novo_jogo
-        self.ordem_turnos = list(getattr(novo_jogo, "ordem_turnos", novo_jogo.jogadores))
-        self.turn_index = 0
-        self.last_dice = 0
-        self.lbl_vencedor.config(text="")
-
-        self._layout_board()
-        self._draw_board()
-        self._init_tokens()
-        self._refresh_sidebar()
-        self._refresh_ownership_colors()
-        self.after(1000, self._step)
-
+        self._pause()
+        if isinstance(self.fonte, ReproducaoAoVivo):
+            self.fonte.reiniciar(seed=random.getrandbits(63))
+        else:
+            self.fonte.reiniciar()
+        self._montar()
+        self._play()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Acompanha uma partida ao vivo ou gravada.")
+    parser.add_argument("--qtd-casas", type=int, default=Jogo.QTD_CASAS)
+    parser.add_argument("--jogadores", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--compacto", action="store_true", help="TabuleiroCompacto, para tabuleiros enormes")
+    parser.add_argument("--arquivo", default=None, help="arquivo gravado com python -m src.registro")
+    parser.add_argument("--partida", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.arquivo:
+        arquivo = ArquivoPartidas(args.arquivo)
+        app = TabuleiroGUI(replay=arquivo[args.partida])
+    else:
+        random.seed()
+        estrategias = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+        jogadores = [Jogador(estrategias[i % len(estrategias)]) for i in range(args.jogadores)]
+        jogo = Jogo(jogadores, args.qtd_casas, seed=args.seed, compacto=args.compacto)
+        app = TabuleiroGUI(jogo)
+    app.mainloop()
 
 
 if __name__ == "__main__":
-    random.seed()
-    jogadores = [
-        Jogador(Impulsivo),
-        Jogador(Exigente),
-        Jogador(Cauteloso),
-        Jogador(Aleatorio),
-    ]
-    jogo = Jogo(jogadores)
-    app = TabuleiroGUI(jogo)
-    app.mainloop()
\ No newline at end of file
+    main()
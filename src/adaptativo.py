@@ -0,0 +1,246 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from statistics import NormalDist
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.aleatoriedade import derivar_seed
+from src.estatisticas import Agregado
+from src.estrategias import ESTRATEGIAS
+from src.runner import _simular_fatia, dividir_fatias
+
+# Fatias menores que as do runner: a regra de parada é avaliada a cada fatia,
+# então a granularidade define quantos jogos podem sobrar depois do alvo
+TAMANHO_FATIA = 1000
+JOGOS_MINIMOS = 1000
+
+
+def intervalo_wilson(sucessos: int, n: int, z: float) -> Tuple[float, float]:
+    # Intervalo de Wilson: ao contrário do de Wald, não colapsa em [0, 0]
+    # nem sai de [0, 1] para taxas perto dos extremos
+    if n == 0:
+        return 0.0, 1.0
+    p = sucessos / n
+    denominador = 1 + z * z / n
+    centro = (p + z * z / (2 * n)) / denominador
+    margem = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominador
+    return max(0.0, centro - margem), min(1.0, centro + margem)
+
+
+def _z(alfa: float) -> float:
+    return NormalDist().inv_cdf(1 - alfa / 2)
+
+
+def _alfa_da_olhada(alfa: float, olhada: int) -> float:
+    # Cada fatia é uma nova olhada nos dados; testar sempre com o mesmo alfa
+    # infla o erro tipo I. Gastando alfa * 6 / (pi^2 k^2) na k-ésima olhada a
+    # soma de todas as olhadas fica em alfa (Bonferroni com série convergente)
+    return alfa * 6 / (math.pi ** 2 * olhada ** 2)
+
+
+class Criterio:
+    # Regra de parada sobre o agregado acumulado. `precisao` é a meia largura
+    # máxima do intervalo de cada estratégia; `comparar` é um par de
+    # estratégias que deve ter vencedor significativo. Com os dois, para
+    # quando qualquer um for atingido
+    def __init__(self, precisao: Optional[float] = None, comparar: Optional[Tuple[str, str]] = None,
+                 confianca: float = 0.95, em_jogo: Optional[List[str]] = None):
+        if precisao is None and comparar is None:
+            raise ValueError("informe precisao e/ou comparar")
+        if comparar is not None:
+            # Um nome errado nunca vence: a comparação nunca seria decidida e
+            # o lote rodaria até max_jogos
+            em_jogo = list(ESTRATEGIAS) if em_jogo is None else em_jogo
+            if len(comparar) != 2 or comparar[0] == comparar[1]:
+                raise ValueError("comparar deve ter duas estratégias diferentes")
+            fora = [nome for nome in comparar if nome not in em_jogo]
+            if fora:
+                raise ValueError(f"estratégias fora da partida em comparar: {', '.join(fora)} "
+                                 f"(em jogo: {', '.join(em_jogo)})")
+        if precisao is not None and not 0 < precisao < 0.5:
+            raise ValueError("precisao deve estar em (0, 0.5)")
+        if not 0 < confianca < 1:
+            raise ValueError("confianca deve estar em (0, 1)")
+        self.precisao = precisao
+        self.comparar = comparar
+        self.confianca = confianca
+        self.z = _z(1 - confianca)
+
+    def intervalos(self, agregado: Agregado) -> Dict[str, Dict[str, float]]:
+        intervalos = {}
+        for nome, vitorias in sorted(agregado.vitorias.items(), key=lambda kv: -kv[1]):
+            inferior, superior = intervalo_wilson(vitorias, agregado.jogos, self.z)
+            intervalos[nome] = {"taxa": vitorias / agregado.jogos, "inferior": inferior, "superior": superior}
+        return intervalos
+
+    def comparacao(self, agregado: Agregado, olhada: int) -> Optional[Dict[str, object]]:
+        # As taxas de vitória de estratégias da mesma partida são dependentes
+        # (somam no máximo 1), então não basta comparar os dois intervalos.
+        # Condicionando nas partidas vencidas por uma das duas, a fração de
+        # `a` é uma binomial: há diferença se o intervalo dela exclui 0.5
+        if self.comparar is None:
+            return None
+        a, b = self.comparar
+        vitorias_a = agregado.vitorias.get(a, 0)
+        vitorias_b = agregado.vitorias.get(b, 0)
+        decisivas = vitorias_a + vitorias_b
+        inferior, superior = intervalo_wilson(vitorias_a, decisivas,
+                                              _z(_alfa_da_olhada(1 - self.confianca, olhada)))
+        if inferior > 0.5:
+            vencedor = a
+        elif superior < 0.5:
+            vencedor = b
+        else:
+            vencedor = None
+        return {
+            "estrategias": [a, b],
+            "vitorias": {a: vitorias_a, b: vitorias_b},
+            "fracao": vitorias_a / decisivas if decisivas else None,
+            "inferior": inferior,
+            "superior": superior,
+            "vencedor": vencedor,
+        }
+
+    def atingido(self, agregado: Agregado, olhada: int) -> bool:
+        if agregado.jogos < JOGOS_MINIMOS:
+            return False
+        if self.precisao is not None:
+            larguras = [(i["superior"] - i["inferior"]) / 2 for i in self.intervalos(agregado).values()]
+            if larguras and max(larguras) <= self.precisao:
+                return True
+        comparacao = self.comparacao(agregado, olhada)
+        return comparacao is not None and comparacao["vencedor"] is not None
+
+
+def _fatias_em_ordem(fatias: List[Tuple[int, int]], qtd_casas: int, jogadores: int, seed: int, motor: str,
+                     executor: Optional[ProcessPoolExecutor]) -> Iterator[Agregado]:
+    # Agregados na ordem das fatias mesmo com vários processos: a regra de
+    # parada só olha prefixos contíguos, então o número de jogos usados
+    # depende apenas da seed, nunca de qual worker terminou primeiro
+    if executor is None:
+        for indice, qtd in fatias:
+            yield _simular_fatia(qtd_casas, jogadores, qtd, derivar_seed(seed, indice), motor)
+        return
+
+    restantes = iter(fatias)
+    max_pendentes = 2 * (os.cpu_count() or 1)
+    pendentes = {}
+    prontos: Dict[int, Agregado] = {}
+    proxima = 0
+
+    def submeter(indice: int, qtd: int):
+        futuro = executor.submit(_simular_fatia, qtd_casas, jogadores, qtd, derivar_seed(seed, indice), motor)
+        pendentes[futuro] = indice
+
+    for fatia in itertools.islice(restantes, max_pendentes):
+        submeter(*fatia)
+    try:
+        while pendentes:
+            concluidos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidos:
+                prontos[pendentes.pop(futuro)] = futuro.result()
+                for fatia in itertools.islice(restantes, 1):
+                    submeter(*fatia)
+            while proxima in prontos:
+                yield prontos.pop(proxima)
+                proxima += 1
+    finally:
+        for futuro in pendentes:
+            futuro.cancel()
+
+
+def estrategias_em_jogo(jogadores: int) -> List[str]:
+    # Os assentos recebem as estratégias padrão em round-robin
+    return list(ESTRATEGIAS)[:jogadores]
+
+
+def estimar(qtd_casas: int = 20, jogadores: int = 4, precisao: Optional[float] = None,
+            comparar: Optional[Tuple[str, str]] = None, confianca: float = 0.95, max_jogos: int = 1_000_000,
+            seed: Optional[int] = None, processos: Optional[int] = None, tamanho_fatia: int = TAMANHO_FATIA,
+            motor: str = "objetos") -> Dict[str, object]:
+    # Simula fatia a fatia até o critério ser atingido ou max_jogos acabar.
+    # As seeds por fatia são as de simular_paralelo com o mesmo tamanho de
+    # fatia: os jogos usados são exatamente o prefixo daquele lote
+    if max_jogos < 1:
+        raise ValueError("max_jogos deve ser >= 1")
+    criterio = Criterio(precisao, comparar, confianca, estrategias_em_jogo(jogadores))
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    processos = processos or os.cpu_count() or 1
+
+    agregado = Agregado()
+    atingido = False
+    olhadas = 0
+    inicio = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        parciais = _fatias_em_ordem(dividir_fatias(max_jogos, tamanho_fatia), qtd_casas, jogadores, seed,
+                                    motor, executor)
+        for parcial in parciais:
+            agregado.mesclar(parcial)
+            olhadas += 1
+            if criterio.atingido(agregado, olhadas):
+                atingido = True
+                break
+        parciais.close()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    duracao = time.perf_counter() - inicio
+
+    resposta = agregado.resumo()
+    resposta["intervalos"] = criterio.intervalos(agregado)
+    if comparar is not None:
+        resposta["comparacao"] = criterio.comparacao(agregado, olhadas)
+    resposta["criterio"] = {
+        "precisao": precisao,
+        "confianca": confianca,
+        "atingido": atingido,
+        "olhadas": olhadas,
+        "max_jogos": max_jogos,
+        "economia": 1 - agregado.jogos / max_jogos,
+    }
+    resposta["seed"] = seed
+    resposta["duracao_segundos"] = duracao
+    return resposta
+
+
+def _par(texto: str) -> Tuple[str, str]:
+    nomes = [nome.strip() for nome in texto.split(",") if nome.strip()]
+    if len(nomes) != 2 or nomes[0] == nomes[1]:
+        raise argparse.ArgumentTypeError("use duas estratégias diferentes separadas por vírgula")
+    return nomes[0], nomes[1]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Simula até a taxa de vitória atingir a precisão ou a significância pedida.")
+    parser.add_argument("--precisao", type=float, default=None,
+                        help="meia largura máxima do intervalo de cada estratégia (ex.: 0.01)")
+    parser.add_argument("--comparar", type=_par, default=None,
+                        help="par de estratégias a separar, ex.: impulsivo,cauteloso")
+    parser.add_argument("--confianca", type=float, default=0.95)
+    parser.add_argument("--max-jogos", type=int, default=1_000_000)
+    parser.add_argument("--qtd-casas", type=int, default=20)
+    parser.add_argument("--jogadores", type=int, default=4)
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--tamanho-fatia", type=int, default=TAMANHO_FATIA)
+    parser.add_argument("--motor", choices=("objetos", "vetorizado"), default="objetos")
+    args = parser.parse_args(argv)
+
+    try:
+        resposta = estimar(args.qtd_casas, args.jogadores, args.precisao, args.comparar, args.confianca,
+                           args.max_jogos, args.seed, args.processos, args.tamanho_fatia, args.motor)
+    except ValueError as e:
+        parser.error(str(e))
+    print(json.dumps(resposta, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
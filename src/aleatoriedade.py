@@ -0,0 +1,95 @@
+import hashlib
+from array import array
+import random
+import struct
+from typing import List, Optional
+
+MAX_SEED = 2**63
+
+
+def derivar_seed(seed: int, *chaves) -> int:
+    # Fluxos derivados por hash de (seed, chaves) são independentes entre si
+    # e não dependem da ordem em que são criados
+    texto = ":".join(str(c) for c in (seed,) + chaves)
+    digest = hashlib.blake2b(texto.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % MAX_SEED
+
+
+def subfluxos(seed: int, n: int) -> List[int]:
+    return [derivar_seed(seed, i) for i in range(n)]
+
+
+def nova_seed(rng=random) -> int:
+    # Sem seed explícita a partida sorteia uma a partir do gerador global,
+    # então random.seed() continua tornando execuções reproduzíveis
+    return rng.getrandbits(63)
+
+
+def criar_gerador(seed: Optional[int] = None) -> random.Random:
+    return random.Random(nova_seed() if seed is None else seed)
+
+
+class _FluxoEmBloco:
+    __slots__ = ("seed", "tamanho_bloco", "_bloco", "_valores")
+
+    def __init__(self, seed: int, tamanho_bloco: int):
+        # Cada bloco vem de um gerador temporário semeado com (seed, bloco):
+        # a partida não guarda os ~2.5 KB de estado de um random.Random
+        self.seed = seed
+        self.tamanho_bloco = tamanho_bloco
+        self._bloco = 0
+        self._valores = iter(())
+
+    def _bytes(self, n: int) -> bytes:
+        rng = random.Random(derivar_seed(self.seed, self._bloco))
+        self._bloco += 1
+        return rng.randbytes(n)
+
+    def _proximo(self):
+        try:
+            return next(self._valores)
+        except StopIteration:
+            bloco = self._gerar()
+            while not bloco:
+                bloco = self._gerar()
+            self._valores = iter(bloco)
+            return next(self._valores)
+
+
+class DadosEmBloco(_FluxoEmBloco):
+    __slots__ = ()
+
+    TAMANHO_BLOCO = 256
+
+    # Bytes 0..251 viram 1..6 sem viés; 252..255 são descartados
+    _TABELA = bytes(b % 6 + 1 for b in range(256))
+    _DESCARTE = bytes(range(252, 256))
+
+    def __init__(self, seed: int, tamanho_bloco: int = TAMANHO_BLOCO):
+        super().__init__(seed, tamanho_bloco)
+
+    def _gerar(self) -> bytes:
+        return self._bytes(self.tamanho_bloco).translate(self._TABELA, self._DESCARTE)
+
+    def jogar(self) -> int:
+        return self._proximo()
+
+
+class SorteiosEmBloco(_FluxoEmBloco):
+    # Floats uniformes em [0, 1) com a mesma interface de random.random(),
+    # para RegraCompra.avaliar
+    __slots__ = ()
+
+    TAMANHO_BLOCO = 32
+
+    def __init__(self, seed: int, tamanho_bloco: int = TAMANHO_BLOCO):
+        super().__init__(seed, tamanho_bloco)
+
+    def _gerar(self):
+        # "<Q" fixa little-endian: a mesma seed dá os mesmos sorteios em
+        # qualquer máquina, como derivar_seed
+        inteiros = struct.unpack(f"<{self.tamanho_bloco}Q", self._bytes(8 * self.tamanho_bloco))
+        return array("d", [(i >> 11) * 2.0 ** -53 for i in inteiros])
+
+    def random(self) -> float:
+        return self._proximo()
@@ -0,0 +1,97 @@
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Camada de apresentação no terminal. src.core não importa este módulo no
+# topo: simulador, API e workers nunca imprimem e não pagam o import do rich
+console = Console()
+
+
+def imprimir_jogador(jogador):
+    estrategia_nome = jogador.estrategia.__class__.__name__
+    propriedades_info = f"{len(jogador.propriedades)} propriedade(s)"
+
+    console.print(Panel(
+        f"[bold cyan]Jogador #{jogador.id}[/bold cyan]\n"
+        f"💰 Saldo: [green]${jogador.saldo}[/green]\n"
+        f"🎯 Estratégia: [yellow]{estrategia_nome}[/yellow]\n"
+        f"🏠 Propriedades: {propriedades_info}",
+        border_style="cyan"
+    ))
+
+
+def imprimir_propriedade(propriedade):
+    proprietario_info = f"Jogador #{propriedade.proprietario.id}" if propriedade.proprietario else "[red]Disponível[/red]"
+    console.print(
+        f"🏠 [bold]Propriedade #{propriedade.id}[/bold] | "
+        f"Preço: [green]${propriedade.preco}[/green] | "
+        f"Aluguel: [yellow]${propriedade.aluguel}[/yellow] | "
+        f"Dono: {proprietario_info}"
+    )
+
+
+def imprimir_jogo(jogo):
+    console.print(
+        f"\n[bold magenta]═══════════════════════════════════════[/bold magenta]")
+    console.print(
+        f"[bold magenta]        ESTADO DO JOGO - Rodada {jogo.rodada}[/bold magenta]")
+    console.print(
+        f"[bold magenta]═══════════════════════════════════════[/bold magenta]\n")
+
+    console.print("[bold blue]👥 JOGADORES:[/bold blue]\n")
+    for jogador in jogo.jogadores:
+        imprimir_jogador(jogador)
+        console.print()
+
+    console.print(
+        "\n[bold blue]🏘️  TABULEIRO (Propriedades):[/bold blue]\n")
+
+    tabela = Table(show_header=True, header_style="bold magenta")
+    tabela.add_column("ID", style="dim", width=6)
+    tabela.add_column("Preço", justify="right")
+    tabela.add_column("Aluguel", justify="right")
+    tabela.add_column("Proprietário", justify="center")
+
+    for prop in jogo.tabuleiro:
+        proprietario_info = f"Jogador #{prop.proprietario.id}" if prop.proprietario else "Disponível"
+        tabela.add_row(
+            f"#{prop.id}",
+            f"${prop.preco}",
+            f"${prop.aluguel}",
+            proprietario_info
+        )
+
+    console.print(tabela)
+
+
+def imprimir_resultado(jogo, ranking):
+    console.print("\n[bold green]📊 RESULTADO DA PARTIDA[/bold green]")
+
+    if jogo.vencedor:
+        console.print(
+            f"🏆 Vencedor: [bold yellow]{jogo.vencedor.nome_estrategia().upper()}[/bold yellow] "
+            f"(Jogador #{jogo.vencedor.id})"
+        )
+    else:
+        console.print("Sem vencedor definido.")
+
+    if jogo.termino_por_tempo:
+        console.print(
+            f"⏱️ Jogo terminou por limite de {jogo.max_rodadas} rodadas.")
+
+    console.print(f"🔁 Total de rodadas: [bold]{jogo.rodada}[/bold]\n")
+
+    tabela = Table(show_header=True, header_style="bold magenta")
+    tabela.add_column("Posição", justify="right")
+    tabela.add_column("Jogador", justify="left")
+    tabela.add_column("Estratégia", justify="left")
+    tabela.add_column("Saldo", justify="right")
+
+    for i, j in enumerate(ranking, start=1):
+        tabela.add_row(
+            f"{i}",
+            f"#{j.id}",
+            j.nome_estrategia(),
+            f"${j.saldo}"
+        )
+    console.print(tabela)
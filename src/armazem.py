@@ -0,0 +1,224 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.estatisticas import Agregado
+from src.runner import TAMANHO_FATIA, iterar_resultados
+from src.servico import respeitar_prazo
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY,
+    criada_em REAL NOT NULL,
+    seed INTEGER NOT NULL,
+    qtd_casas INTEGER NOT NULL,
+    jogadores INTEGER NOT NULL,
+    motor TEXT NOT NULL,
+    jogos INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS partidas (
+    execucao INTEGER NOT NULL REFERENCES execucoes(id),
+    qtd_casas INTEGER NOT NULL,
+    jogadores INTEGER NOT NULL,
+    composicao TEXT NOT NULL,
+    vencedor TEXT NOT NULL,
+    termino_por_tempo INTEGER NOT NULL,
+    rodadas INTEGER NOT NULL
+);
+-- Índices cobrindo as colunas agregadas: as consultas por configuração,
+-- vencedor e tipo de término são resolvidas só pelo índice, sem ler a tabela
+CREATE INDEX IF NOT EXISTS partidas_configuracao
+    ON partidas (qtd_casas, jogadores, vencedor, termino_por_tempo, rodadas);
+CREATE INDEX IF NOT EXISTS partidas_vencedor
+    ON partidas (vencedor, termino_por_tempo, rodadas);
+CREATE INDEX IF NOT EXISTS partidas_termino
+    ON partidas (termino_por_tempo, rodadas);
+CREATE INDEX IF NOT EXISTS partidas_execucao
+    ON partidas (execucao);
+"""
+
+FILTROS = ("execucao", "qtd_casas", "jogadores", "composicao", "vencedor", "termino_por_tempo")
+
+# Linhas por executemany/transação: grande o bastante para amortizar o commit,
+# pequeno o bastante para não segurar muita memória
+TAMANHO_INSERCAO = 20_000
+
+
+class ArmazemResultados:
+    # Resultados de Jogo.resultado() em SQLite, uma linha por partida. Um único
+    # escritor (o processo principal) recebe os resultados dos workers do
+    # runner e insere em blocos; WAL deixa consultas rodarem durante a escrita
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        diretorio = os.path.dirname(os.path.abspath(caminho))
+        os.makedirs(diretorio, exist_ok=True)
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+            # Com WAL, NORMAL só pode perder os últimos commits numa queda de
+            # energia, nunca corromper o arquivo
+            self._conexao.execute("PRAGMA synchronous=NORMAL")
+            self._conexao.executescript(ESQUEMA)
+
+    def __enter__(self) -> 'ArmazemResultados':
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        with self._lock:
+            self._conexao.close()
+
+    def criar_execucao(self, seed: int, qtd_casas: int, jogadores: int, motor: str = "objetos") -> int:
+        with self._lock:
+            cursor = self._conexao.execute(
+                "INSERT INTO execucoes (criada_em, seed, qtd_casas, jogadores, motor) VALUES (?, ?, ?, ?, ?)",
+                (time.time(), seed, qtd_casas, jogadores, motor))
+            return cursor.lastrowid
+
+    def inserir(self, execucao: int, qtd_casas: int, resultados: Iterable[Dict[str, object]],
+                tamanho_insercao: int = TAMANHO_INSERCAO) -> int:
+        linhas = (
+            (execucao, qtd_casas, len(r["jogadores"]), ",".join(r["jogadores"]), r["vencedor"],
+             int(r["termino_por_tempo"]), r["rodadas"])
+            for r in resultados
+        )
+        total = 0
+        while True:
+            bloco = list(itertools.islice(linhas, tamanho_insercao))
+            if not bloco:
+                return total
+            with self._lock:
+                self._conexao.execute("BEGIN")
+                try:
+                    self._conexao.executemany("INSERT INTO partidas VALUES (?, ?, ?, ?, ?, ?, ?)", bloco)
+                    self._conexao.execute("UPDATE execucoes SET jogos = jogos + ? WHERE id = ?",
+                                          (len(bloco), execucao))
+                    self._conexao.execute("COMMIT")
+                except BaseException:
+                    self._conexao.execute("ROLLBACK")
+                    raise
+            total += len(bloco)
+
+    def execucoes(self) -> List[Dict[str, object]]:
+        with self._lock:
+            cursor = self._conexao.execute("SELECT * FROM execucoes ORDER BY id")
+            colunas = [c[0] for c in cursor.description]
+            return [dict(zip(colunas, linha)) for linha in cursor.fetchall()]
+
+    def consultar(self, **filtros) -> Dict[str, object]:
+        # Agregados no formato de Agregado.resumo() sobre as partidas que
+        # passam nos filtros (igualdade em qualquer coluna de FILTROS)
+        desconhecidos = set(filtros) - set(FILTROS)
+        if desconhecidos:
+            raise ValueError(f"filtros desconhecidos: {', '.join(sorted(desconhecidos))}")
+        condicoes = [(coluna, valor) for coluna, valor in filtros.items() if valor is not None]
+        where = " AND ".join(f"{coluna} = ?" for coluna, _ in condicoes) or "1"
+        parametros = [int(valor) if isinstance(valor, bool) else valor for _, valor in condicoes]
+
+        with self._lock:
+            por_vencedor = self._conexao.execute(
+                f"SELECT vencedor, COUNT(*), SUM(termino_por_tempo), SUM(rodadas), MIN(rodadas), MAX(rodadas) "
+                f"FROM partidas WHERE {where} GROUP BY vencedor", parametros).fetchall()
+
+        jogos = sum(linha[1] for linha in por_vencedor)
+        soma_rodadas = sum(linha[3] for linha in por_vencedor)
+        return {
+            "filtros": dict(condicoes),
+            "jogos": jogos,
+            "vitorias": {linha[0]: linha[1] for linha in sorted(por_vencedor, key=lambda l: -l[1])},
+            "taxa_termino_por_tempo": sum(linha[2] for linha in por_vencedor) / jogos if jogos else 0.0,
+            "rodadas": {
+                "media": soma_rodadas / jogos if jogos else None,
+                "min": min(linha[4] for linha in por_vencedor) if jogos else None,
+                "max": max(linha[5] for linha in por_vencedor) if jogos else None,
+            },
+        }
+
+
+def armazenar_lote(armazem: ArmazemResultados, n: int, qtd_casas: int = 20, jogadores: int = 4,
+                   seed: Optional[int] = None, processos: Optional[int] = 1,
+                   motor: str = "objetos", tamanho_fatia: int = TAMANHO_FATIA,
+                   prazo: Optional[float] = None) -> Dict[str, object]:
+    # Simula e grava o lote, devolvendo também o agregado: a partida i é a
+    # mesma de simular_paralelo/iterar_resultados com a mesma seed e motor.
+    # Com `prazo` (time.time()), para com TempoEsgotado ao estourá-lo; a
+    # execução fica com as partidas já gravadas (execucoes.jogos)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    processos = processos or os.cpu_count() or 1
+    execucao = armazem.criar_execucao(seed, qtd_casas, jogadores, motor)
+    agregado = Agregado()
+
+    def contabilizar(resultados: Iterable[Dict[str, object]]) -> Iterator[Dict[str, object]]:
+        for resultado in resultados:
+            agregado.adicionar(resultado)
+            yield resultado
+
+    inicio = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        resultados = iterar_resultados(n, qtd_casas, jogadores, seed, executor, tamanho_fatia, motor=motor)
+        armazem.inserir(execucao, qtd_casas, contabilizar(respeitar_prazo(resultados, prazo)))
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    duracao = time.perf_counter() - inicio
+
+    resposta = agregado.resumo()
+    resposta["execucao"] = execucao
+    resposta["seed"] = seed
+    resposta["duracao_segundos"] = duracao
+    resposta["jogos_por_segundo"] = n / duracao if duracao > 0 else None
+    return resposta
+
+
+def _booleano(texto: str) -> bool:
+    return texto.strip().lower() in ("1", "true", "sim", "yes")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Grava resultados de partidas em SQLite e consulta agregados.")
+    parser.add_argument("banco")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    gravar = sub.add_parser("gravar", help="simula um lote e grava cada partida")
+    gravar.add_argument("-n", "--jogos", type=int, required=True)
+    gravar.add_argument("--qtd-casas", type=int, default=20)
+    gravar.add_argument("--jogadores", type=int, default=4)
+    gravar.add_argument("--seed", type=int, default=None)
+    gravar.add_argument("--processos", type=int, default=None)
+    gravar.add_argument("--motor", choices=("objetos", "vetorizado"), default="objetos")
+
+    consultar = sub.add_parser("consultar", help="agrega as partidas gravadas")
+    for coluna in ("execucao", "qtd_casas", "jogadores"):
+        consultar.add_argument(f"--{coluna.replace('_', '-')}", type=int, default=None)
+    consultar.add_argument("--composicao", default=None)
+    consultar.add_argument("--vencedor", default=None)
+    consultar.add_argument("--termino-por-tempo", type=_booleano, default=None)
+
+    sub.add_parser("execucoes", help="lista os lotes gravados")
+    args = parser.parse_args(argv)
+
+    with ArmazemResultados(args.banco) as armazem:
+        if args.comando == "gravar":
+            resposta = armazenar_lote(armazem, args.jogos, args.qtd_casas, args.jogadores, args.seed,
+                                      args.processos, args.motor)
+        elif args.comando == "consultar":
+            resposta = armazem.consultar(**{coluna: getattr(args, coluna) for coluna in FILTROS})
+        else:
+            resposta = armazem.execucoes()
+    print(json.dumps(resposta, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+# Entra na chave: mudanças no motor que alterem resultados para a mesma seed
+# devem incrementar este número para não servir entradas antigas do disco
+VERSAO = 1
+
+
+def chave_cache(rota: str, **parametros) -> str:
+    texto = json.dumps({"versao": VERSAO, "rota": rota, **parametros}, sort_keys=True)
+    return hashlib.sha256(texto.encode()).hexdigest()
+
+
+class CacheResultados:
+    # Dois níveis: LRU em memória limitado por quantidade de entradas e TTL,
+    # e opcionalmente um diretório com um JSON por chave que sobrevive a
+    # reinícios, limitado a max_itens_disco arquivos (LRU pelo mtime, que é
+    # renovado a cada acerto). Só faz sentido para requisições com seed explícita
+    def __init__(self, max_itens: int = 256, ttl: Optional[float] = 300.0,
+                 diretorio: Optional[str] = None, ttl_disco: Optional[float] = None,
+                 max_itens_disco: Optional[int] = 4096):
+        self.max_itens = max_itens
+        self.ttl = ttl
+        self.diretorio = diretorio
+        self.ttl_disco = ttl_disco
+        self.max_itens_disco = max_itens_disco
+
+        self._itens: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+        self.expirados = 0
+        self.despejos = 0
+        self.despejos_disco = 0
+
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def _caminho(self, chave: str) -> str:
+        return os.path.join(self.diretorio, f"{chave}.json")
+
+    def _ler_disco(self, chave: str):
+        if not self.diretorio:
+            return None
+        try:
+            with open(self._caminho(chave), encoding="utf-8") as arquivo:
+                entrada = json.load(arquivo)
+        except (OSError, ValueError):
+            return None
+        if self.ttl_disco is not None and time.time() - entrada["criado_em"] > self.ttl_disco:
+            return None
+        try:
+            os.utime(self._caminho(chave))
+        except OSError:
+            pass
+        return entrada["valor"]
+
+    def _gravar_disco(self, chave: str, valor):
+        if not self.diretorio:
+            return
+        # Escrita atômica: leitores nunca veem um JSON pela metade
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+                json.dump({"criado_em": time.time(), "valor": valor}, arquivo, ensure_ascii=False)
+            os.replace(temporario, self._caminho(chave))
+        except OSError:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            return
+        if self.max_itens_disco is not None:
+            self._despejar_disco()
+
+    def _despejar_disco(self):
+        # Só roda após gravar, ou seja, após uma simulação: listar o diretório
+        # é barato perto dela. Outro processo pode apagar o mesmo arquivo
+        entradas = []
+        with os.scandir(self.diretorio) as arquivos:
+            for arquivo in arquivos:
+                if arquivo.name.endswith(".json"):
+                    try:
+                        entradas.append((arquivo.stat().st_mtime, arquivo.path))
+                    except OSError:
+                        pass
+        excedentes = len(entradas) - self.max_itens_disco
+        if excedentes <= 0:
+            return
+        entradas.sort()
+        for _, caminho in entradas[:excedentes]:
+            try:
+                os.remove(caminho)
+            except OSError:
+                continue
+            with self._lock:
+                self.despejos_disco += 1
+
+    def _guardar_memoria(self, chave: str, valor):
+        expira_em = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._itens[chave] = (expira_em, valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+                self.despejos += 1
+
+    def obter(self, chave: str) -> Tuple[Optional[object], Optional[str]]:
+        # Devolve (valor, nível) com nível "memoria", "disco" ou None
+        with self._lock:
+            entrada = self._itens.get(chave)
+            if entrada is not None:
+                expira_em, valor = entrada
+                if time.monotonic() < expira_em:
+                    self._itens.move_to_end(chave)
+                    self.acertos_memoria += 1
+                    return valor, "memoria"
+                del self._itens[chave]
+                self.expirados += 1
+
+        valor = self._ler_disco(chave)
+        if valor is not None:
+            self._guardar_memoria(chave, valor)
+            with self._lock:
+                self.acertos_disco += 1
+            return valor, "disco"
+
+        with self._lock:
+            self.falhas += 1
+        return None, None
+
+    def guardar(self, chave: str, valor):
+        self._guardar_memoria(chave, valor)
+        self._gravar_disco(chave, valor)
+
+    def obter_ou_calcular(self, chave: str, calcular: Callable[[], object]) -> Tuple[object, str]:
+        valor, nivel = self.obter(chave)
+        if nivel is not None:
+            return valor, nivel
+        valor = calcular()
+        self.guardar(chave, valor)
+        return valor, "falha"
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+        if self.diretorio:
+            for nome in os.listdir(self.diretorio):
+                if nome.endswith(".json"):
+                    os.remove(os.path.join(self.diretorio, nome))
+
+    def estatisticas(self) -> Dict[str, object]:
+        with self._lock:
+            consultas = self.acertos_memoria + self.acertos_disco + self.falhas
+            return {
+                "itens_memoria": len(self._itens),
+                "max_itens": self.max_itens,
+                "ttl_segundos": self.ttl,
+                "diretorio": self.diretorio,
+                "max_itens_disco": self.max_itens_disco,
+                "acertos_memoria": self.acertos_memoria,
+                "acertos_disco": self.acertos_disco,
+                "falhas": self.falhas,
+                "expirados": self.expirados,
+                "despejos": self.despejos,
+                "despejos_disco": self.despejos_disco,
+                "taxa_acerto": (self.acertos_memoria + self.acertos_disco) / consultas if consultas else None,
+            }
@@ -0,0 +1,75 @@
+import json
+import os
+import signal
+import tempfile
+import time
+from typing import Dict, Optional
+
+# Entra no arquivo: mudanças no formato do estado ou no motor que alterem
+# resultados para a mesma seed devem incrementar este número
+VERSAO = 1
+
+
+class CheckpointIncompativel(ValueError):
+    pass
+
+
+def ler_checkpoint(caminho: str) -> Optional[Dict[str, object]]:
+    try:
+        with open(caminho, encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except FileNotFoundError:
+        return None
+
+
+def tratar_sigterm():
+    # Preempção costuma chegar como SIGTERM, que por padrão mata o processo
+    # sem rodar blocos finally; como SystemExit o último checkpoint é salvo
+    def encerrar(sinal, quadro):
+        raise SystemExit(128 + sinal)
+    signal.signal(signal.SIGTERM, encerrar)
+
+
+class Checkpoint:
+    # Estado retomável de uma execução longa. Cada fatia tem o próprio fluxo
+    # de números aleatórios, derivado de (seed, índice) e não do que rodou
+    # antes: a posição dos fluxos é o conjunto de fatias concluídas, e
+    # retomar só precisa dele, dos parâmetros e dos agregados parciais
+    def __init__(self, caminho: str, parametros: Dict[str, object], intervalo: float = 30.0):
+        self.caminho = caminho
+        self.parametros = parametros
+        self.intervalo = intervalo
+        self._ultimo = time.monotonic()
+
+    def carregar(self) -> Optional[Dict[str, object]]:
+        dados = ler_checkpoint(self.caminho)
+        if dados is None:
+            return None
+        if dados.get("versao") != VERSAO:
+            raise CheckpointIncompativel(f"{self.caminho}: versão {dados.get('versao')} != {VERSAO}")
+        if dados["parametros"] != self.parametros:
+            diferentes = sorted(k for k in set(dados["parametros"]) | set(self.parametros)
+                                if dados["parametros"].get(k) != self.parametros.get(k))
+            raise CheckpointIncompativel(
+                f"{self.caminho} é de outra execução (parâmetros diferentes: {', '.join(diferentes)})")
+        return dados["estado"]
+
+    def vencido(self) -> bool:
+        return time.monotonic() - self._ultimo >= self.intervalo
+
+    def salvar(self, estado: Dict[str, object]):
+        # Escrita atômica: uma queda no meio deixa o checkpoint anterior intacto
+        diretorio = os.path.dirname(os.path.abspath(self.caminho))
+        fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+                json.dump({"versao": VERSAO, "salvo_em": time.time(), "parametros": self.parametros,
+                           "estado": estado}, arquivo, ensure_ascii=False)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            os.replace(temporario, self.caminho)
+        except BaseException:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            raise
+        self._ultimo = time.monotonic()
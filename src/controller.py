@@ -1,28 +1,78 @@
-from src.core import Jogo, Tabuleiro, Jogador
-from src.estrategias import Impulsivo, Exigente, Cauteloso, Aleatorio
-
+import time
+from typing import Dict, Iterator, List, Optional
 
-def simulador(qtd_casas=20, jogadores=4):
-    estrategias = [
-        Impulsivo,
-        Exigente,
-        Cauteloso,
-        Aleatorio,
-    ]
-    jogadores = [Jogador(estrategias[i % len(estrategias)])
-                 for i in range(jogadores)]
+from src.aleatoriedade import derivar_seed
+from src.core import Jogo, Tabuleiro, Jogador
+from src.estatisticas import Agregado
+from src.instrumentacao import JogoInstrumentado, Metricas
+from src.estrategias import Estrategia, Impulsivo, Exigente, Cauteloso, Aleatorio
 
-    jogo = Jogo(jogadores, qtd_casas)
 
+def executar(jogo: Jogo) -> Jogo:
     while not jogo.finished:
 
         for jogador in list(jogo.jogadores):
             if jogo.finished:
                 break
 
-            dado = Tabuleiro.jogar_dado()
+            dado = jogo.jogar_dado()
             jogo.jogada(jogador, dado)
-            if not jogo.finished and jogador in jogo.jogadores:
+            if not jogo.finished and jogo.esta_vivo(jogador):
                 jogo.comprar_propiedade(jogador)
 
+    return jogo
+
+
+def criar_jogadores(qtd: int, estrategias: Optional[List[type[Estrategia]]] = None) -> List[Jogador]:
+    # Estratégias distribuídas em round-robin pelos assentos
+    estrategias = estrategias or [
+        Impulsivo,
+        Exigente,
+        Cauteloso,
+        Aleatorio,
+    ]
+    return [Jogador(estrategias[i % len(estrategias)])
+            for i in range(qtd)]
+
+
+def simulador(qtd_casas=20, jogadores=4, seed: Optional[int] = None,
+              metricas: Optional[Metricas] = None, compacto: bool = False):
+    jogadores = criar_jogadores(jogadores)
+
+    if metricas is None:
+        jogo = Jogo(jogadores, qtd_casas, seed=seed, compacto=compacto)
+        executar(jogo)
+    else:
+        jogo = JogoInstrumentado(jogadores, qtd_casas, seed=seed, compacto=compacto)
+        inicio = time.perf_counter_ns()
+        executar(jogo)
+        metricas.registrar_jogo(jogo, time.perf_counter_ns() - inicio)
+
     return jogo.resultado()
+
+
+def gerar_resultados(n: int, qtd_casas=20, jogadores=4, seed: Optional[int] = None,
+                     metricas: Optional[Metricas] = None) -> Iterator[Dict[str, object]]:
+    # Uma partida por vez: quem consome decide o que guardar
+    for i in range(n):
+        yield simulador(qtd_casas, jogadores, None if seed is None else derivar_seed(seed, i), metricas)
+
+
+def simular_lote(n: int, qtd_casas=20, jogadores=4, detalhes=False,
+                 seed: Optional[int] = None, metricas: Optional[Metricas] = None) -> Dict[str, object]:
+    agregado = Agregado()
+    partidas = []
+
+    inicio = time.perf_counter()
+    for resultado in gerar_resultados(n, qtd_casas, jogadores, seed, metricas):
+        agregado.adicionar(resultado)
+        if detalhes:
+            partidas.append(resultado)
+    duracao = time.perf_counter() - inicio
+
+    resposta = agregado.resumo()
+    resposta["duracao_segundos"] = duracao
+    resposta["jogos_por_segundo"] = n / duracao if duracao > 0 else None
+    if detalhes:
+        resposta["partidas"] = partidas
+    return resposta
@@ -1,120 +1,329 @@
+import heapq
+import itertools
 import random
-from typing import List, Optional, Dict, Tuple
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+import struct
+from array import array
+from typing import Iterator, List, Optional, Dict, Tuple
+from src.aleatoriedade import DadosEmBloco, SorteiosEmBloco, derivar_seed, nova_seed
 from src.estrategias import Estrategia, Impulsivo, Exigente, Cauteloso, Aleatorio
 
-console = Console()
-
 
 class Jogador:
-    _contador_id = 0
+    __slots__ = ("id", "saldo", "estrategia", "regra", "propriedades", "posicao", "marcas_saldo")
+
+    # next() em itertools.count é atômico, seguro entre threads
+    _contador_id = itertools.count(1)
+    SALDO_INICIAL = 300
 
     def __init__(self, estrategia_cls: type[Estrategia]):
-        Jogador._contador_id += 1
-        self.id = Jogador._contador_id
-        self.saldo = 300
+        self.id = next(Jogador._contador_id)
+        self.saldo = self.SALDO_INICIAL
         self.estrategia = estrategia_cls()
-        self.propriedades: List['Propriedade'] = []
+        self.regra = estrategia_cls.regra_declarada()
+        # dict como conjunto ordenado: remoção O(1) preservando a ordem de compra
+        self.propriedades: Dict['Propriedade', None] = {}
         self.posicao = 0
+        # Marcas do RankingSaldo da partida em que o jogador está (definido
+        # pelo Jogo): o jogador se anota ali quando o saldo muda
+        self.marcas_saldo: Optional[Dict['Jogador', None]] = None
 
     def alterar_saldo(self, valor: int) -> int:
         self.saldo += valor
+        if self.marcas_saldo is not None:
+            self.marcas_saldo[self] = None
         return self.saldo
 
     def adicionar_propriedade(self, propriedade: 'Propriedade'):
-        self.propriedades.append(propriedade)
+        self.propriedades[propriedade] = None
 
     def remover_propriedade(self, propriedade: 'Propriedade'):
-        if propriedade in self.propriedades:
-            self.propriedades.remove(propriedade)
+        self.propriedades.pop(propriedade, None)
 
     def limpar_propriedades(self):
         for p in self.propriedades:
             p.proprietario = None
-            self.remover_propriedade(p)
+        self.propriedades.clear()
 
     def nome_estrategia(self) -> str:
         return self.estrategia.nome
 
     def print_infos(self):
-        estrategia_nome = self.estrategia.__class__.__name__
-        propriedades_info = f"{len(self.propriedades)} propriedade(s)"
-
-        console.print(Panel(
-            f"[bold cyan]Jogador #{self.id}[/bold cyan]\n"
-            f"💰 Saldo: [green]${self.saldo}[/green]\n"
-            f"🎯 Estratégia: [yellow]{estrategia_nome}[/yellow]\n"
-            f"🏠 Propriedades: {propriedades_info}",
-            border_style="cyan"
-        ))
+        # Import tardio: rich só é carregado quando algo é impresso
+        from src.apresentacao import imprimir_jogador
+        imprimir_jogador(self)
 
 
 class Propriedade:
-    _contador_id = 0
+    __slots__ = ("id", "preco", "aluguel", "proprietario", "posicao")
+
+    _contador_id = itertools.count(1)
 
-    def __init__(self, preco: int, aluguel: int):
-        Propriedade._contador_id += 1
-        self.id = Propriedade._contador_id
+    def __init__(self, preco: int, aluguel: int, posicao: int):
+        self.id = next(Propriedade._contador_id)
         self.preco = preco
         self.aluguel = aluguel
         self.proprietario: Optional[Jogador] = None
+        # Índice no tabuleiro: quem só tem a propriedade acha a casa sem busca
+        self.posicao = posicao
 
     def definir_proprietario(self, jogador: Jogador):
         self.proprietario = jogador
         jogador.adicionar_propriedade(self)
 
     def print_infos(self):
-        proprietario_info = f"Jogador #{self.proprietario.id}" if self.proprietario else "[red]Disponível[/red]"
-        console.print(
-            f"🏠 [bold]Propriedade #{self.id}[/bold] | "
-            f"Preço: [green]${self.preco}[/green] | "
-            f"Aluguel: [yellow]${self.aluguel}[/yellow] | "
-            f"Dono: {proprietario_info}"
-        )
+        from src.apresentacao import imprimir_propriedade
+        imprimir_propriedade(self)
 
 
 class Tabuleiro:
-    propriedades: List[Propriedade] = []
+    __slots__ = ("propriedades",)
+
     PORCENTAGEM_ALUGUEL = 0.25
 
-    @classmethod
-    def inicializar(cls, qtd_casas: int) -> List[Propriedade]:
-        cls.propriedades = []
-        for _ in range(qtd_casas):
-            preco = random.randint(100, 300)
-            aluguel = int(preco * cls.PORCENTAGEM_ALUGUEL)
-            cls.propriedades.append(Propriedade(preco, aluguel))
-        return cls.propriedades
+    def __init__(self, qtd_casas: int, rng=random):
+        # Estado do tabuleiro pertence à instância: cada Jogo tem o seu e
+        # partidas podem rodar em paralelo (threads/asyncio) sem locks
+        self.propriedades: List[Propriedade] = []
+        for posicao in range(qtd_casas):
+            preco = rng.randint(100, 300)
+            aluguel = int(preco * self.PORCENTAGEM_ALUGUEL)
+            self.propriedades.append(Propriedade(preco, aluguel, posicao))
 
     @classmethod
-    def jogar_dado(cls) -> int:
+    def inicializar(cls, qtd_casas: int, rng=random) -> 'Tabuleiro':
+        return cls(qtd_casas, rng)
+
+    @staticmethod
+    def jogar_dado() -> int:
         return random.randint(1, 6)
 
-    @classmethod
-    def nova_posicao(cls, atual: int, passos: int) -> int:
-        n = len(cls.propriedades)
+    def nova_posicao(self, atual: int, passos: int) -> int:
+        n = len(self.propriedades)
         return (atual + passos) % n
 
+    def __len__(self) -> int:
+        return len(self.propriedades)
+
+    def __getitem__(self, posicao: int) -> Propriedade:
+        return self.propriedades[posicao]
+
+    def __iter__(self):
+        return iter(self.propriedades)
+
+    def casas(self) -> Iterator[Tuple[int, int]]:
+        # (preço, aluguel) de cada casa, na ordem do tabuleiro
+        return ((p.preco, p.aluguel) for p in self.propriedades)
+
+
+class CasaCompacta:
+    # Casa do TabuleiroCompacto com a mesma interface de Propriedade, criada
+    # sob demanda: o tabuleiro não guarda um objeto por casa. Preço e aluguel
+    # não mudam e são copiados na criação; o dono é lido do tabuleiro. Duas
+    # visões da mesma casa são iguais, então servem de chave em
+    # Jogador.propriedades
+    __slots__ = ("tabuleiro", "posicao", "preco", "aluguel")
+
+    def __init__(self, tabuleiro: 'TabuleiroCompacto', posicao: int, preco: int):
+        self.tabuleiro = tabuleiro
+        self.posicao = posicao
+        self.preco = preco
+        self.aluguel = int(preco * tabuleiro.PORCENTAGEM_ALUGUEL)
+
+    @property
+    def id(self) -> int:
+        return self.posicao
+
+    @property
+    def proprietario(self) -> Optional[Jogador]:
+        return self.tabuleiro.donos.get(self.posicao)
+
+    @proprietario.setter
+    def proprietario(self, jogador: Optional[Jogador]):
+        if jogador is None:
+            self.tabuleiro.donos.pop(self.posicao, None)
+        else:
+            self.tabuleiro.donos[self.posicao] = jogador
+
+    def definir_proprietario(self, jogador: Jogador):
+        self.proprietario = jogador
+        jogador.adicionar_propriedade(self)
+
+    def __eq__(self, outra) -> bool:
+        return (isinstance(outra, CasaCompacta) and outra.posicao == self.posicao
+                and outra.tabuleiro is self.tabuleiro)
+
+    def __hash__(self) -> int:
+        return hash(self.posicao)
+
+    def print_infos(self):
+        from src.apresentacao import imprimir_propriedade
+        imprimir_propriedade(self)
+
+
+class TabuleiroCompacto:
+    # Modo de escala para tabuleiros enormes. Os preços ficam em blocos
+    # array('H') gerados na primeira visita, cada bloco com a própria seed
+    # derivada; os donos ficam num dict esparso posição -> jogador. A memória
+    # cresce com as casas visitadas e compradas, não com o tamanho do
+    # tabuleiro, e montar a partida não custa O(casas). Os preços seguem a
+    # mesma faixa do Tabuleiro (uniforme em 100..300), mas não são os mesmos
+    # para a mesma seed
+    __slots__ = ("qtd_casas", "seed", "donos", "_blocos")
+
+    PORCENTAGEM_ALUGUEL = Tabuleiro.PORCENTAGEM_ALUGUEL
+    BITS_BLOCO = 10
+    TAMANHO_BLOCO = 1 << BITS_BLOCO
+
+    def __init__(self, qtd_casas: int, seed: int):
+        self.qtd_casas = qtd_casas
+        self.seed = seed
+        self.donos: Dict[int, Jogador] = {}
+        self._blocos: List[Optional[array]] = [None] * -(-qtd_casas // self.TAMANHO_BLOCO)
+
+    def _bloco(self, indice: int) -> array:
+        bloco = self._blocos[indice]
+        if bloco is None:
+            tamanho = min(self.TAMANHO_BLOCO, self.qtd_casas - indice * self.TAMANHO_BLOCO)
+            # Um randbytes por bloco em vez de um randint por casa (~15x mais
+            # rápido); o viés de % 201 sobre 32 bits é da ordem de 1e-8.
+            # "<I" fixa 4 bytes little-endian: o tabuleiro de uma seed não
+            # depende da máquina
+            sorteados = struct.unpack(f"<{tamanho}I",
+                                      random.Random(derivar_seed(self.seed, indice)).randbytes(4 * tamanho))
+            bloco = self._blocos[indice] = array("H", [100 + v % 201 for v in sorteados])
+        return bloco
+
+    def preco(self, posicao: int) -> int:
+        indice = posicao >> self.BITS_BLOCO
+        return (self._blocos[indice] or self._bloco(indice))[posicao & (self.TAMANHO_BLOCO - 1)]
+
+    def aluguel(self, posicao: int) -> int:
+        return int(self.preco(posicao) * self.PORCENTAGEM_ALUGUEL)
+
+    def casas_geradas(self) -> int:
+        return sum(len(bloco) for bloco in self._blocos if bloco is not None)
+
+    def nova_posicao(self, atual: int, passos: int) -> int:
+        return (atual + passos) % self.qtd_casas
+
+    def __len__(self) -> int:
+        return self.qtd_casas
+
+    def __getitem__(self, posicao: int) -> CasaCompacta:
+        if not 0 <= posicao < self.qtd_casas:
+            raise IndexError(posicao)
+        return CasaCompacta(self, posicao, self.preco(posicao))
+
+    def __iter__(self):
+        return (self[posicao] for posicao in range(self.qtd_casas))
+
+    def casas(self) -> Iterator[Tuple[int, int]]:
+        for indice in range(len(self._blocos)):
+            for preco in self._bloco(indice):
+                yield preco, int(preco * self.PORCENTAGEM_ALUGUEL)
+
+
+class RankingSaldo:
+    # Líder por saldo (maior saldo, desempate pela ordem de turno) em O(log n)
+    # amortizado, sem ordenar todos os jogadores a cada consulta. Heap com
+    # remoção preguiçosa: alterar_saldo só anota o jogador em `marcados` (O(1)
+    # no laço quente) e as marcas entram no heap na consulta seguinte; entradas com
+    # saldo desatualizado ou de eliminados são descartadas ao chegar ao topo
+    __slots__ = ("_heap", "_ordem_index", "_vivos", "marcados")
+
+    def __init__(self, vivos: Dict[Jogador, None], ordem_index: Dict[Jogador, int]):
+        # `vivos` é o próprio dicionário do Jogo: eliminações valem na hora
+        self._vivos = vivos
+        self._ordem_index = ordem_index
+        self.marcados: Dict[Jogador, None] = {}
+        self._reconstruir()
+
+    def _reconstruir(self):
+        self._heap = [(-j.saldo, self._ordem_index[j], j) for j in self._vivos]
+        heapq.heapify(self._heap)
+        self.marcados.clear()
+
+    def lider(self) -> Optional[Jogador]:
+        if self.marcados:
+            # Entradas obsoletas se acumulam; passando do dobro dos vivos,
+            # reconstruir (O(n)) sai mais barato que carregá-las
+            if len(self._heap) + len(self.marcados) > 2 * len(self._vivos) + 16:
+                self._reconstruir()
+            else:
+                for j in self.marcados:
+                    heapq.heappush(self._heap, (-j.saldo, self._ordem_index[j], j))
+                self.marcados.clear()
+        heap = self._heap
+        while heap:
+            saldo_negativo, _, j = heap[0]
+            if j in self._vivos and j.saldo == -saldo_negativo:
+                return j
+            heapq.heappop(heap)
+        return None
+
 
 class Jogo:
     RECOMPENSA_VOLTA = 100
     MAX_RODADAS = 1000
     QTD_CASAS = 20
+    # A partir daqui o líder vem do RankingSaldo; abaixo, um min() sobre
+    # poucos vivos é mais barato que anotar cada mudança de saldo
+    JOGADORES_RANKING_INCREMENTAL = 64
+
+    def __init__(self, jogadores: List[Jogador], qtd_casas: int = QTD_CASAS,
+                 seed: Optional[int] = None, rng: Optional[random.Random] = None,
+                 max_rodadas: Optional[int] = None, recompensa_volta: Optional[int] = None,
+                 embaralhar: bool = True, compacto: bool = False):
+        if seed is None:
+            seed = nova_seed(rng or random)
+        self.seed = seed
+
+        # Fluxos independentes por finalidade: mudar a ordem dos turnos ou as
+        # decisões não altera o tabuleiro nem a sequência de dados da partida
+        self.dados = DadosEmBloco(derivar_seed(seed, "dados"))
+        self.sorteios = SorteiosEmBloco(derivar_seed(seed, "decisoes"))
 
-    def __init__(self, jogadores: List[Jogador], qtd_casas: int = QTD_CASAS):
-        self.jogadores: List[Jogador] = jogadores
         self.jogadores_iniciais: List[Jogador] = jogadores.copy()
-        random.shuffle(self.jogadores)
-        self.ordem_turnos: List[Jogador] = self.jogadores
-
-        self.tabuleiro = Tabuleiro.inicializar(qtd_casas)
+        # Sem embaralhar, a ordem dos turnos é a da lista (torneios fixam os
+        # assentos para comparar as mesmas mesas com os mesmos dados)
+        self.embaralhar = embaralhar
+        if embaralhar:
+            random.Random(derivar_seed(seed, "ordem")).shuffle(jogadores)
+        self.ordem_turnos: List[Jogador] = jogadores
+        self._ordem_index: Dict[Jogador, int] = {j: i for i, j in enumerate(jogadores)}
+
+        # Jogadores vivos na ordem dos turnos: pertinência, eliminação e
+        # contagem (len) em O(1)
+        self._vivos: Dict[Jogador, None] = dict.fromkeys(jogadores)
+        self._ranking: Optional[RankingSaldo] = None
+        if len(jogadores) >= self.JOGADORES_RANKING_INCREMENTAL:
+            self._ranking = RankingSaldo(self._vivos, self._ordem_index)
+        for j in jogadores:
+            j.marcas_saldo = self._ranking.marcados if self._ranking is not None else None
+
+        # compacto: TabuleiroCompacto para tabuleiros enormes (outros preços
+        # para a mesma seed, então é opcional e não automático)
+        self.compacto = compacto
+        if compacto:
+            self.tabuleiro = TabuleiroCompacto(qtd_casas, derivar_seed(seed, "tabuleiro"))
+        else:
+            self.tabuleiro = Tabuleiro(qtd_casas, random.Random(derivar_seed(seed, "tabuleiro")))
+        # Regras ajustáveis por partida (varreduras de parâmetros); os
+        # atributos de classe continuam sendo o padrão
+        self.max_rodadas = self.MAX_RODADAS if max_rodadas is None else max_rodadas
+        self.recompensa_volta = self.RECOMPENSA_VOLTA if recompensa_volta is None else recompensa_volta
         self.rodada = 0
         self.finished = False
         self.termino_por_tempo = False
         self.vencedor: Optional[Jogador] = None
 
+    @property
+    def jogadores(self) -> List[Jogador]:
+        return list(self._vivos)
+
+    def esta_vivo(self, jogador: Jogador) -> bool:
+        return jogador in self._vivos
+
     def pagar_aluguel(self, propriedade: Propriedade, inquilino: Jogador):
         dono = propriedade.proprietario
         if dono and dono != inquilino:
@@ -125,48 +334,57 @@ class Jogo:
 
     def remover_jogador(self, jogador: Jogador):
         jogador.limpar_propriedades()
-        if jogador in self.jogadores:
-            self.jogadores.remove(jogador)
+        self._vivos.pop(jogador, None)
 
     def jogo_finalizado(self) -> bool:
-        if len(self.jogadores) == 1:
-            self.vencedor = self.jogadores[0]
+        if len(self._vivos) == 1:
+            self.vencedor = next(iter(self._vivos))
             self.finished = True
             self.termino_por_tempo = False
             return True
 
-        if self.rodada >= self.MAX_RODADAS:
+        if self.rodada >= self.max_rodadas:
             self.termino_por_tempo = True
             self.finished = True
-            self.vencedor = self._ranking_por_saldo()[0]
+            self.vencedor = self.lider()
             return True
 
         return False
 
+    def jogar_dado(self) -> int:
+        return self.dados.jogar()
 
     def jogada(self, jogador: Jogador, numero_dado: int):
-        if self.finished or jogador not in self.jogadores:
+        if self.finished or jogador not in self._vivos:
             return
 
         pos_anterior = jogador.posicao
-        jogador.posicao = Tabuleiro.nova_posicao(jogador.posicao, numero_dado)
+        jogador.posicao = self.tabuleiro.nova_posicao(jogador.posicao, numero_dado)
         self.rodada += 1
 
         # Deu uma volta completa
         if jogador.posicao < pos_anterior:
-            jogador.alterar_saldo(self.RECOMPENSA_VOLTA)
-
-        casa = self.tabuleiro[jogador.posicao]
+            jogador.alterar_saldo(self.recompensa_volta)
 
         # Se tem dono e não é o próprio, paga aluguel
-        if casa.proprietario and casa.proprietario != jogador:
-            self.pagar_aluguel(casa, jogador)
+        if self.compacto:
+            # Dono lido direto do dict do TabuleiroCompacto: a CasaCompacta só
+            # é criada quando há aluguel a pagar
+            dono = self.tabuleiro.donos.get(jogador.posicao)
+            if dono is not None and dono != jogador:
+                self.pagar_aluguel(self.tabuleiro[jogador.posicao], jogador)
+        else:
+            casa = self.tabuleiro[jogador.posicao]
+            if casa.proprietario and casa.proprietario != jogador:
+                self.pagar_aluguel(casa, jogador)
 
         self.jogo_finalizado()
 
     def comprar_propiedade(self, jogador: Jogador) -> bool:
-        if self.finished or jogador not in self.jogadores:
+        if self.finished or jogador not in self._vivos:
             return False
+        if self.compacto:
+            return self._comprar_compacto(jogador)
 
         prop = self.tabuleiro[jogador.posicao]
         if prop.proprietario is not None:
@@ -175,59 +393,63 @@ class Jogo:
         if jogador.saldo < prop.preco:
             return False
 
-        if not jogador.estrategia.decide_compra(jogador, prop):
+        if jogador.regra is not None:
+            decide = jogador.regra.avaliar(jogador.saldo, prop.preco, prop.aluguel, self.sorteios)
+        else:
+            decide = jogador.estrategia.decide_compra(jogador, prop)
+        if not decide:
             return False
 
         jogador.alterar_saldo(-prop.preco)
         prop.definir_proprietario(jogador)
         return True
 
+    def _comprar_compacto(self, jogador: Jogador) -> bool:
+        # Mesmas regras de comprar_propiedade com preço e dono lidos do
+        # TabuleiroCompacto; a CasaCompacta só é criada para o decide_compra
+        # ou quando a compra acontece
+        tabuleiro = self.tabuleiro
+        posicao = jogador.posicao
+        if posicao in tabuleiro.donos:
+            return False
+
+        preco = tabuleiro.preco(posicao)
+        if jogador.saldo < preco:
+            return False
+
+        if jogador.regra is not None:
+            aluguel = int(preco * tabuleiro.PORCENTAGEM_ALUGUEL)
+            decide = jogador.regra.avaliar(jogador.saldo, preco, aluguel, self.sorteios)
+        else:
+            decide = jogador.estrategia.decide_compra(jogador, tabuleiro[posicao])
+        if not decide:
+            return False
+
+        jogador.alterar_saldo(-preco)
+        CasaCompacta(tabuleiro, posicao, preco).definir_proprietario(jogador)
+        return True
+
     def print_infos(self):
-        console.print(
-            f"\n[bold magenta]═══════════════════════════════════════[/bold magenta]")
-        console.print(
-            f"[bold magenta]        ESTADO DO JOGO - Rodada {self.rodada}[/bold magenta]")
-        console.print(
-            f"[bold magenta]═══════════════════════════════════════[/bold magenta]\n")
-
-        console.print("[bold blue]👥 JOGADORES:[/bold blue]\n")
-        for jogador in self.jogadores:
-            jogador.print_infos()
-            console.print()
-
-        console.print(
-            "\n[bold blue]🏘️  TABULEIRO (Propriedades):[/bold blue]\n")
-
-        tabela = Table(show_header=True, header_style="bold magenta")
-        tabela.add_column("ID", style="dim", width=6)
-        tabela.add_column("Preço", justify="right")
-        tabela.add_column("Aluguel", justify="right")
-        tabela.add_column("Proprietário", justify="center")
-
-        for prop in self.tabuleiro:
-            proprietario_info = f"Jogador #{prop.proprietario.id}" if prop.proprietario else "Disponível"
-            tabela.add_row(
-                f"#{prop.id}",
-                f"${prop.preco}",
-                f"${prop.aluguel}",
-                proprietario_info
-            )
-
-        console.print(tabela)
+        from src.apresentacao import imprimir_jogo
+        imprimir_jogo(self)
 
-    def _ranking_por_saldo(self) -> List[Jogador]:
-        ordem_index = {j: i for i, j in enumerate(self.ordem_turnos)}
+    def _chave_ranking(self, j: Jogador) -> Tuple[int, int]:
+        # Maior saldo primeiro e desempate por ordem de turno inicial
+        return -j.saldo, self._ordem_index.get(j, 9999)
 
-        def chave(j: Jogador) -> Tuple[int, int]:
-            # Maior saldo primeiro e desempate por ordem de turno inicial
-            return -j.saldo, ordem_index.get(j, 9999)
+    def lider(self) -> Optional[Jogador]:
+        if self._ranking is not None:
+            return self._ranking.lider()
+        return min(self._vivos, key=self._chave_ranking, default=None)
 
-        return sorted(self.jogadores, key=chave)
+    def _ranking_por_saldo(self) -> List[Jogador]:
+        # Classificação completa, O(n log n): só para exibir o resultado. O
+        # vencedor e o fim de jogo usam lider()
+        return sorted(self._vivos, key=self._chave_ranking)
 
     def resultado(self) -> Dict[str, object]:
-        ranking = self._ranking_por_saldo()
-        vencedor_nome = ranking[0].nome_estrategia(
-        ) if ranking else "sem_vencedor"
+        lider = self.lider()
+        vencedor_nome = lider.nome_estrategia() if lider else "sem_vencedor"
         jogadores_nomes = [j.nome_estrategia() for j in self.jogadores_iniciais]
         return {
             "vencedor": vencedor_nome,
@@ -237,46 +459,19 @@ class Jogo:
         }
 
     def print_result(self):
-        console.print("\n[bold green]📊 RESULTADO DA PARTIDA[/bold green]")
+        from src.apresentacao import imprimir_resultado
 
-        if self.vencedor is None and self.jogadores:
-            self.vencedor = self._ranking_por_saldo()[0]
-
-        if self.vencedor:
-            console.print(
-                f"🏆 Vencedor: [bold yellow]{self.vencedor.nome_estrategia().upper()}[/bold yellow] "
-                f"(Jogador #{self.vencedor.id})"
-            )
-        else:
-            console.print("Sem vencedor definido.")
-
-        if self.termino_por_tempo:
-            console.print(
-                "⏱️ Jogo terminou por limite de 1000 rodadas.")
-
-        console.print(f"🔁 Total de rodadas: [bold]{self.rodada}[/bold]\n")
-
-        ranking = self._ranking_por_saldo()
-        tabela = Table(show_header=True, header_style="bold magenta")
-        tabela.add_column("Posição", justify="right")
-        tabela.add_column("Jogador", justify="left")
-        tabela.add_column("Estratégia", justify="left")
-        tabela.add_column("Saldo", justify="right")
-
-        for i, j in enumerate(ranking, start=1):
-            tabela.add_row(
-                f"{i}",
-                f"#{j.id}",
-                j.nome_estrategia(),
-                f"${j.saldo}"
-            )
-        console.print(tabela)
+        if self.vencedor is None and self._vivos:
+            self.vencedor = self.lider()
+        imprimir_resultado(self, self._ranking_por_saldo())
 
 
 # =========================
 # Simulador para testes
 # =========================
 def simulation_test():
+    from src.apresentacao import console
+
     console.print(
         "[bold green]🎮 Iniciando Simulação do Jogo...[/bold green]\n")
 
@@ -312,11 +507,11 @@ def simulation_test():
             if jogo.finished:
                 break
 
-            dado = Tabuleiro.jogar_dado()
+            dado = jogo.jogar_dado()
             jogo.jogada(jogador, dado)
 
             # Se o jogador não foi eliminado, tenta comprar pela estratégia
-            if not jogo.finished and jogador in jogo.jogadores:
+            if not jogo.finished and jogo.esta_vivo(jogador):
                 jogo.comprar_propiedade(jogador)
 
     jogo.print_infos()
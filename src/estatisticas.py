@@ -0,0 +1,94 @@
+from typing import Dict, Iterable, Optional
+
+
+class Agregado:
+    PERCENTIS = (50, 90, 95, 99)
+
+    def __init__(self):
+        self.jogos = 0
+        self.vitorias: Dict[str, int] = {}
+        self.terminos_por_tempo = 0
+        self.soma_rodadas = 0
+        # Histograma em vez da lista de rodadas: memória limitada por MAX_RODADAS
+        # e percentis exatos mesmo depois de mesclar lotes
+        self.histograma_rodadas: Dict[int, int] = {}
+
+    def adicionar(self, resultado: Dict[str, object]):
+        self.jogos += 1
+
+        for nome in resultado["jogadores"]:
+            if nome not in self.vitorias:
+                self.vitorias[nome] = 0
+        vencedor = resultado["vencedor"]
+        self.vitorias[vencedor] = self.vitorias.get(vencedor, 0) + 1
+
+        if resultado["termino_por_tempo"]:
+            self.terminos_por_tempo += 1
+
+        rodadas = resultado["rodadas"]
+        self.soma_rodadas += rodadas
+        self.histograma_rodadas[rodadas] = self.histograma_rodadas.get(rodadas, 0) + 1
+
+    def adicionar_todos(self, resultados: Iterable[Dict[str, object]]):
+        for resultado in resultados:
+            self.adicionar(resultado)
+
+    def mesclar(self, outro: 'Agregado') -> 'Agregado':
+        self.jogos += outro.jogos
+        for nome, qtd in outro.vitorias.items():
+            self.vitorias[nome] = self.vitorias.get(nome, 0) + qtd
+        self.terminos_por_tempo += outro.terminos_por_tempo
+        self.soma_rodadas += outro.soma_rodadas
+        for rodadas, qtd in outro.histograma_rodadas.items():
+            self.histograma_rodadas[rodadas] = self.histograma_rodadas.get(rodadas, 0) + qtd
+        return self
+
+    def para_dict(self) -> Dict[str, object]:
+        # Estado completo e serializável em JSON (checkpoints); chaves do
+        # histograma viram texto
+        return {
+            "jogos": self.jogos,
+            "vitorias": dict(self.vitorias),
+            "terminos_por_tempo": self.terminos_por_tempo,
+            "soma_rodadas": self.soma_rodadas,
+            "histograma_rodadas": {str(r): qtd for r, qtd in self.histograma_rodadas.items()},
+        }
+
+    @classmethod
+    def de_dict(cls, dados: Dict[str, object]) -> 'Agregado':
+        agregado = cls()
+        agregado.jogos = dados["jogos"]
+        agregado.vitorias = dict(dados["vitorias"])
+        agregado.terminos_por_tempo = dados["terminos_por_tempo"]
+        agregado.soma_rodadas = dados["soma_rodadas"]
+        agregado.histograma_rodadas = {int(r): qtd for r, qtd in dados["histograma_rodadas"].items()}
+        return agregado
+
+    def percentil(self, p: float) -> Optional[int]:
+        if not self.jogos:
+            return None
+
+        # Nearest-rank sobre o histograma
+        alvo = max(1, -(-self.jogos * p // 100))
+        acumulado = 0
+        for rodadas in sorted(self.histograma_rodadas):
+            acumulado += self.histograma_rodadas[rodadas]
+            if acumulado >= alvo:
+                return rodadas
+        return max(self.histograma_rodadas)
+
+    def resumo(self) -> Dict[str, object]:
+        rodadas: Dict[str, object] = {
+            "media": self.soma_rodadas / self.jogos if self.jogos else None,
+            "min": min(self.histograma_rodadas) if self.jogos else None,
+            "max": max(self.histograma_rodadas) if self.jogos else None,
+        }
+        for p in self.PERCENTIS:
+            rodadas[f"p{p}"] = self.percentil(p)
+
+        return {
+            "jogos": self.jogos,
+            "vitorias": dict(sorted(self.vitorias.items(), key=lambda kv: -kv[1])),
+            "taxa_termino_por_tempo": self.terminos_por_tempo / self.jogos if self.jogos else 0.0,
+            "rodadas": rodadas,
+        }
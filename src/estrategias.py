@@ -1,37 +1,77 @@
 import random
 from abc import ABC
+from typing import Optional
+
+
+class RegraCompra:
+    __slots__ = ("aluguel_minimo", "reserva_minima", "probabilidade")
+
+    # Decisão de compra em forma declarativa: compra se o aluguel for maior
+    # que aluguel_minimo, se sobrar ao menos reserva_minima após pagar e com
+    # a probabilidade informada. Motores em lote avaliam a regra para muitos
+    # jogadores de uma vez em vez de chamar decide_compra por casa
+    def __init__(self, aluguel_minimo: Optional[int] = None, reserva_minima: Optional[int] = None,
+                 probabilidade: float = 1.0):
+        self.aluguel_minimo = aluguel_minimo
+        self.reserva_minima = reserva_minima
+        self.probabilidade = probabilidade
+
+    def avaliar(self, saldo: int, preco: int, aluguel: int, rng=random) -> bool:
+        if self.aluguel_minimo is not None and aluguel <= self.aluguel_minimo:
+            return False
+        if self.reserva_minima is not None and saldo - preco < self.reserva_minima:
+            return False
+        return self.probabilidade >= 1.0 or rng.random() < self.probabilidade
+
+    def __repr__(self) -> str:
+        return (f"RegraCompra(aluguel_minimo={self.aluguel_minimo}, "
+                f"reserva_minima={self.reserva_minima}, probabilidade={self.probabilidade})")
+
 
 class Estrategia(ABC):
+    __slots__ = ()
+
     nome: str = "generica"
-    
-    @classmethod
+    regra: Optional[RegraCompra] = None
+
     def decide_compra(self, jogador: 'Jogador', propriedade: 'Propriedade') -> bool:
-        return False
+        if self.regra is None:
+            return False
+        return self.regra.avaliar(jogador.saldo, propriedade.preco, propriedade.aluguel)
+
+    @classmethod
+    def regra_declarada(cls) -> Optional[RegraCompra]:
+        # Estratégias que sobrescrevem decide_compra continuam sendo chamadas
+        # método a método, mesmo que herdem uma regra
+        if cls.decide_compra is not Estrategia.decide_compra:
+            return None
+        return cls.regra
 
 
 class Impulsivo(Estrategia):
+    __slots__ = ()
     nome = "impulsivo"
-
-    def decide_compra(self, jogador: 'Jogador', propriedade: 'Propriedade') -> bool:
-        return True
+    regra = RegraCompra()
 
 
 class Exigente(Estrategia):
+    __slots__ = ()
     nome = "exigente"
-
-    def decide_compra(self, jogador: 'Jogador', propriedade: 'Propriedade') -> bool:
-        return propriedade.aluguel > 50
+    # Compra se o aluguel for maior que 50
+    regra = RegraCompra(aluguel_minimo=50)
 
 
 class Cauteloso(Estrategia):
+    __slots__ = ()
     nome = "cauteloso"
-
-    def decide_compra(self, jogador: 'Jogador', propriedade: 'Propriedade') -> bool:
-        return (jogador.saldo - propriedade.preco) >= 80
+    # Compra se sobrarem ao menos 80 de saldo após a compra
+    regra = RegraCompra(reserva_minima=80)
 
 
 class Aleatorio(Estrategia):
+    __slots__ = ()
     nome = "aleatorio"
+    regra = RegraCompra(probabilidade=0.5)
 
-    def decide_compra(self, jogador: 'Jogador', propriedade: 'Propriedade') -> bool:
-        return random.choice([True, False])
+
+ESTRATEGIAS = {cls.nome: cls for cls in (Impulsivo, Exigente, Cauteloso, Aleatorio)}
@@ -0,0 +1,254 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from src.core import Jogo, Jogador, Propriedade
+
+FASES = ("dado", "jogada", "aluguel", "compra", "eliminacao", "ranking")
+
+
+class JogoInstrumentado(Jogo):
+    # Mede chamadas e tempo de cada fase. Os tempos são inclusivos: "jogada"
+    # já contém o "aluguel" e a "eliminacao" que ela dispara. Partidas comuns
+    # usam Jogo diretamente e não pagam nada por isso
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.contadores: Dict[str, List[int]] = {fase: [0, 0] for fase in FASES}
+
+    def _registrar(self, fase: str, inicio: int):
+        contador = self.contadores[fase]
+        contador[0] += 1
+        contador[1] += time.perf_counter_ns() - inicio
+
+    def jogar_dado(self) -> int:
+        inicio = time.perf_counter_ns()
+        dado = super().jogar_dado()
+        self._registrar("dado", inicio)
+        return dado
+
+    def jogada(self, jogador: Jogador, numero_dado: int):
+        inicio = time.perf_counter_ns()
+        super().jogada(jogador, numero_dado)
+        self._registrar("jogada", inicio)
+
+    def pagar_aluguel(self, propriedade: Propriedade, inquilino: Jogador):
+        inicio = time.perf_counter_ns()
+        super().pagar_aluguel(propriedade, inquilino)
+        self._registrar("aluguel", inicio)
+
+    def comprar_propiedade(self, jogador: Jogador) -> bool:
+        inicio = time.perf_counter_ns()
+        comprou = super().comprar_propiedade(jogador)
+        self._registrar("compra", inicio)
+        return comprou
+
+    def remover_jogador(self, jogador: Jogador):
+        inicio = time.perf_counter_ns()
+        super().remover_jogador(jogador)
+        self._registrar("eliminacao", inicio)
+
+    def _ranking_por_saldo(self) -> List[Jogador]:
+        inicio = time.perf_counter_ns()
+        ranking = super()._ranking_por_saldo()
+        self._registrar("ranking", inicio)
+        return ranking
+
+    def lider(self) -> Optional[Jogador]:
+        inicio = time.perf_counter_ns()
+        lider = super().lider()
+        self._registrar("ranking", inicio)
+        return lider
+
+
+class Metricas:
+    # Totais acumulados entre partidas. Cada JogoInstrumentado conta
+    # localmente e só toca o lock uma vez, ao terminar
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        with self._lock:
+            self.jogos = 0
+            self.rodadas = 0
+            self.tempo_partidas_ns = 0
+            self.fases: Dict[str, List[int]] = {fase: [0, 0] for fase in FASES}
+
+    def registrar_jogo(self, jogo: JogoInstrumentado, duracao_ns: int):
+        with self._lock:
+            self.jogos += 1
+            self.rodadas += jogo.rodada
+            self.tempo_partidas_ns += duracao_ns
+            for fase, (chamadas, ns) in jogo.contadores.items():
+                total = self.fases[fase]
+                total[0] += chamadas
+                total[1] += ns
+
+    def estado(self) -> Dict[str, object]:
+        # Totais brutos, serializáveis: workers de processo devolvem isto e o
+        # processo principal acumula nas métricas dele
+        with self._lock:
+            return {"jogos": self.jogos, "rodadas": self.rodadas, "tempo_partidas_ns": self.tempo_partidas_ns,
+                    "fases": {fase: list(valores) for fase, valores in self.fases.items()}}
+
+    def acumular(self, estado: Dict[str, object]):
+        with self._lock:
+            self.jogos += estado["jogos"]
+            self.rodadas += estado["rodadas"]
+            self.tempo_partidas_ns += estado["tempo_partidas_ns"]
+            for fase, (chamadas, ns) in estado["fases"].items():
+                total = self.fases[fase]
+                total[0] += chamadas
+                total[1] += ns
+
+    def resumo(self) -> Dict[str, object]:
+        with self._lock:
+            fases = {}
+            for fase, (chamadas, ns) in self.fases.items():
+                fases[fase] = {
+                    "chamadas": chamadas,
+                    "tempo_total_segundos": ns / 1e9,
+                    "ns_por_chamada": ns / chamadas if chamadas else None,
+                    "fracao_do_tempo": ns / self.tempo_partidas_ns if self.tempo_partidas_ns else None,
+                }
+            return {
+                "jogos": self.jogos,
+                "rodadas": self.rodadas,
+                "tempo_partidas_segundos": self.tempo_partidas_ns / 1e9,
+                "fases": fases,
+            }
+
+    def prometheus(self, prefixo: str = "simulador") -> str:
+        resumo = self.resumo()
+        linhas = [
+            f"# TYPE {prefixo}_jogos_total counter",
+            f"{prefixo}_jogos_total {resumo['jogos']}",
+            f"# TYPE {prefixo}_rodadas_total counter",
+            f"{prefixo}_rodadas_total {resumo['rodadas']}",
+            f"# TYPE {prefixo}_partidas_segundos_total counter",
+            f"{prefixo}_partidas_segundos_total {resumo['tempo_partidas_segundos']}",
+            f"# TYPE {prefixo}_fase_chamadas_total counter",
+        ]
+        linhas += [f'{prefixo}_fase_chamadas_total{{fase="{fase}"}} {dados["chamadas"]}'
+                   for fase, dados in resumo["fases"].items()]
+        linhas.append(f"# TYPE {prefixo}_fase_segundos_total counter")
+        linhas += [f'{prefixo}_fase_segundos_total{{fase="{fase}"}} {dados["tempo_total_segundos"]}'
+                   for fase, dados in resumo["fases"].items()]
+        return "\n".join(linhas) + "\n"
+
+
+def _nome_funcao(arquivo: str, linha: int, funcao: str) -> str:
+    return f"{funcao} ({arquivo}:{linha})"
+
+
+def _perfil_cprofile(executar: Callable[[], object], top: int) -> List[Dict[str, object]]:
+    # Import tardio: cProfile/pstats só quando o modo é usado, não no import
+    # de src.controller
+    import cProfile
+    import pstats
+
+    perfil = cProfile.Profile()
+    perfil.runcall(executar)
+    estatisticas = pstats.Stats(perfil).stats
+    linhas = [
+        {
+            "funcao": _nome_funcao(*chave),
+            "chamadas": chamadas,
+            "tempo_proprio_segundos": proprio,
+            "tempo_acumulado_segundos": acumulado,
+        }
+        for chave, (_, chamadas, proprio, acumulado, _) in estatisticas.items()
+    ]
+    linhas.sort(key=lambda linha: linha["tempo_proprio_segundos"], reverse=True)
+    return linhas[:top]
+
+
+def _perfil_amostragem(executar: Callable[[], object], top: int, intervalo: float) -> List[Dict[str, object]]:
+    # Amostrador de pilha em outra thread: bem menos intrusivo que o cProfile,
+    # ao custo de precisão estatística. Conta a função no topo da pilha
+    # (tempo próprio) e todas as da pilha (tempo acumulado)
+    alvo = threading.get_ident()
+    proprias: Counter = Counter()
+    acumuladas: Counter = Counter()
+    amostras = 0
+    parar = threading.Event()
+
+    def amostrar():
+        nonlocal amostras
+        while not parar.wait(intervalo):
+            quadro = sys._current_frames().get(alvo)
+            if quadro is None:
+                continue
+            amostras += 1
+            codigo = quadro.f_code
+            proprias[_nome_funcao(codigo.co_filename, codigo.co_firstlineno, codigo.co_name)] += 1
+            vistas = set()
+            while quadro is not None:
+                codigo = quadro.f_code
+                vistas.add(_nome_funcao(codigo.co_filename, codigo.co_firstlineno, codigo.co_name))
+                quadro = quadro.f_back
+            acumuladas.update(vistas)
+
+    amostrador = threading.Thread(target=amostrar, daemon=True)
+    amostrador.start()
+    try:
+        executar()
+    finally:
+        parar.set()
+        amostrador.join()
+
+    return [
+        {
+            "funcao": funcao,
+            "amostras_proprias": qtd,
+            "amostras_acumuladas": acumuladas[funcao],
+            "fracao_propria": qtd / amostras,
+        }
+        for funcao, qtd in proprias.most_common(top)
+    ]
+
+
+def perfilar_lote(n: int, qtd_casas: int = 20, jogadores: int = 4, seed: Optional[int] = None,
+                  modo: str = "cprofile", top: int = 25, intervalo: float = 0.001) -> Dict[str, object]:
+    # Sem JogoInstrumentado: os contadores de fase apareceriam no perfil
+    from src.controller import simular_lote
+
+    def executar():
+        simular_lote(n, qtd_casas, jogadores, seed=seed)
+
+    inicio = time.perf_counter()
+    if modo == "cprofile":
+        funcoes = _perfil_cprofile(executar, top)
+    elif modo == "amostragem":
+        funcoes = _perfil_amostragem(executar, top, intervalo)
+    else:
+        raise ValueError(f"modo de perfil desconhecido: {modo}")
+
+    return {
+        "modo": modo,
+        "jogos": n,
+        "duracao_segundos": time.perf_counter() - inicio,
+        "funcoes": funcoes,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfila um lote de partidas e imprime fases e funções mais caras.")
+    parser.add_argument("-n", "--jogos", type=int, default=2000)
+    parser.add_argument("--qtd-casas", type=int, default=20)
+    parser.add_argument("--jogadores", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--modo", choices=("cprofile", "amostragem"), default="cprofile")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args(argv)
+
+    perfil = perfilar_lote(args.jogos, args.qtd_casas, args.jogadores, args.seed, args.modo, args.top)
+    print(json.dumps(perfil, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
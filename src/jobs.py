@@ -0,0 +1,175 @@
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.estatisticas import Agregado
+from src.runner import TAMANHO_FATIA, iterar_fatias
+
+
+class FilaCheia(Exception):
+    pass
+
+
+class Job:
+    NA_FILA = "na_fila"
+    EXECUTANDO = "executando"
+    CONCLUIDO = "concluido"
+    CANCELADO = "cancelado"
+    ERRO = "erro"
+    FINAIS = (CONCLUIDO, CANCELADO, ERRO)
+
+    def __init__(self, n: int, qtd_casas: int = 20, jogadores: int = 4,
+                 seed: Optional[int] = None, motor: str = "objetos"):
+        self.id = uuid.uuid4().hex
+        self.n = n
+        self.qtd_casas = qtd_casas
+        self.jogadores = jogadores
+        self.seed = random.SystemRandom().getrandbits(63) if seed is None else seed
+        self.motor = motor
+
+        self.estado = self.NA_FILA
+        self.erro: Optional[str] = None
+        self.agregado = Agregado()
+        self.criado_em = time.time()
+        self.iniciado_em: Optional[float] = None
+        self.concluido_em: Optional[float] = None
+
+        self._cancelar = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def finalizado(self) -> bool:
+        return self.estado in self.FINAIS
+
+    def cancelar(self):
+        self._cancelar.set()
+        with self._lock:
+            if self.estado == self.NA_FILA:
+                self.estado = self.CANCELADO
+                self.concluido_em = time.time()
+
+    def _mesclar(self, parcial: Agregado):
+        with self._lock:
+            self.agregado.mesclar(parcial)
+
+    def _eta(self) -> Optional[float]:
+        if self.estado != self.EXECUTANDO or not self.agregado.jogos:
+            return None
+        decorrido = time.time() - self.iniciado_em
+        return decorrido / self.agregado.jogos * (self.n - self.agregado.jogos)
+
+    def progresso(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "id": self.id,
+                "estado": self.estado,
+                "parametros": {
+                    "n": self.n,
+                    "qtd_casas": self.qtd_casas,
+                    "jogadores": self.jogadores,
+                    "seed": self.seed,
+                    "motor": self.motor,
+                },
+                "jogos_concluidos": self.agregado.jogos,
+                "eta_segundos": self._eta(),
+                "parcial": self.agregado.resumo(),
+                "erro": self.erro,
+            }
+
+    def resultado(self) -> Dict[str, object]:
+        with self._lock:
+            resposta = self.agregado.resumo()
+            duracao = (self.concluido_em or time.time()) - (self.iniciado_em or self.criado_em)
+            resposta["seed"] = self.seed
+            resposta["duracao_segundos"] = duracao
+            resposta["jogos_por_segundo"] = self.agregado.jogos / duracao if duracao > 0 else None
+            return resposta
+
+
+class GerenciadorJobs:
+    # Jobs rodam numa thread do pool local (no máximo max_concorrentes ao mesmo
+    # tempo, com até max_fila esperando) e distribuem as fatias num pool de
+    # processos compartilhado. Nada depende de broker externo
+    def __init__(self, max_concorrentes: int = 2, max_fila: int = 16, processos: Optional[int] = None,
+                 tamanho_fatia: int = TAMANHO_FATIA, max_historico: int = 100):
+        self.max_concorrentes = max_concorrentes
+        self.max_fila = max_fila
+        self.processos = processos
+        self.tamanho_fatia = tamanho_fatia
+        self.max_historico = max_historico
+
+        self._threads = ThreadPoolExecutor(max_workers=max_concorrentes, thread_name_prefix="job")
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _pool_processos(self) -> Optional[ProcessPoolExecutor]:
+        if self.processos == 1:
+            return None
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.processos)
+            return self._pool
+
+    def _descartar_antigos(self):
+        finalizados = [job_id for job_id, job in self._jobs.items() if job.finalizado]
+        for job_id in finalizados[:max(0, len(self._jobs) - self.max_historico)]:
+            del self._jobs[job_id]
+
+    def submeter(self, job: Job) -> Job:
+        with self._lock:
+            pendentes = sum(1 for j in self._jobs.values() if not j.finalizado)
+            if pendentes >= self.max_concorrentes + self.max_fila:
+                raise FilaCheia(f"Fila de jobs cheia ({pendentes} pendentes)")
+            self._descartar_antigos()
+            self._jobs[job.id] = job
+
+        self._threads.submit(self._executar, job)
+        return job
+
+    def obter(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancelar(self, job_id: str) -> Optional[Job]:
+        job = self.obter(job_id)
+        if job is not None:
+            job.cancelar()
+        return job
+
+    def _executar(self, job: Job):
+        with job._lock:
+            if job.estado != Job.NA_FILA:
+                return
+            job.estado = Job.EXECUTANDO
+            job.iniciado_em = time.time()
+
+        fatias = iterar_fatias(job.n, job.qtd_casas, job.jogadores, job.seed,
+                               self._pool_processos(), self.tamanho_fatia, job.motor)
+        try:
+            for parcial in fatias:
+                job._mesclar(parcial)
+                if job._cancelar.is_set():
+                    break
+            estado = Job.CANCELADO if job._cancelar.is_set() else Job.CONCLUIDO
+            erro = None
+        except Exception as e:
+            estado, erro = Job.ERRO, str(e)
+        finally:
+            fatias.close()
+
+        with job._lock:
+            job.estado = estado
+            job.erro = erro
+            job.concluido_em = time.time()
+
+    def encerrar(self):
+        for job in list(self._jobs.values()):
+            job.cancelar()
+        self._threads.shutdown(wait=True)
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
@@ -0,0 +1,123 @@
+import random
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+
+from src.aleatoriedade import derivar_seed
+from src.core import Jogador, Jogo, Tabuleiro
+from src.estrategias import Aleatorio, Cauteloso, Estrategia, Exigente, Impulsivo
+
+FACES = 6
+
+
+def tabuleiro_da_seed(qtd_casas: int, seed: int) -> Tabuleiro:
+    # Mesmo tabuleiro que Jogo monta para a partida com essa seed
+    return Tabuleiro.inicializar(qtd_casas, random.Random(derivar_seed(seed, "tabuleiro")))
+
+
+def _nucleo(qtd_casas: int) -> np.ndarray:
+    # Probabilidade de avançar k casas em um lance de Tabuleiro.nova_posicao:
+    # (atual + k) % n, k = 1..6 (tabuleiros com menos de 6 casas acumulam)
+    nucleo = np.zeros(qtd_casas)
+    for k in range(1, FACES + 1):
+        nucleo[k % qtd_casas] += 1.0 / FACES
+    return nucleo
+
+
+def distribuicao_estacionaria(qtd_casas: int) -> np.ndarray:
+    # A matriz de transição é circulante (cada linha é a anterior deslocada),
+    # logo duplamente estocástica: a distribuição estacionária é uniforme
+    return np.full(qtd_casas, 1.0 / qtd_casas)
+
+
+def visitas_esperadas(qtd_casas: int, turnos: int, inicio: int = 0) -> np.ndarray:
+    # Número esperado de vezes que um jogador que começa em `inicio` cai em
+    # cada casa nos primeiros `turnos` lances. Diferente da estacionária, o
+    # regime transiente favorece as casas a até ~2 voltas da saída.
+    # Um lance é uma convolução circular com o núcleo do dado; na base de
+    # Fourier vira produto, e a soma dos `turnos` lances é uma série
+    # geométrica: custo O(n log n), independente de `turnos`
+    autovalores = np.fft.fft(_nucleo(qtd_casas))
+    soma = np.empty_like(autovalores)
+    unitarios = np.isclose(autovalores, 1.0)
+    soma[unitarios] = turnos
+    z = autovalores[~unitarios]
+    soma[~unitarios] = z * (1 - z ** turnos) / (1 - z)
+    visitas = np.fft.ifft(soma).real
+    return np.roll(np.clip(visitas, 0.0, None), inicio)
+
+
+def lances_por_volta(qtd_casas: int) -> Optional[float]:
+    # Lances por volta como o Jogo conta a volta (bônus quando a nova posição
+    # fica abaixo da anterior), com a posição na estacionária (uniforme).
+    # Com n > 6 a chance de virar num lance é 3.5 / n, então são n / 3.5
+    # lances. Com n <= 6 um lance pode dar a volta inteira e parar na mesma
+    # casa ou adiante dela, sem bônus; com 1 casa nunca há volta
+    viradas = sum((atual + k) % qtd_casas < atual for atual in range(qtd_casas) for k in range(1, FACES + 1))
+    return qtd_casas * FACES / viradas if viradas else None
+
+
+def _probabilidade_compra(estrategia: Type[Estrategia], preco: int, aluguel: int, saldo: int) -> float:
+    regra = estrategia.regra_declarada()
+    if regra is None or saldo < preco:
+        return 0.0
+    if regra.aluguel_minimo is not None and aluguel <= regra.aluguel_minimo:
+        return 0.0
+    if regra.reserva_minima is not None and saldo - preco < regra.reserva_minima:
+        return 0.0
+    return min(1.0, regra.probabilidade)
+
+
+def analisar(tabuleiro: Tabuleiro, jogadores: int = 4, turnos: Optional[int] = None,
+             estrategias: Optional[List[Type[Estrategia]]] = None) -> Dict[str, object]:
+    # Renda esperada de cada casa se comprada no início, ignorando
+    # eliminações: visitas esperadas de cada adversário x aluguel
+    n = len(tabuleiro)
+    turnos = Jogo.MAX_RODADAS // max(1, jogadores) if turnos is None else turnos
+    adversarios = max(0, jogadores - 1)
+    precos = np.array([p.preco for p in tabuleiro], dtype=float)
+    alugueis = np.array([p.aluguel for p in tabuleiro], dtype=float)
+
+    estacionaria = distribuicao_estacionaria(n)
+    visitas = visitas_esperadas(n, turnos)
+    lances = lances_por_volta(n)
+    renda_por_volta = alugueis * estacionaria * lances if lances is not None else None
+    renda_horizonte = alugueis * visitas * adversarios
+    renda_por_rodada = alugueis * estacionaria * adversarios
+
+    casas = []
+    for i in range(n):
+        casas.append({
+            "casa": i,
+            "preco": int(precos[i]),
+            "aluguel": int(alugueis[i]),
+            "probabilidade_estacionaria": float(estacionaria[i]),
+            "visitas_esperadas": float(visitas[i]),
+            "renda_por_volta_adversario": float(renda_por_volta[i]) if renda_por_volta is not None else None,
+            "renda_esperada_horizonte": float(renda_horizonte[i]),
+            "retorno_sobre_preco": float(renda_horizonte[i] / precos[i]),
+            "rodadas_para_pagar": float(precos[i] / renda_por_rodada[i]) if renda_por_rodada[i] else None,
+        })
+
+    comparacao = {}
+    for estrategia in estrategias or [Impulsivo, Exigente, Cauteloso, Aleatorio]:
+        # Prefiltro estático: compra avaliada com o saldo inicial, sem a
+        # dinâmica de saldo da partida
+        probabilidades = np.array([
+            _probabilidade_compra(estrategia, int(precos[i]), int(alugueis[i]), Jogador.SALDO_INICIAL)
+            for i in range(n)
+        ])
+        comparacao[estrategia.nome] = {
+            "casas_elegiveis": float(probabilidades.sum()),
+            "renda_esperada_horizonte": float((probabilidades * renda_horizonte).sum()),
+            "custo_esperado": float((probabilidades * precos).sum()),
+        }
+
+    return {
+        "qtd_casas": n,
+        "jogadores": jogadores,
+        "turnos_por_jogador": turnos,
+        "casas": casas,
+        "ranking_renda": [c["casa"] for c in sorted(casas, key=lambda c: -c["renda_esperada_horizonte"])],
+        "estrategias": comparacao,
+    }
@@ -0,0 +1,348 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from src.aleatoriedade import derivar_seed
+from src.core import Jogo, Jogador, Propriedade
+
+# Formato de uma partida gravada (little-endian):
+#   cabeçalho   CABECALHO
+#   jogadores   qtd_jogadores x NOME (estratégia, na ordem de jogadores_iniciais)
+#   casas       qtd_casas x CASA (preço, aluguel)
+#   eventos     qtd_eventos x EVENTO
+# Eventos têm largura fixa: o evento i está em inicio + i * EVENTO.size e um
+# arquivo com milhões de partidas pode ser lido por mmap sem carregar nada
+MAGICO = b"JOGO"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sBxHQIiI")
+NOME = struct.Struct("<16s")
+CASA = struct.Struct("<ii")
+EVENTO = struct.Struct("<BxHIi")
+
+# Tipos de evento e significado de (jogador, casa, valor)
+JOGADA = 1       # jogador rolou valor e foi para casa
+VOLTA = 2        # jogador recebeu valor por completar uma volta
+ALUGUEL = 3      # jogador pagou valor ao dono da casa
+COMPRA = 4       # jogador comprou a casa por valor
+ELIMINACAO = 5   # jogador saiu da partida e suas casas voltaram ao banco
+FIM = 6          # jogador venceu na rodada casa; valor 1 se terminou por tempo
+
+NOMES_EVENTOS = {JOGADA: "jogada", VOLTA: "volta", ALUGUEL: "aluguel", COMPRA: "compra",
+                 ELIMINACAO: "eliminacao", FIM: "fim"}
+
+
+class Evento(NamedTuple):
+    tipo: int
+    jogador: int
+    casa: int
+    valor: int
+
+
+class JogoGravado(Jogo):
+    # Registra cada evento da partida em um buffer binário. Jogadores são
+    # identificados pelo índice em jogadores_iniciais
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._assentos: Dict[Jogador, int] = {j: i for i, j in enumerate(self.jogadores_iniciais)}
+        self._saldo_inicial = self.jogadores_iniciais[0].saldo if self.jogadores_iniciais else 0
+        self._eventos = bytearray()
+        self._fim_gravado = False
+
+    def _registrar(self, tipo: int, jogador: Jogador, casa: int = 0, valor: int = 0):
+        self._eventos += EVENTO.pack(tipo, self._assentos[jogador], casa, valor)
+
+    def jogada(self, jogador: Jogador, numero_dado: int):
+        if not self.finished and jogador in self._vivos:
+            nova = self.tabuleiro.nova_posicao(jogador.posicao, numero_dado)
+            self._registrar(JOGADA, jogador, nova, numero_dado)
+            if nova < jogador.posicao:
+                self._registrar(VOLTA, jogador, nova, self.recompensa_volta)
+        super().jogada(jogador, numero_dado)
+
+    def pagar_aluguel(self, propriedade: Propriedade, inquilino: Jogador):
+        dono = propriedade.proprietario
+        if dono and dono != inquilino:
+            self._registrar(ALUGUEL, inquilino, propriedade.posicao, propriedade.aluguel)
+        super().pagar_aluguel(propriedade, inquilino)
+
+    def comprar_propiedade(self, jogador: Jogador) -> bool:
+        comprou = super().comprar_propiedade(jogador)
+        if comprou:
+            prop = self.tabuleiro[jogador.posicao]
+            self._registrar(COMPRA, jogador, jogador.posicao, prop.preco)
+        return comprou
+
+    def remover_jogador(self, jogador: Jogador):
+        if jogador in self._vivos:
+            self._registrar(ELIMINACAO, jogador)
+        super().remover_jogador(jogador)
+
+    def jogo_finalizado(self) -> bool:
+        finalizado = super().jogo_finalizado()
+        if finalizado and not self._fim_gravado:
+            self._registrar(FIM, self.vencedor, self.rodada, int(self.termino_por_tempo))
+            self._fim_gravado = True
+        return finalizado
+
+    def serializar(self) -> bytes:
+        partes = [CABECALHO.pack(MAGICO, VERSAO, len(self.jogadores_iniciais), self.seed, len(self.tabuleiro),
+                                 self._saldo_inicial, len(self._eventos) // EVENTO.size)]
+        partes += [NOME.pack(j.nome_estrategia().encode()) for j in self.jogadores_iniciais]
+        partes += [CASA.pack(preco, aluguel) for preco, aluguel in self.tabuleiro.casas()]
+        partes.append(bytes(self._eventos))
+        return b"".join(partes)
+
+
+class EstadoReplay:
+    __slots__ = ("turno", "saldos", "posicoes", "proprietarios", "vivos", "ultimo_dado",
+                 "vencedor", "termino_por_tempo", "alteradas")
+
+    def __init__(self, qtd_jogadores: int, qtd_casas: int, saldo_inicial: int):
+        self.turno = 0
+        self.saldos = [saldo_inicial] * qtd_jogadores
+        self.posicoes = [0] * qtd_jogadores
+        self.proprietarios = [-1] * qtd_casas
+        self.vivos = [True] * qtd_jogadores
+        self.ultimo_dado = 0
+        self.vencedor: Optional[int] = None
+        self.termino_por_tempo = False
+        # Casa -> dono das casas que mudaram desde o estado anterior da mesma
+        # fonte, quando ela sabe (ReproducaoAoVivo); None: compare proprietarios
+        self.alteradas: Optional[Dict[int, int]] = None
+
+    def copiar(self) -> 'EstadoReplay':
+        copia = EstadoReplay.__new__(EstadoReplay)
+        copia.turno = self.turno
+        copia.saldos = self.saldos.copy()
+        copia.posicoes = self.posicoes.copy()
+        copia.proprietarios = self.proprietarios.copy()
+        copia.vivos = self.vivos.copy()
+        copia.ultimo_dado = self.ultimo_dado
+        copia.vencedor = self.vencedor
+        copia.termino_por_tempo = self.termino_por_tempo
+        copia.alteradas = None
+        return copia
+
+    def aplicar(self, tipo: int, jogador: int, casa: int, valor: int):
+        if tipo == JOGADA:
+            self.turno += 1
+            self.posicoes[jogador] = casa
+            self.ultimo_dado = valor
+        elif tipo == VOLTA:
+            self.saldos[jogador] += valor
+        elif tipo == ALUGUEL:
+            self.saldos[jogador] -= valor
+            self.saldos[self.proprietarios[casa]] += valor
+        elif tipo == COMPRA:
+            self.saldos[jogador] -= valor
+            self.proprietarios[casa] = jogador
+        elif tipo == ELIMINACAO:
+            self.vivos[jogador] = False
+            self.proprietarios = [-1 if dono == jogador else dono for dono in self.proprietarios]
+        elif tipo == FIM:
+            self.vencedor = jogador
+            self.termino_por_tempo = bool(valor)
+
+    def para_dict(self) -> Dict[str, object]:
+        return {
+            "turno": self.turno,
+            "saldos": self.saldos,
+            "posicoes": self.posicoes,
+            "proprietarios": self.proprietarios,
+            "vivos": self.vivos,
+            "ultimo_dado": self.ultimo_dado,
+            "vencedor": self.vencedor,
+            "termino_por_tempo": self.termino_por_tempo,
+        }
+
+
+class Replay:
+    # Reconstrói o estado em qualquer turno aplicando eventos, sem rodar a
+    # lógica do jogo nem os geradores. Quadros-chave a cada INTERVALO_QUADROS
+    # turnos limitam cada busca a no máximo esse número de turnos aplicados
+    INTERVALO_QUADROS = 64
+
+    def __init__(self, dados, inicio: int = 0):
+        buffer = memoryview(dados)
+        magico, versao, qtd_jogadores, seed, qtd_casas, saldo_inicial, qtd_eventos = \
+            CABECALHO.unpack_from(buffer, inicio)
+        if magico != MAGICO:
+            raise ValueError("registro de partida inválido")
+        if versao != VERSAO:
+            raise ValueError(f"versão de registro não suportada: {versao}")
+
+        self.seed = seed
+        self.saldo_inicial = saldo_inicial
+        posicao = inicio + CABECALHO.size
+        self.estrategias: List[str] = []
+        for _ in range(qtd_jogadores):
+            self.estrategias.append(NOME.unpack_from(buffer, posicao)[0].rstrip(b"\0").decode())
+            posicao += NOME.size
+        self.casas = [CASA.unpack_from(buffer, posicao + i * CASA.size) for i in range(qtd_casas)]
+        posicao += qtd_casas * CASA.size
+
+        self.qtd_eventos = qtd_eventos
+        self._eventos = buffer[posicao:posicao + qtd_eventos * EVENTO.size]
+        self.tamanho = posicao + qtd_eventos * EVENTO.size - inicio
+
+        tipos = bytes(self._eventos[::EVENTO.size])
+        self._inicio_turnos = [i for i, tipo in enumerate(tipos) if tipo == JOGADA]
+        self._quadros: Optional[List[EstadoReplay]] = None
+
+    @property
+    def qtd_jogadores(self) -> int:
+        return len(self.estrategias)
+
+    @property
+    def qtd_turnos(self) -> int:
+        return len(self._inicio_turnos)
+
+    def eventos(self, inicio: int = 0, fim: Optional[int] = None) -> Iterator[Evento]:
+        fim = self.qtd_eventos if fim is None else min(fim, self.qtd_eventos)
+        for valores in EVENTO.iter_unpack(self._eventos[inicio * EVENTO.size:fim * EVENTO.size]):
+            yield Evento(*valores)
+
+    def eventos_do_turno(self, turno: int) -> List[Evento]:
+        # Eventos que levam do estado(turno - 1) ao estado(turno)
+        return list(self.eventos(self._fim_eventos(turno - 1), self._fim_eventos(turno)))
+
+    def _fim_eventos(self, turno: int) -> int:
+        # Quantidade de eventos aplicados no estado depois de `turno` jogadas
+        if turno < 0:
+            return 0
+        if turno < self.qtd_turnos:
+            return self._inicio_turnos[turno]
+        return self.qtd_eventos
+
+    def _estado_inicial(self) -> EstadoReplay:
+        return EstadoReplay(self.qtd_jogadores, len(self.casas), self.saldo_inicial)
+
+    def _construir_quadros(self):
+        estado = self._estado_inicial()
+        self._quadros = [estado.copiar()]
+        for inicio in range(self.INTERVALO_QUADROS, self.qtd_turnos, self.INTERVALO_QUADROS):
+            anterior = self._inicio_turnos[inicio - self.INTERVALO_QUADROS]
+            for evento in EVENTO.iter_unpack(self._eventos[anterior * EVENTO.size:self._inicio_turnos[inicio] * EVENTO.size]):
+                estado.aplicar(*evento)
+            self._quadros.append(estado.copiar())
+
+    def estado(self, turno: Optional[int] = None) -> EstadoReplay:
+        # Estado depois de `turno` jogadas (0 = início, None = fim da partida)
+        turno = self.qtd_turnos if turno is None else max(0, min(turno, self.qtd_turnos))
+        if self._quadros is None:
+            self._construir_quadros()
+
+        indice = min(turno // self.INTERVALO_QUADROS, len(self._quadros) - 1)
+        estado = self._quadros[indice].copiar()
+        inicio = self._fim_eventos(indice * self.INTERVALO_QUADROS)
+        for evento in EVENTO.iter_unpack(self._eventos[inicio * EVENTO.size:self._fim_eventos(turno) * EVENTO.size]):
+            estado.aplicar(*evento)
+        return estado
+
+
+class ArquivoPartidas:
+    # Várias partidas gravadas em sequência no mesmo arquivo, lidas via mmap:
+    # abrir só percorre os cabeçalhos e cada Replay lê direto das páginas
+    def __init__(self, caminho: str):
+        self._arquivo = open(caminho, "rb")
+        self._offsets: List[int] = []
+        self._mmap = None
+        if os.fstat(self._arquivo.fileno()).st_size == 0:
+            return
+        self._mmap = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        posicao = 0
+        while posicao < len(self._mmap):
+            _, _, qtd_jogadores, _, qtd_casas, _, qtd_eventos = CABECALHO.unpack_from(self._mmap, posicao)
+            self._offsets.append(posicao)
+            posicao += (CABECALHO.size + qtd_jogadores * NOME.size + qtd_casas * CASA.size
+                        + qtd_eventos * EVENTO.size)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, indice: int) -> Replay:
+        return Replay(self._mmap, self._offsets[indice])
+
+    def __iter__(self) -> Iterator[Replay]:
+        for offset in self._offsets:
+            yield Replay(self._mmap, offset)
+
+    def fechar(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Replays ainda em uso mantêm o mapeamento até serem descartados
+                pass
+        self._arquivo.close()
+
+    def __enter__(self) -> 'ArquivoPartidas':
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def gravar_partida(qtd_casas: int = 20, jogadores: int = 4, seed: Optional[int] = None) -> JogoGravado:
+    from src.controller import criar_jogadores, executar
+
+    jogo = JogoGravado(criar_jogadores(jogadores), qtd_casas, seed=seed)
+    executar(jogo)
+    return jogo
+
+
+def gravar_lote(caminho: str, n: int, qtd_casas: int = 20, jogadores: int = 4, seed: int = 0,
+                anexar: bool = False) -> int:
+    # Mesmas seeds por partida de gerar_resultados: a partida i do arquivo é
+    # a linha i do NDJSON de um lote com a mesma seed
+    total = 0
+    with open(caminho, "ab" if anexar else "wb") as arquivo:
+        for i in range(n):
+            total += arquivo.write(gravar_partida(qtd_casas, jogadores, derivar_seed(seed, i)).serializar())
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grava partidas em formato binário e reconstrói estados.")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    gravar = comandos.add_parser("gravar", help="grava um lote de partidas")
+    gravar.add_argument("saida")
+    gravar.add_argument("-n", "--jogos", type=int, default=1)
+    gravar.add_argument("--qtd-casas", type=int, default=20)
+    gravar.add_argument("--jogadores", type=int, default=4)
+    gravar.add_argument("--seed", type=int, default=0)
+    gravar.add_argument("--anexar", action="store_true")
+
+    mostrar = comandos.add_parser("mostrar", help="imprime o estado de uma partida em um turno")
+    mostrar.add_argument("arquivo")
+    mostrar.add_argument("--partida", type=int, default=0)
+    mostrar.add_argument("--turno", type=int, default=None)
+    mostrar.add_argument("--eventos", action="store_true", help="inclui os eventos do turno")
+    args = parser.parse_args(argv)
+
+    if args.comando == "gravar":
+        tamanho = gravar_lote(args.saida, args.jogos, args.qtd_casas, args.jogadores, args.seed, args.anexar)
+        print(f"{args.jogos} partidas, {tamanho:,} bytes em {args.saida}")
+        return
+
+    with ArquivoPartidas(args.arquivo) as arquivo:
+        replay = arquivo[args.partida]
+        saida = {
+            "seed": replay.seed,
+            "estrategias": replay.estrategias,
+            "turnos": replay.qtd_turnos,
+            "estado": replay.estado(args.turno).para_dict(),
+        }
+        if args.eventos and args.turno is not None:
+            saida["eventos"] = [{**e._asdict(), "tipo": NOMES_EVENTOS[e.tipo]}
+                                for e in replay.eventos_do_turno(args.turno)]
+        print(json.dumps(saida, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+from typing import Dict, List, Optional, Tuple
+
+from src.core import Jogo, Jogador
+from src.registro import EstadoReplay, Replay
+
+
+def donos_do_jogo(jogo: Jogo) -> Dict[int, int]:
+    # Casa -> assento das casas compradas, pelas propriedades de cada jogador,
+    # sem percorrer o tabuleiro casa a casa: O(casas compradas)
+    return {propriedade.posicao: assento for assento, jogador in enumerate(jogo.jogadores_iniciais)
+            for propriedade in jogador.propriedades}
+
+
+def estado_do_jogo(jogo: Jogo, ultimo_dado: int = 0, proprietarios: Optional[List[int]] = None) -> EstadoReplay:
+    # Mesmo formato do replay: jogadores pelo índice em jogadores_iniciais
+    # e donos das casas por esse índice (-1 = banco). Com `proprietarios`, a
+    # lista de donos já atualizada por quem chama é usada como está, em vez
+    # de montar uma de O(casas)
+    iniciais = jogo.jogadores_iniciais
+    assentos = {j: i for i, j in enumerate(iniciais)}
+    estado = EstadoReplay(len(iniciais), 0 if proprietarios is not None else len(jogo.tabuleiro), 0)
+    estado.turno = jogo.rodada
+    estado.saldos = [j.saldo for j in iniciais]
+    estado.posicoes = [j.posicao for j in iniciais]
+    estado.vivos = [jogo.esta_vivo(j) for j in iniciais]
+    if proprietarios is not None:
+        estado.proprietarios = proprietarios
+    else:
+        for casa, assento in donos_do_jogo(jogo).items():
+            estado.proprietarios[casa] = assento
+    estado.ultimo_dado = ultimo_dado
+    estado.vencedor = assentos.get(jogo.vencedor) if jogo.vencedor is not None else None
+    estado.termino_por_tempo = jogo.termino_por_tempo
+    return estado
+
+
+class ReproducaoAoVivo:
+    # Avança um Jogo em blocos de turnos sem desenhar nada. Voltar no tempo
+    # recria a partida com a mesma seed e avança até o turno pedido: o jogo é
+    # determinístico, então o resultado é idêntico ao da primeira vez
+    def __init__(self, jogo: Jogo):
+        # Donos do último estado() devolvido. Descrevem o que a interface
+        # desenhou, não a partida, então sobrevivem a reiniciar() e ir_para()
+        self._donos: Dict[int, int] = {}
+        self._proprietarios = [-1] * len(jogo.tabuleiro)
+        self._carregar(jogo)
+
+    def _carregar(self, jogo: Jogo):
+        self.jogo = jogo
+        self._indice_turno = 0
+        self.ultimo_dado = 0
+        self.ultimo_evento = ""
+
+    @property
+    def estrategias(self) -> List[str]:
+        return [j.nome_estrategia() for j in self.jogo.jogadores_iniciais]
+
+    @property
+    def casas(self) -> List[Tuple[int, int]]:
+        return list(self.jogo.tabuleiro.casas())
+
+    @property
+    def qtd_casas(self) -> int:
+        return len(self.jogo.tabuleiro)
+
+    @property
+    def turno(self) -> int:
+        return self.jogo.rodada
+
+    @property
+    def total_turnos(self) -> Optional[int]:
+        return self.jogo.rodada if self.jogo.finished else None
+
+    @property
+    def finalizado(self) -> bool:
+        return self.jogo.finished
+
+    def _proximo_jogador(self) -> Optional[Jogador]:
+        ordem = self.jogo.ordem_turnos
+        for _ in range(len(ordem)):
+            jogador = ordem[self._indice_turno % len(ordem)]
+            self._indice_turno += 1
+            if self.jogo.esta_vivo(jogador):
+                return jogador
+        return None
+
+    def avancar(self, turnos: int = 1) -> int:
+        # Mesma sequência de controller.executar, um turno por vez
+        jogo = self.jogo
+        feitos = 0
+        while feitos < turnos and not jogo.finished:
+            jogador = self._proximo_jogador()
+            if jogador is None:
+                break
+            dado = jogo.jogar_dado()
+            jogo.jogada(jogador, dado)
+            if not jogo.finished and jogo.esta_vivo(jogador):
+                jogo.comprar_propiedade(jogador)
+            self.ultimo_dado = dado
+            feitos += 1
+
+        if feitos == 1:
+            self.ultimo_evento = self._descrever(jogador)
+        elif feitos:
+            self.ultimo_evento = f"Avançou {feitos} rodadas."
+        return feitos
+
+    def _descrever(self, jogador: Jogador) -> str:
+        numero = self.jogo.jogadores_iniciais.index(jogador) + 1
+        if not self.jogo.esta_vivo(jogador):
+            return f"Jogador #{numero} foi eliminado!"
+        prop = self.jogo.tabuleiro[jogador.posicao]
+        if prop.proprietario is jogador:
+            return f"Jogador #{numero} está na propriedade {jogador.posicao}, que é sua."
+        return f"Jogador #{numero} tirou {self.ultimo_dado} e foi para a casa {jogador.posicao}."
+
+    def reiniciar(self, seed: Optional[int] = None):
+        antigo = self.jogo
+        jogadores = [Jogador(type(j.estrategia)) for j in antigo.jogadores_iniciais]
+        self._carregar(type(antigo)(jogadores, len(antigo.tabuleiro), seed=antigo.seed if seed is None else seed,
+                                    max_rodadas=antigo.max_rodadas, recompensa_volta=antigo.recompensa_volta,
+                                    embaralhar=antigo.embaralhar, compacto=antigo.compacto))
+
+    def ir_para(self, turno: int) -> int:
+        if turno < self.jogo.rodada:
+            self.reiniciar()
+        return self.avancar(turno - self.jogo.rodada)
+
+    def estado(self) -> EstadoReplay:
+        # Só as casas cujo dono mudou desde o estado anterior são escritas na
+        # lista de donos, que é a mesma entre quadros, e vão em `alteradas`:
+        # um quadro custa O(casas compradas), não O(casas)
+        donos = donos_do_jogo(self.jogo)
+        alteradas = {casa: -1 for casa in self._donos if casa not in donos}
+        alteradas.update((casa, dono) for casa, dono in donos.items() if self._donos.get(casa) != dono)
+        for casa, dono in alteradas.items():
+            self._proprietarios[casa] = dono
+        self._donos = donos
+
+        estado = estado_do_jogo(self.jogo, self.ultimo_dado, self._proprietarios)
+        estado.alteradas = alteradas
+        return estado
+
+
+class ReproducaoGravada:
+    # Mesma interface para uma partida gravada por src.registro: buscar um
+    # turno é aplicar eventos a partir do quadro-chave mais próximo
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self._turno = 0
+        self.ultimo_evento = ""
+
+    @property
+    def estrategias(self) -> List[str]:
+        return self.replay.estrategias
+
+    @property
+    def casas(self) -> List[Tuple[int, int]]:
+        return self.replay.casas
+
+    @property
+    def qtd_casas(self) -> int:
+        return len(self.replay.casas)
+
+    @property
+    def turno(self) -> int:
+        return self._turno
+
+    @property
+    def total_turnos(self) -> Optional[int]:
+        return self.replay.qtd_turnos
+
+    @property
+    def finalizado(self) -> bool:
+        return self._turno >= self.replay.qtd_turnos
+
+    def avancar(self, turnos: int = 1) -> int:
+        return self.ir_para(self._turno + turnos)
+
+    def ir_para(self, turno: int) -> int:
+        destino = max(0, min(turno, self.replay.qtd_turnos))
+        feitos = destino - self._turno
+        self._turno = destino
+        self.ultimo_evento = f"Turno {destino} de {self.replay.qtd_turnos}."
+        return feitos
+
+    def reiniciar(self, seed: Optional[int] = None):
+        self.ir_para(0)
+
+    def estado(self) -> EstadoReplay:
+        return self.replay.estado(self._turno)
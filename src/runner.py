@@ -0,0 +1,241 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src.aleatoriedade import derivar_seed
+from src.checkpoint import Checkpoint, CheckpointIncompativel, ler_checkpoint, tratar_sigterm
+from src.controller import simulador
+from src.estatisticas import Agregado
+
+# Tamanho fixo das fatias: o resultado depende apenas de (seed, n), nunca do
+# número de processos, e cada worker devolve um agregado pequeno por fatia
+TAMANHO_FATIA = 2000
+
+
+def dividir_fatias(n: int, tamanho_fatia: int = TAMANHO_FATIA) -> List[Tuple[int, int]]:
+    fatias = []
+    indice = 0
+    while n > 0:
+        qtd = min(tamanho_fatia, n)
+        fatias.append((indice, qtd))
+        n -= qtd
+        indice += 1
+    return fatias
+
+
+def _simular_fatia(qtd_casas: int, jogadores: int, n: int, seed: int, motor: str = "objetos") -> Agregado:
+    agregado = Agregado()
+    if motor == "vetorizado":
+        from src.vetorizado import motores_em_blocos
+        for bloco in motores_em_blocos(n, qtd_casas, jogadores, seed):
+            agregado.mesclar(bloco.agregado())
+        return agregado
+
+    for i in range(n):
+        agregado.adicionar(simulador(qtd_casas, jogadores, derivar_seed(seed, i)))
+    return agregado
+
+
+def _resultados_fatia(qtd_casas: int, jogadores: int, n: int, seed: int,
+                      motor: str = "objetos") -> List[Dict[str, object]]:
+    # Mesmas partidas que _simular_fatia agrega, para qualquer motor
+    if motor == "vetorizado":
+        from src.vetorizado import gerar_resultados_vetorizado
+        return list(gerar_resultados_vetorizado(n, qtd_casas, jogadores, seed))
+    return [simulador(qtd_casas, jogadores, derivar_seed(seed, i)) for i in range(n)]
+
+
+def iterar_resultados(n: int, qtd_casas=20, jogadores=4, seed: int = 0,
+                      executor: Optional[ProcessPoolExecutor] = None,
+                      tamanho_fatia: int = TAMANHO_FATIA,
+                      max_pendentes: Optional[int] = None,
+                      motor: str = "objetos") -> Iterator[Dict[str, object]]:
+    # Resultados por partida, em ordem, com no máximo max_pendentes fatias em
+    # voo: a memória fica limitada a algumas fatias mesmo para milhões de jogos
+    fatias = iter(dividir_fatias(n, tamanho_fatia))
+
+    if executor is None:
+        for indice, qtd in fatias:
+            yield from _resultados_fatia(qtd_casas, jogadores, qtd, derivar_seed(seed, indice), motor)
+        return
+
+    max_pendentes = max_pendentes or 2 * (os.cpu_count() or 1)
+    pendentes = deque()
+    for indice, qtd in itertools.islice(fatias, max_pendentes):
+        pendentes.append(executor.submit(_resultados_fatia, qtd_casas, jogadores, qtd,
+                                         derivar_seed(seed, indice), motor))
+    while pendentes:
+        resultados = pendentes.popleft().result()
+        for indice, qtd in itertools.islice(fatias, 1):
+            pendentes.append(executor.submit(_resultados_fatia, qtd_casas, jogadores, qtd,
+                                         derivar_seed(seed, indice), motor))
+        yield from resultados
+
+
+def iterar_fatias_indexadas(n: int, qtd_casas=20, jogadores=4, seed: int = 0,
+                            executor: Optional[ProcessPoolExecutor] = None,
+                            tamanho_fatia: int = TAMANHO_FATIA, motor: str = "objetos",
+                            max_pendentes: Optional[int] = None,
+                            ignorar: Optional[Set[int]] = None) -> Iterator[Tuple[int, Agregado]]:
+    # (índice, agregado) na ordem em que as fatias terminam, pulando os
+    # índices em `ignorar` (já concluídos num checkpoint). Fechar o gerador
+    # (close()/break) cancela as fatias que ainda não começaram
+    fatias = (f for f in dividir_fatias(n, tamanho_fatia) if not ignorar or f[0] not in ignorar)
+
+    if executor is None:
+        for indice, qtd in fatias:
+            yield indice, _simular_fatia(qtd_casas, jogadores, qtd, derivar_seed(seed, indice), motor)
+        return
+
+    pendentes = {}
+
+    def submeter(indice: int, qtd: int):
+        futuro = executor.submit(_simular_fatia, qtd_casas, jogadores, qtd, derivar_seed(seed, indice), motor)
+        pendentes[futuro] = indice
+
+    max_pendentes = max_pendentes or 2 * (os.cpu_count() or 1)
+    for indice, qtd in itertools.islice(fatias, max_pendentes):
+        submeter(indice, qtd)
+    try:
+        while pendentes:
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                indice = pendentes.pop(futuro)
+                for proxima in itertools.islice(fatias, 1):
+                    submeter(*proxima)
+                yield indice, futuro.result()
+    finally:
+        for futuro in pendentes:
+            futuro.cancel()
+
+
+def iterar_fatias(n: int, qtd_casas=20, jogadores=4, seed: int = 0,
+                  executor: Optional[ProcessPoolExecutor] = None,
+                  tamanho_fatia: int = TAMANHO_FATIA, motor: str = "objetos",
+                  max_pendentes: Optional[int] = None) -> Iterator[Agregado]:
+    fatias = iterar_fatias_indexadas(n, qtd_casas, jogadores, seed, executor, tamanho_fatia, motor, max_pendentes)
+    try:
+        for _, parcial in fatias:
+            yield parcial
+    finally:
+        fatias.close()
+
+
+def simular_paralelo(n: int, qtd_casas=20, jogadores=4, processos: Optional[int] = None,
+                     seed: Optional[int] = None, tamanho_fatia: int = TAMANHO_FATIA,
+                     motor: str = "objetos", checkpoint: Optional[str] = None,
+                     intervalo_checkpoint: float = 30.0) -> Dict[str, object]:
+    # Com `checkpoint`, salva periodicamente as fatias concluídas e o
+    # agregado parcial; rodar de novo com o mesmo arquivo continua de onde
+    # parou (a seed vem do arquivo se não for informada) e chega ao mesmo
+    # resultado de uma execução sem interrupção
+    if seed is None and checkpoint is not None:
+        anterior = ler_checkpoint(checkpoint)
+        seed = anterior["parametros"]["seed"] if anterior else None
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    processos = processos or os.cpu_count() or 1
+
+    agregado = Agregado()
+    concluidas: Set[int] = set()
+    salvador = None
+    if checkpoint is not None:
+        salvador = Checkpoint(checkpoint, {"n": n, "qtd_casas": qtd_casas, "jogadores": jogadores, "seed": seed,
+                                           "tamanho_fatia": tamanho_fatia, "motor": motor},
+                              intervalo_checkpoint)
+        estado = salvador.carregar()
+        if estado is not None:
+            agregado = Agregado.de_dict(estado["agregado"])
+            concluidas = set(estado["fatias_concluidas"])
+    retomadas = len(concluidas)
+    jogos_retomados = agregado.jogos
+
+    def salvar():
+        salvador.salvar({"fatias_concluidas": sorted(concluidas), "agregado": agregado.para_dict()})
+
+    inicio = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        for indice, parcial in iterar_fatias_indexadas(n, qtd_casas, jogadores, seed, executor, tamanho_fatia,
+                                                       motor, ignorar=concluidas):
+            agregado.mesclar(parcial)
+            concluidas.add(indice)
+            if salvador is not None and salvador.vencido():
+                salvar()
+    finally:
+        # Também ao ser interrompido (Ctrl+C, SIGTERM, erro num worker): o
+        # que já terminou não se perde
+        if salvador is not None:
+            salvar()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    duracao = time.perf_counter() - inicio
+
+    resposta = agregado.resumo()
+    resposta["seed"] = seed
+    resposta["processos"] = processos
+    resposta["duracao_segundos"] = duracao
+    jogos_simulados = agregado.jogos - jogos_retomados
+    resposta["jogos_por_segundo"] = jogos_simulados / duracao if duracao > 0 and jogos_simulados else None
+    if checkpoint is not None:
+        resposta["checkpoint"] = {"caminho": checkpoint, "fatias_retomadas": retomadas,
+                                  "jogos_retomados": jogos_retomados}
+    return resposta
+
+
+def _imprimir_ndjson(args: argparse.Namespace):
+    seed = random.SystemRandom().getrandbits(63) if args.seed is None else args.seed
+    processos = args.processos or os.cpu_count() or 1
+
+    # Mesmas fatias e seeds de simular_paralelo, para os dois motores
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        for resultado in iterar_resultados(args.jogos, args.qtd_casas, args.jogadores, seed,
+                                           executor, args.tamanho_fatia, motor=args.motor):
+            sys.stdout.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Executa partidas em paralelo e imprime os agregados em JSON.")
+    parser.add_argument("-n", "--jogos", type=int, required=True)
+    parser.add_argument("--qtd-casas", type=int, default=20)
+    parser.add_argument("--jogadores", type=int, default=4)
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--tamanho-fatia", type=int, default=TAMANHO_FATIA)
+    parser.add_argument("--motor", choices=("objetos", "vetorizado"), default="objetos")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="imprime uma linha JSON por partida em vez dos agregados")
+    parser.add_argument("--checkpoint", default=None,
+                        help="arquivo de checkpoint; se existir, a execução continua dele")
+    parser.add_argument("--intervalo-checkpoint", type=float, default=30.0, help="segundos entre checkpoints")
+    args = parser.parse_args(argv)
+
+    if args.ndjson:
+        _imprimir_ndjson(args)
+        return
+
+    if args.checkpoint:
+        tratar_sigterm()
+    try:
+        resposta = simular_paralelo(args.jogos, args.qtd_casas, args.jogadores,
+                                    processos=args.processos, seed=args.seed,
+                                    tamanho_fatia=args.tamanho_fatia, motor=args.motor,
+                                    checkpoint=args.checkpoint, intervalo_checkpoint=args.intervalo_checkpoint)
+    except CheckpointIncompativel as e:
+        parser.error(str(e))
+    print(json.dumps(resposta, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
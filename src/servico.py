@@ -0,0 +1,146 @@
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as TempoFuturo
+from typing import Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+from src.instrumentacao import Metricas
+from src.jobs import FilaCheia
+
+# Folga para o resultado voltar do worker depois do prazo dele
+MARGEM_PRAZO = 1.0
+
+
+T = TypeVar("T")
+
+
+class TempoEsgotado(Exception):
+    pass
+
+
+def respeitar_prazo(itens: Iterable[T], prazo: Optional[float]) -> Iterator[T]:
+    # Para trabalho que roda fora do pool: o prazo (time.time()) é verificado
+    # entre um item e o próximo, já que não há SIGALRM na thread da requisição
+    for item in itens:
+        if prazo is not None and time.time() > prazo:
+            raise TempoEsgotado("simulação excedeu o prazo da requisição")
+        yield item
+
+
+def _executar_no_worker(funcao: Callable, args: tuple, kwargs: dict, prazo: Optional[float],
+                        com_metricas: bool):
+    # Roda na thread principal do worker, onde SIGALRM pode interromper a
+    # simulação: o prazo libera o processo em vez de deixá-lo ocupado com uma
+    # requisição que o cliente já abandonou. Tarefas que esperaram na fila
+    # além do prazo nem começam
+    metricas = Metricas() if com_metricas else None
+    if metricas is not None:
+        kwargs = dict(kwargs, metricas=metricas)
+
+    restante = None if prazo is None else prazo - time.time()
+    if restante is not None and restante <= 0:
+        raise TempoEsgotado("prazo esgotado antes de a simulação começar")
+    if restante is None or not hasattr(signal, "setitimer"):
+        resultado = funcao(*args, **kwargs)
+    else:
+        def estourar(sinal, quadro):
+            raise TempoEsgotado("simulação excedeu o prazo da requisição")
+
+        anterior = signal.signal(signal.SIGALRM, estourar)
+        signal.setitimer(signal.ITIMER_REAL, restante)
+        try:
+            resultado = funcao(*args, **kwargs)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, anterior)
+    return resultado, metricas.estado() if metricas is not None else None
+
+
+class PoolSimulacao:
+    # Simulações das rotas síncronas num pool de processos: o GIL deixa de
+    # serializar requisições e a vazão escala com os núcleos. No máximo
+    # `processos + max_fila` simulações aceitas ao mesmo tempo; além disso a
+    # requisição é recusada na hora (FilaCheia -> 503) em vez de acumular
+    # latência. `timeout` limita espera na fila + execução
+    def __init__(self, processos: Optional[int] = None, max_fila: Optional[int] = None,
+                 timeout: Optional[float] = 30.0):
+        self.processos = processos or os.cpu_count() or 1
+        self.max_fila = 2 * self.processos if max_fila is None else max_fila
+        self.timeout = timeout
+
+        self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        self._lock = threading.Lock()
+        self.em_andamento = 0
+        self.concluidas = 0
+        self.recusadas = 0
+        self.esgotadas = 0
+
+    def _liberar(self, _futuro):
+        with self._lock:
+            self.em_andamento -= 1
+
+    def _admitir(self):
+        with self._lock:
+            if self.em_andamento >= self.processos + self.max_fila:
+                self.recusadas += 1
+                raise FilaCheia(f"Servidor ocupado ({self.em_andamento} simulações em andamento)")
+            self.em_andamento += 1
+
+    def reservar(self) -> Optional[float]:
+        # Vaga para trabalho que não cabe num worker (streaming NDJSON, gravação
+        # no armazém, que tem um único escritor): conta na mesma admissão das
+        # simulações do pool e devolve o prazo, a ser respeitado por quem
+        # reservou. A vaga volta com liberar()
+        self._admitir()
+        return None if self.timeout is None else time.time() + self.timeout
+
+    def liberar(self, esgotada: bool = False):
+        with self._lock:
+            self.em_andamento -= 1
+            if esgotada:
+                self.esgotadas += 1
+            else:
+                self.concluidas += 1
+
+    def executar(self, funcao: Callable, *args, metricas: Optional[Metricas] = None, **kwargs):
+        self._admitir()
+
+        prazo = None if self.timeout is None else time.time() + self.timeout
+        try:
+            futuro = self._pool.submit(_executar_no_worker, funcao, args, kwargs, prazo, metricas is not None)
+        except BaseException:
+            self._liberar(None)
+            raise
+        # A vaga só volta quando o worker termina de fato, não quando o
+        # cliente desiste: a contagem reflete a ocupação real do pool
+        futuro.add_done_callback(self._liberar)
+
+        try:
+            resultado, estado = futuro.result(None if prazo is None else self.timeout + MARGEM_PRAZO)
+        except (TempoEsgotado, TempoFuturo):
+            futuro.cancel()
+            with self._lock:
+                self.esgotadas += 1
+            raise TempoEsgotado(f"Simulação excedeu {self.timeout:g}s")
+        with self._lock:
+            self.concluidas += 1
+        if metricas is not None and estado is not None:
+            metricas.acumular(estado)
+        return resultado
+
+    def estatisticas(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "processos": self.processos,
+                "max_fila": self.max_fila,
+                "timeout": self.timeout,
+                "em_andamento": self.em_andamento,
+                "concluidas": self.concluidas,
+                "recusadas": self.recusadas,
+                "esgotadas": self.esgotadas,
+            }
+
+    def encerrar(self):
+        self._pool.shutdown(cancel_futures=True)
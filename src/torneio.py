@@ -0,0 +1,335 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.adaptativo import _z, intervalo_wilson
+from src.aleatoriedade import derivar_seed
+from src.controller import executar
+from src.core import Jogador, Jogo
+from src.estrategias import ESTRATEGIAS
+from src.runner import dividir_fatias
+
+MODOS = ("todos", "suico")
+TAMANHO_FATIA = 1000
+ELO_BASE = 1500
+
+Mesa = Tuple[str, ...]
+
+
+def _jogar_fatia(mesa: Mesa, inicio: int, qtd: int, seed: int, qtd_casas: int) -> bytes:
+    # Assento do vencedor de cada partida. A partida i usa derivar_seed(seed, i)
+    # em qualquer mesa (números aleatórios comuns): mesmo tabuleiro, mesmos
+    # dados por ordem de turno e mesmos sorteios; só a mesa muda
+    estrategias = [ESTRATEGIAS[nome] for nome in mesa]
+    vencedores = bytearray(qtd)
+    for k in range(qtd):
+        jogo = Jogo([Jogador(cls) for cls in estrategias], qtd_casas, seed=derivar_seed(seed, inicio + k),
+                    embaralhar=False)
+        executar(jogo)
+        vencedores[k] = jogo.jogadores_iniciais.index(jogo.vencedor)
+    return bytes(vencedores)
+
+
+def jogar_mesas(mesas: Sequence[Mesa], n: int, seed: int, qtd_casas: int = Jogo.QTD_CASAS,
+                executor: Optional[ProcessPoolExecutor] = None,
+                tamanho_fatia: int = TAMANHO_FATIA) -> Dict[Mesa, bytes]:
+    # n partidas por mesa; devolve, por mesa, o assento vencedor de cada
+    # partida na ordem das seeds (necessário para o pareamento entre mesas)
+    fatias = dividir_fatias(n, tamanho_fatia)
+    tarefas = iter([(mesa, indice * tamanho_fatia, qtd) for mesa in mesas for indice, qtd in fatias])
+    partes: Dict[Tuple[Mesa, int], bytes] = {}
+
+    if executor is None:
+        for mesa, inicio, qtd in tarefas:
+            partes[(mesa, inicio)] = _jogar_fatia(mesa, inicio, qtd, seed, qtd_casas)
+    else:
+        pendentes = {}
+
+        def submeter(mesa: Mesa, inicio: int, qtd: int):
+            pendentes[executor.submit(_jogar_fatia, mesa, inicio, qtd, seed, qtd_casas)] = (mesa, inicio)
+
+        for tarefa in itertools.islice(tarefas, 2 * (os.cpu_count() or 1)):
+            submeter(*tarefa)
+        try:
+            while pendentes:
+                prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    partes[pendentes.pop(futuro)] = futuro.result()
+                    for tarefa in itertools.islice(tarefas, 1):
+                        submeter(*tarefa)
+        finally:
+            for futuro in pendentes:
+                futuro.cancel()
+
+    return {mesa: b"".join(partes[(mesa, indice * tamanho_fatia)] for indice, _ in fatias) for mesa in mesas}
+
+
+def matriz_vitorias(resultados: Dict[Mesa, bytes], estrategias: Sequence[str],
+                    confianca: float = 0.95) -> Dict[str, Dict[str, Dict[str, object]]]:
+    # matriz[a][b]: partidas em que a venceu com b na mesa, sobre as partidas
+    # em que os dois sentaram juntos. Com 2 por mesa é o confronto direto
+    z = _z(1 - confianca)
+    vitorias = {a: Counter() for a in estrategias}
+    jogos = {a: Counter() for a in estrategias}
+    for mesa, vencedores in resultados.items():
+        for assento, qtd in Counter(vencedores).items():
+            vencedor = mesa[assento]
+            for outro in mesa:
+                if outro != vencedor:
+                    vitorias[vencedor][outro] += qtd
+        for a, b in itertools.permutations(mesa, 2):
+            jogos[a][b] += len(vencedores)
+
+    matriz = {}
+    for a in estrategias:
+        matriz[a] = {}
+        for b in estrategias:
+            if a == b or not jogos[a][b]:
+                continue
+            inferior, superior = intervalo_wilson(vitorias[a][b], jogos[a][b], z)
+            matriz[a][b] = {"vitorias": vitorias[a][b], "jogos": jogos[a][b],
+                            "taxa": vitorias[a][b] / jogos[a][b], "inferior": inferior, "superior": superior}
+    return matriz
+
+
+def elo(matriz: Dict[str, Dict[str, Dict[str, object]]], iteracoes: int = 1000) -> List[Dict[str, object]]:
+    # Bradley-Terry por máxima verossimilhança (algoritmo MM) sobre os
+    # confrontos decisivos da matriz, na escala Elo: 400 pontos = 10:1. Não
+    # depende da ordem das partidas, ao contrário da atualização Elo
+    # sequencial. Meia vitória fictícia em cada sentido evita rating infinito
+    nomes = list(matriz)
+    ganhos = {a: sum(c["vitorias"] for c in matriz[a].values()) + 0.5 * len(matriz[a]) for a in nomes}
+    decisivos = {(a, b): matriz[a][b]["vitorias"] + matriz[b][a]["vitorias"] + 1.0
+                 for a in nomes for b in matriz[a]}
+    forca = {a: 1.0 for a in nomes}
+    for _ in range(iteracoes):
+        nova = {a: ganhos[a] / sum(decisivos[(a, b)] / (forca[a] + forca[b]) for b in matriz[a])
+                if matriz[a] else 1.0 for a in nomes}
+        media = math.exp(sum(math.log(f) for f in nova.values()) / len(nova))
+        nova = {a: f / media for a, f in nova.items()}
+        convergiu = max(abs(nova[a] - forca[a]) for a in nomes) < 1e-12
+        forca = nova
+        if convergiu:
+            break
+
+    tabela = [{"estrategia": a, "elo": ELO_BASE + 400 * math.log10(forca[a]),
+               "vitorias": sum(c["vitorias"] for c in matriz[a].values()),
+               "confrontos": sum(c["jogos"] for c in matriz[a].values())} for a in nomes]
+    return sorted(tabela, key=lambda linha: -linha["elo"])
+
+
+def por_assento(resultados: Dict[Mesa, bytes]) -> List[Dict[str, object]]:
+    # Vantagem da ordem de jogada: vitórias por assento em todas as mesas
+    contagem = Counter()
+    jogos = Counter()
+    for mesa, vencedores in resultados.items():
+        contagem.update(vencedores)
+        for assento in range(len(mesa)):
+            jogos[assento] += len(vencedores)
+    return [{"assento": assento, "vitorias": contagem[assento], "jogos": jogos[assento],
+             "taxa": contagem[assento] / jogos[assento]} for assento in sorted(jogos)]
+
+
+def confrontos_pareados(resultados: Dict[Mesa, bytes], confianca: float = 0.95) -> List[Dict[str, object]]:
+    # Mesas de 2 jogadas nos dois sentidos com as mesmas seeds: a partida i de
+    # (a, b) e a de (b, a) formam um par com o mesmo tabuleiro e os mesmos
+    # dados, só com os assentos trocados. A média do par elimina a vantagem
+    # do assento; o ganho de variância é pequeno (~1,0-1,2x medido), porque
+    # trocar os assentos troca quem recebe cada dado e as duas partidas
+    # divergem logo nas primeiras compras. `reducao_variancia` mede quanto
+    z = _z(1 - confianca)
+    confrontos = []
+    for mesa in resultados:
+        if len(mesa) != 2 or mesa[0] > mesa[1] or (mesa[1], mesa[0]) not in resultados:
+            continue
+        a, b = mesa
+        ida, volta = resultados[(a, b)], resultados[(b, a)]
+        n = min(len(ida), len(volta))
+        if n < 2:
+            continue
+        # Pontos de `a` no par: 0, 1 ou 2 (a senta no assento 0 na ida e 1 na volta)
+        pontos = Counter((ida[i] == 0) + (volta[i] == 1) for i in range(n))
+        media = (pontos[1] + 2 * pontos[2]) / n
+        variancia = (pontos[1] + 4 * pontos[2]) / n - media ** 2
+        taxa = media / 2
+        erro_pareado = math.sqrt(variancia / 4 / (n - 1) if n > 1 else 0.0)
+        erro_independente = math.sqrt(taxa * (1 - taxa) / (2 * n))
+        confrontos.append({
+            "estrategias": [a, b],
+            "partidas": 2 * n,
+            "taxa": taxa,
+            "erro_padrao": erro_pareado,
+            "inferior": max(0.0, taxa - z * erro_pareado),
+            "superior": min(1.0, taxa + z * erro_pareado),
+            "reducao_variancia": (erro_independente / erro_pareado) ** 2 if erro_pareado else None,
+        })
+    return confrontos
+
+
+def _parear(ordem: List[str], jogados: Set[frozenset]) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    # Sistema suíço: pares entre vizinhos na classificação, evitando repetir
+    # confrontos quando possível; com número ímpar o último fica de folga
+    restantes = list(ordem)
+    folga = restantes.pop() if len(restantes) % 2 else None
+    pares = []
+    while restantes:
+        a = restantes.pop(0)
+        indice = next((i for i, b in enumerate(restantes) if frozenset((a, b)) not in jogados), 0)
+        pares.append((a, restantes.pop(indice)))
+    return pares, folga
+
+
+def torneio(estrategias: Optional[Sequence[str]] = None, n: int = 1000, modo: str = "todos",
+            por_mesa: int = 2, rodadas: Optional[int] = None, qtd_casas: int = Jogo.QTD_CASAS,
+            seed: Optional[int] = None, processos: Optional[int] = None, confianca: float = 0.95,
+            tamanho_fatia: int = TAMANHO_FATIA) -> Dict[str, object]:
+    # `todos`: cada arranjo ordenado de `por_mesa` estratégias (todos os
+    # assentos) joga n partidas. `suico`: 1x1 em rodadas, pareando pela
+    # pontuação, cada confronto com n partidas em cada sentido
+    estrategias = list(estrategias or ESTRATEGIAS)
+    desconhecidas = [nome for nome in estrategias if nome not in ESTRATEGIAS]
+    if desconhecidas:
+        raise ValueError(f"estratégias desconhecidas: {', '.join(desconhecidas)}")
+    if len(set(estrategias)) != len(estrategias) or len(estrategias) < 2:
+        raise ValueError("informe ao menos duas estratégias distintas")
+    if modo not in MODOS:
+        raise ValueError(f"modo inválido: use um de {', '.join(MODOS)}")
+    if n < 1:
+        raise ValueError("n deve ser >= 1")
+    if modo == "suico":
+        por_mesa = 2
+    if not 2 <= por_mesa <= len(estrategias):
+        raise ValueError(f"por_mesa deve estar entre 2 e {len(estrategias)}")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    processos = processos or os.cpu_count() or 1
+
+    resposta: Dict[str, object] = {"modo": modo, "estrategias": estrategias, "por_mesa": por_mesa,
+                                   "jogos_por_mesa": n, "seed": seed}
+    resultados: Dict[Mesa, bytes] = {}
+    inicio = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    try:
+        if modo == "todos":
+            mesas = list(itertools.permutations(estrategias, por_mesa))
+            resultados = jogar_mesas(mesas, n, seed, qtd_casas, executor, tamanho_fatia)
+        else:
+            resposta["rodadas"], resposta["classificacao"] = _suico(
+                estrategias, n, rodadas or math.ceil(math.log2(len(estrategias))), seed, qtd_casas,
+                executor, tamanho_fatia, resultados)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    matriz = matriz_vitorias(resultados, estrategias, confianca)
+    resposta["elo"] = elo(matriz)
+    resposta["matriz"] = matriz
+    resposta["por_assento"] = por_assento(resultados)
+    resposta["confrontos"] = confrontos_pareados(resultados, confianca)
+    resposta["mesas"] = [{"mesa": list(mesa), "vitorias_por_assento": [v.count(a) for a in range(len(mesa))]}
+                         for mesa, v in resultados.items() for v in [list(v)]]
+    resposta["jogos"] = sum(len(v) for v in resultados.values())
+    resposta["duracao_segundos"] = time.perf_counter() - inicio
+    return resposta
+
+
+def _suico(estrategias: List[str], n: int, rodadas: int, seed: int, qtd_casas: int,
+           executor: Optional[ProcessPoolExecutor], tamanho_fatia: int,
+           resultados: Dict[Mesa, bytes]) -> Tuple[List[Dict[str, object]], List[Dict[str, object]]]:
+    pontos = {nome: 0.0 for nome in estrategias}
+    adversarios: Dict[str, List[str]] = {nome: [] for nome in estrategias}
+    jogados: Set[frozenset] = set()
+    historico = []
+
+    for rodada in range(rodadas):
+        ordem = sorted(estrategias, key=lambda nome: (-pontos[nome], estrategias.index(nome)))
+        pares, folga = _parear(ordem, jogados)
+        mesas = [m for a, b in pares for m in ((a, b), (b, a))]
+        # Seeds próprias por rodada; dentro da rodada, comuns a todas as mesas
+        jogadas = jogar_mesas(mesas, n, derivar_seed(seed, f"rodada{rodada}"), qtd_casas, executor, tamanho_fatia)
+
+        confrontos = []
+        for a, b in pares:
+            vitorias_a = jogadas[(a, b)].count(0) + jogadas[(b, a)].count(1)
+            vitorias_b = 2 * n - vitorias_a
+            pontos[a] += 1.0 if vitorias_a > vitorias_b else 0.5 if vitorias_a == vitorias_b else 0.0
+            pontos[b] += 1.0 if vitorias_b > vitorias_a else 0.5 if vitorias_a == vitorias_b else 0.0
+            adversarios[a].append(b)
+            adversarios[b].append(a)
+            jogados.add(frozenset((a, b)))
+            confrontos.append({"estrategias": [a, b], "vitorias": [vitorias_a, vitorias_b]})
+            # Confrontos repetidos em rodadas diferentes somam partidas
+            for mesa in ((a, b), (b, a)):
+                resultados[mesa] = resultados.get(mesa, b"") + jogadas[mesa]
+        if folga is not None:
+            pontos[folga] += 1.0
+        historico.append({"rodada": rodada + 1, "confrontos": confrontos, "folga": folga})
+
+    # Desempate Buchholz: soma dos pontos dos adversários enfrentados
+    classificacao = [{"estrategia": nome, "pontos": pontos[nome],
+                      "buchholz": sum(pontos[adv] for adv in adversarios[nome])} for nome in estrategias]
+    classificacao.sort(key=lambda linha: (-linha["pontos"], -linha["buchholz"]))
+    return historico, classificacao
+
+
+def _imprimir_tabelas(resposta: Dict[str, object]):
+    estrategias = resposta["estrategias"]
+    print(f"{resposta['modo']}: {resposta['jogos']} partidas, seed {resposta['seed']}, "
+          f"{resposta['duracao_segundos']:.1f}s\n")
+    print(f"{'estratégia':<12} {'elo':>7} {'vitórias':>9} {'confrontos':>11}")
+    for linha in resposta["elo"]:
+        print(f"{linha['estrategia']:<12} {linha['elo']:>7.0f} {linha['vitorias']:>9} {linha['confrontos']:>11}")
+
+    print("\ntaxa de vitória da linha contra a coluna")
+    print(" " * 12 + "".join(f"{b:>12}" for b in estrategias))
+    for a in estrategias:
+        celulas = [f"{resposta['matriz'][a][b]['taxa']:>12.3f}" if b in resposta["matriz"][a] else f"{'-':>12}"
+                   for b in estrategias]
+        print(f"{a:<12}" + "".join(celulas))
+
+    if resposta["confrontos"]:
+        print(f"\n{'confronto':<24} {'taxa':>7} {'± erro':>8} {'redução var.':>13}")
+        for c in resposta["confrontos"]:
+            reducao = f"{c['reducao_variancia']:.2f}x" if c["reducao_variancia"] else "-"
+            print(f"{' x '.join(c['estrategias']):<24} {c['taxa']:>7.3f} {c['erro_padrao']:>8.4f} {reducao:>13}")
+
+    if "classificacao" in resposta:
+        print(f"\n{'classificação':<12} {'pontos':>7} {'buchholz':>9}")
+        for linha in resposta["classificacao"]:
+            print(f"{linha['estrategia']:<12} {linha['pontos']:>7.1f} {linha['buchholz']:>9.1f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Torneio entre estratégias com números aleatórios comuns.")
+    parser.add_argument("--modo", choices=MODOS, default="todos")
+    parser.add_argument("--estrategias", nargs="+", default=list(ESTRATEGIAS))
+    parser.add_argument("-n", "--jogos", type=int, default=1000, help="partidas por mesa (por sentido no suíço)")
+    parser.add_argument("--por-mesa", type=int, default=2, help="jogadores por mesa no modo todos")
+    parser.add_argument("--rodadas", type=int, default=None, help="rodadas do suíço (padrão: log2 das estratégias)")
+    parser.add_argument("--qtd-casas", type=int, default=Jogo.QTD_CASAS)
+    parser.add_argument("--confianca", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="imprime o resultado completo em JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        resposta = torneio(args.estrategias, args.jogos, args.modo, args.por_mesa, args.rodadas, args.qtd_casas,
+                           args.seed, args.processos, args.confianca)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.json:
+        print(json.dumps(resposta, ensure_ascii=False, indent=2))
+    else:
+        _imprimir_tabelas(resposta)
+
+
+if __name__ == "__main__":
+    main()
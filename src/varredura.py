@@ -0,0 +1,339 @@
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from src.aleatoriedade import derivar_seed
+from src.checkpoint import Checkpoint, CheckpointIncompativel, ler_checkpoint, tratar_sigterm
+from src.controller import criar_jogadores, executar
+from src.core import Jogo
+from src.estatisticas import Agregado
+from src.estrategias import ESTRATEGIAS
+from src.runner import TAMANHO_FATIA, dividir_fatias
+
+COMPOSICAO_PADRAO = ("impulsivo", "exigente", "cauteloso", "aleatorio")
+
+COLUNAS = (
+    ["celula", "qtd_casas", "jogadores", "composicao", "max_rodadas", "recompensa_volta", "jogos",
+     "taxa_termino_por_tempo", "rodadas_media", "rodadas_p50", "rodadas_p90", "rodadas_p99"]
+    + [f"vitorias_{nome}" for nome in ESTRATEGIAS]
+    + [f"taxa_vitoria_{nome}" for nome in ESTRATEGIAS]
+    + ["segundos_cpu"]
+)
+
+
+class Celula(NamedTuple):
+    qtd_casas: int
+    jogadores: int
+    composicao: Tuple[str, ...]
+    max_rodadas: int
+    recompensa_volta: int
+
+
+def gerar_celulas(qtd_casas: Iterable[int], jogadores: Iterable[int],
+                  composicoes: Iterable[Tuple[str, ...]] = (COMPOSICAO_PADRAO,),
+                  max_rodadas: Iterable[int] = (Jogo.MAX_RODADAS,),
+                  recompensa_volta: Iterable[int] = (Jogo.RECOMPENSA_VOLTA,)) -> List[Celula]:
+    # Produto cartesiano dos eixos. A composição é distribuída em round-robin
+    # pelos assentos, como no simulador: ("impulsivo", "exigente") com 4
+    # jogadores vira impulsivo, exigente, impulsivo, exigente
+    eixos = {"qtd_casas": list(qtd_casas), "jogadores": list(jogadores), "max_rodadas": list(max_rodadas),
+             "recompensa_volta": list(recompensa_volta)}
+    # Sem jogadores a partida nunca termina, sem casas a posição divide por
+    # zero; recompensa_volta 0 é válida (volta sem bônus)
+    for eixo, valores in eixos.items():
+        minimo = 0 if eixo == "recompensa_volta" else 1
+        invalidos = [v for v in valores if v < minimo]
+        if invalidos:
+            raise ValueError(f"{eixo} deve ser >= {minimo}: {', '.join(map(str, invalidos))}")
+    composicoes = [tuple(c) for c in composicoes]
+    for composicao in composicoes:
+        desconhecidas = [nome for nome in composicao if nome not in ESTRATEGIAS]
+        if not composicao or desconhecidas:
+            raise ValueError(f"composição inválida {composicao}: use estratégias entre {', '.join(ESTRATEGIAS)}")
+    return [Celula(*valores) for valores in itertools.product(
+        eixos["qtd_casas"], eixos["jogadores"], composicoes, eixos["max_rodadas"], eixos["recompensa_volta"])]
+
+
+def _simular_fatia_celula(celula: Celula, n: int, seed: int, motor: str = "objetos") -> Tuple[Agregado, float]:
+    inicio = time.process_time()
+    estrategias = [ESTRATEGIAS[nome] for nome in celula.composicao]
+
+    if motor == "vetorizado":
+        from src.vetorizado import motores_em_blocos
+        agregado = Agregado()
+        for bloco in motores_em_blocos(n, celula.qtd_casas, celula.jogadores, seed, estrategias,
+                                       max_rodadas=celula.max_rodadas, recompensa_volta=celula.recompensa_volta):
+            agregado.mesclar(bloco.agregado())
+    else:
+        agregado = Agregado()
+        for i in range(n):
+            jogo = Jogo(criar_jogadores(celula.jogadores, estrategias), celula.qtd_casas,
+                        seed=derivar_seed(seed, i), max_rodadas=celula.max_rodadas,
+                        recompensa_volta=celula.recompensa_volta)
+            executar(jogo)
+            agregado.adicionar(jogo.resultado())
+    return agregado, time.process_time() - inicio
+
+
+def _linha(indice: int, celula: Celula, agregado: Agregado, segundos_cpu: float) -> Dict[str, object]:
+    resumo = agregado.resumo()
+    rodadas = resumo["rodadas"]
+    linha = {
+        "celula": indice,
+        "qtd_casas": celula.qtd_casas,
+        "jogadores": celula.jogadores,
+        "composicao": ",".join(celula.composicao),
+        "max_rodadas": celula.max_rodadas,
+        "recompensa_volta": celula.recompensa_volta,
+        "jogos": agregado.jogos,
+        "taxa_termino_por_tempo": resumo["taxa_termino_por_tempo"],
+        "rodadas_media": rodadas["media"],
+        "rodadas_p50": rodadas["p50"],
+        "rodadas_p90": rodadas["p90"],
+        "rodadas_p99": rodadas["p99"],
+        "segundos_cpu": segundos_cpu,
+    }
+    for nome in ESTRATEGIAS:
+        vitorias = agregado.vitorias.get(nome, 0)
+        linha[f"vitorias_{nome}"] = vitorias
+        linha[f"taxa_vitoria_{nome}"] = vitorias / agregado.jogos if agregado.jogos else None
+    return linha
+
+
+def varrer(celulas: List[Celula], n: int, seed: Optional[int] = None, processos: Optional[int] = None,
+           tamanho_fatia: int = TAMANHO_FATIA, motor: str = "objetos",
+           max_pendentes: Optional[int] = None, checkpoint: Optional[str] = None,
+           intervalo_checkpoint: float = 30.0) -> Iterator[Dict[str, object]]:
+    # Uma linha por célula, na ordem das células, assim que todas as fatias
+    # dela terminam. Todas as células usam as mesmas seeds por partida
+    # (números aleatórios comuns): diferenças entre células vêm dos
+    # parâmetros, não do sorteio, e uma célula com os valores padrão
+    # reproduz simular_paralelo com a mesma seed.
+    # Com `checkpoint`, uma varredura retomada devolve primeiro as linhas já
+    # prontas e só simula as fatias que faltam
+    if seed is None and checkpoint is not None:
+        anterior = ler_checkpoint(checkpoint)
+        seed = anterior["parametros"]["seed"] if anterior else None
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    processos = processos or os.cpu_count() or 1
+    fatias = dividir_fatias(n, tamanho_fatia)
+
+    linhas: List[Dict[str, object]] = []
+    agregados = [Agregado() for _ in celulas]
+    segundos = [0.0] * len(celulas)
+    concluidas: List[Set[int]] = [set() for _ in celulas]
+
+    salvador = None
+    if checkpoint is not None:
+        salvador = Checkpoint(checkpoint, {"celulas": [[*c[:2], list(c.composicao), *c[3:]] for c in celulas],
+                                           "n": n, "seed": seed, "tamanho_fatia": tamanho_fatia, "motor": motor},
+                              intervalo_checkpoint)
+        estado = salvador.carregar()
+        if estado is not None:
+            linhas = estado["linhas"]
+            for c, parcial in estado["celulas"].items():
+                c = int(c)
+                agregados[c] = Agregado.de_dict(parcial["agregado"])
+                segundos[c] = parcial["segundos"]
+                concluidas[c] = set(parcial["fatias"])
+
+    proxima = len(linhas)
+    yield from linhas
+    for c in range(proxima):
+        agregados[c] = None
+        concluidas[c] = {indice for indice, _ in fatias}
+    tarefas = ((c, indice, qtd) for c in range(len(celulas)) for indice, qtd in fatias
+               if indice not in concluidas[c])
+
+    def salvar():
+        salvador.salvar({
+            "linhas": linhas,
+            "celulas": {str(c): {"fatias": sorted(concluidas[c]), "agregado": agregados[c].para_dict(),
+                                 "segundos": segundos[c]}
+                        for c in range(proxima, len(celulas)) if concluidas[c]},
+        })
+
+    def concluir(c: int, indice: int, agregado: Agregado, duracao: float) -> Iterator[Dict[str, object]]:
+        nonlocal proxima
+        agregados[c].mesclar(agregado)
+        segundos[c] += duracao
+        concluidas[c].add(indice)
+        while proxima < len(celulas) and len(concluidas[proxima]) == len(fatias):
+            linha = _linha(proxima, celulas[proxima], agregados[proxima], segundos[proxima])
+            agregados[proxima] = None
+            proxima += 1
+            if salvador is not None:
+                linhas.append(linha)
+            yield linha
+        if salvador is not None and salvador.vencido():
+            salvar()
+
+    try:
+        if processos == 1:
+            for c, indice, qtd in tarefas:
+                resultado = _simular_fatia_celula(celulas[c], qtd, derivar_seed(seed, indice), motor)
+                yield from concluir(c, indice, *resultado)
+            return
+
+        # Um único pool para a varredura inteira: os workers são reaproveitados
+        # entre células e a janela limitada mantém poucas fatias em memória
+        max_pendentes = max_pendentes or 2 * processos
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            def submeter(c: int, indice: int, qtd: int):
+                futuro = executor.submit(_simular_fatia_celula, celulas[c], qtd, derivar_seed(seed, indice), motor)
+                pendentes[futuro] = (c, indice)
+
+            pendentes = {}
+            for tarefa in itertools.islice(tarefas, max_pendentes):
+                submeter(*tarefa)
+            try:
+                while pendentes:
+                    prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        c, indice = pendentes.pop(futuro)
+                        for tarefa in itertools.islice(tarefas, 1):
+                            submeter(*tarefa)
+                        yield from concluir(c, indice, *futuro.result())
+            finally:
+                for futuro in pendentes:
+                    futuro.cancel()
+    finally:
+        if salvador is not None:
+            salvar()
+
+
+class EscritorCSV:
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+        self._escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS)
+        self._escritor.writeheader()
+
+    def escrever(self, linha: Dict[str, object]):
+        self._escritor.writerow(linha)
+        self._arquivo.flush()
+
+    def fechar(self):
+        self._arquivo.close()
+
+
+class EscritorParquet:
+    # Colunar via pyarrow (opcional): um row group a cada `linhas_por_grupo`
+    # células, então o arquivo cresce durante a varredura
+    def __init__(self, caminho: str, linhas_por_grupo: int = 64):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("saída parquet requer pyarrow (pip install pyarrow)") from e
+
+        self._pa = pa
+        tipos = {"composicao": pa.string()}
+        for coluna in COLUNAS:
+            if coluna.startswith(("taxa_", "rodadas_media", "segundos_")):
+                tipos.setdefault(coluna, pa.float64())
+            else:
+                tipos.setdefault(coluna, pa.int64())
+        self._schema = pa.schema([(coluna, tipos[coluna]) for coluna in COLUNAS])
+        self._escritor = pq.ParquetWriter(caminho, self._schema)
+        self._linhas_por_grupo = linhas_por_grupo
+        self._buffer: List[Dict[str, object]] = []
+
+    def _descarregar(self):
+        if self._buffer:
+            self._escritor.write_table(self._pa.Table.from_pylist(self._buffer, schema=self._schema))
+            self._buffer = []
+
+    def escrever(self, linha: Dict[str, object]):
+        self._buffer.append(linha)
+        if len(self._buffer) >= self._linhas_por_grupo:
+            self._descarregar()
+
+    def fechar(self):
+        self._descarregar()
+        self._escritor.close()
+
+
+def _composicao(texto: str) -> Tuple[str, ...]:
+    nomes = tuple(nome.strip() for nome in texto.split(",") if nome.strip())
+    desconhecidas = [nome for nome in nomes if nome not in ESTRATEGIAS]
+    if not nomes or desconhecidas:
+        raise argparse.ArgumentTypeError(
+            f"composição inválida '{texto}': use nomes separados por vírgula entre {', '.join(ESTRATEGIAS)}")
+    return nomes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Varre o produto cartesiano de parâmetros e grava um agregado por célula.")
+    parser.add_argument("-n", "--jogos", type=int, required=True, help="partidas por célula")
+    parser.add_argument("--qtd-casas", type=int, nargs="+", default=[Jogo.QTD_CASAS])
+    parser.add_argument("--jogadores", type=int, nargs="+", default=[4])
+    parser.add_argument("--composicoes", type=_composicao, nargs="+", default=[COMPOSICAO_PADRAO],
+                        help="estratégias separadas por vírgula, distribuídas em round-robin pelos assentos")
+    parser.add_argument("--max-rodadas", type=int, nargs="+", default=[Jogo.MAX_RODADAS])
+    parser.add_argument("--recompensa-volta", type=int, nargs="+", default=[Jogo.RECOMPENSA_VOLTA])
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--processos", type=int, default=None)
+    parser.add_argument("--tamanho-fatia", type=int, default=TAMANHO_FATIA)
+    parser.add_argument("--motor", choices=("objetos", "vetorizado"), default="objetos")
+    parser.add_argument("--saida", default="-", help="arquivo .csv ou .parquet (padrão: CSV no stdout)")
+    parser.add_argument("--formato", choices=("csv", "parquet"), default=None,
+                        help="padrão: deduzido da extensão de --saida")
+    parser.add_argument("--checkpoint", default=None,
+                        help="arquivo de checkpoint; se existir, a varredura continua dele e reescreve --saida")
+    parser.add_argument("--intervalo-checkpoint", type=float, default=30.0, help="segundos entre checkpoints")
+    args = parser.parse_args(argv)
+
+    if args.jogos < 1 or args.tamanho_fatia < 1:
+        parser.error("--jogos e --tamanho-fatia devem ser >= 1")
+    try:
+        celulas = gerar_celulas(args.qtd_casas, args.jogadores, args.composicoes, args.max_rodadas,
+                                args.recompensa_volta)
+    except ValueError as e:
+        parser.error(str(e))
+
+    formato = args.formato or ("parquet" if args.saida.endswith(".parquet") else "csv")
+    if formato == "parquet":
+        if args.saida == "-":
+            parser.error("saída parquet precisa de --saida")
+        # Antes de simular: sem pyarrow a varredura inteira seria perdida
+        try:
+            escritor = EscritorParquet(args.saida)
+        except RuntimeError as e:
+            parser.error(str(e))
+    else:
+        arquivo = sys.stdout if args.saida == "-" else open(args.saida, "w", newline="", encoding="utf-8")
+        escritor = EscritorCSV(arquivo)
+
+    seed = args.seed
+    if seed is None and args.checkpoint:
+        anterior = ler_checkpoint(args.checkpoint)
+        seed = anterior["parametros"]["seed"] if anterior else None
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(63)
+    print(f"{len(celulas)} células x {args.jogos} partidas, seed {seed}", file=sys.stderr)
+
+    if args.checkpoint:
+        tratar_sigterm()
+    inicio = time.perf_counter()
+    try:
+        for linha in varrer(celulas, args.jogos, seed, args.processos, args.tamanho_fatia, args.motor,
+                            checkpoint=args.checkpoint, intervalo_checkpoint=args.intervalo_checkpoint):
+            escritor.escrever(linha)
+            print(f"célula {linha['celula'] + 1}/{len(celulas)} "
+                  f"({time.perf_counter() - inicio:.1f}s)", file=sys.stderr)
+    except CheckpointIncompativel as e:
+        parser.error(str(e))
+    finally:
+        if args.saida != "-":
+            escritor.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.core import Jogo, Jogador, Propriedade, Tabuleiro
+from src.estatisticas import Agregado
+from src.estrategias import Estrategia, Impulsivo, Exigente, Cauteloso, Aleatorio
+
+ESTRATEGIAS_PADRAO = [Impulsivo, Exigente, Cauteloso, Aleatorio]
+
+FACES = 6
+# Cada casa é um int32: preço nos bits 0-8, aluguel nos bits 9-15 e, a partir
+# do bit 16, o assento do dono + 1 (0 = sem dono). Uma leitura por casa traz
+# as três informações, em vez de um gather por array a cada jogada
+MASCARA_PRECO = (1 << 9) - 1
+DESLOCAMENTO_ALUGUEL = 9
+MASCARA_ALUGUEL = (1 << 7) - 1
+DESLOCAMENTO_DONO = 16
+MAX_JOGADORES = (1 << 15) - 2
+# Partidas por motor nos lotes. Faz parte da definição do lote (cada bloco
+# tem a própria seed): mudar este valor muda as partidas de uma seed
+TAMANHO_BLOCO = 50_000
+# Casas (partidas * casas do tabuleiro) de um motor: preço, aluguel e dono
+# ocupam 4 bytes por casa, ~64 MB no limite. Com tabuleiros grandes o bloco
+# encolhe para caber, em vez de alocar K * N casas de uma vez
+ORCAMENTO_CASAS = 1 << 24
+SEM_LIMITE = np.iinfo(np.int32).min
+NUNCA = np.iinfo(np.int32).max
+
+
+class MotorVetorizado:
+    # Executa K partidas em paralelo, em lockstep, com o estado em arrays:
+    # posicao/saldo/vivo têm forma (jogadores, partidas), para que a jogada do
+    # assento s em todas as partidas opere sobre memória contígua, e o
+    # tabuleiro (preço, aluguel, dono) fica achatado em (partidas * casas).
+    # As regras seguem Jogo.jogada e Jogo.comprar_propiedade.
+
+    # Remove partidas encerradas dos arrays quando menos que esta fração segue ativa
+    FRACAO_COMPACTACAO = 0.8
+    # Até aqui o aluguel é creditado com uma passada densa por credor; acima,
+    # com um scatter sobre as partidas que pagaram
+    JOGADORES_CREDITO_DENSO = 8
+
+    def __init__(self, qtd_jogos: int, qtd_casas: int = Jogo.QTD_CASAS, jogadores: int = 4,
+                 seed: Optional[int] = None, estrategias: Optional[List[type[Estrategia]]] = None,
+                 max_rodadas: int = Jogo.MAX_RODADAS, recompensa_volta: int = Jogo.RECOMPENSA_VOLTA):
+        if qtd_jogos < 1 or qtd_casas < 1 or jogadores < 1:
+            raise ValueError("qtd_jogos, qtd_casas e jogadores devem ser >= 1")
+        if jogadores > MAX_JOGADORES:
+            raise ValueError(f"o motor vetorizado aceita no máximo {MAX_JOGADORES} jogadores")
+        if qtd_jogos > 1 and qtd_jogos * qtd_casas > ORCAMENTO_CASAS:
+            raise ValueError(f"{qtd_jogos} partidas de {qtd_casas} casas excedem ORCAMENTO_CASAS; "
+                             f"use no máximo {tamanho_bloco(qtd_casas)} partidas por motor (motores_em_blocos)")
+
+        estrategias = estrategias or ESTRATEGIAS_PADRAO
+
+        self.rng = np.random.default_rng(seed)
+        self.qtd_jogos = qtd_jogos
+        self.qtd_casas = qtd_casas
+        self.qtd_jogadores = jogadores
+        self.max_rodadas = max_rodadas
+        self.recompensa_volta = recompensa_volta
+
+        # Mesma atribuição round-robin do simulador
+        self.estrategias = [estrategias[i % len(estrategias)] for i in range(jogadores)]
+        self.nomes = [est.nome for est in self.estrategias]
+
+        # Regras declaradas viram tabelas indexadas pelo jogador; estratégias
+        # sem regra caem no decide_compra, chamado caso a caso com Jogador e
+        # Propriedade de verdade (um por partida e assento/casa, pelo id
+        # original da partida), sincronizados com os arrays antes da chamada
+        self._jogadores_objeto: Dict[Tuple[int, int], Jogador] = {}
+        self._propriedades_objeto: Dict[Tuple[int, int], Propriedade] = {}
+        regras = [est.regra_declarada() for est in self.estrategias]
+        self._sem_regra = np.array([r is None for r in regras])
+        self._aluguel_minimo = np.array(
+            [SEM_LIMITE if r is None or r.aluguel_minimo is None else r.aluguel_minimo for r in regras],
+            dtype=np.int32)
+        # Saldo mínimo após a compra: 0 já é a condição saldo >= preco do
+        # Jogo; NUNCA deixa as estratégias sem regra para o decide_compra
+        self._reserva_efetiva = np.array(
+            [NUNCA if r is None else max(0, r.reserva_minima or 0) for r in regras], dtype=np.int32)
+        self._probabilidade = np.array([1.0 if r is None else r.probabilidade for r in regras])
+        self._sorteia = bool((self._probabilidade < 1.0).any())
+        self._filtra_aluguel = bool((self._aluguel_minimo != SEM_LIMITE).any())
+        self._algum_sem_regra = bool(self._sem_regra.any())
+
+        K, N, P = qtd_jogos, qtd_casas, jogadores
+
+        # Equivalente ao random.shuffle do Jogo: assento s da partida k é
+        # ocupado pelo jogador jogador_no_assento[s, k]
+        self.jogador_no_assento = np.ascontiguousarray(np.argsort(self.rng.random((K, P)), axis=1).T)
+        self._regras_por_assento()
+
+        # Aluguel por tabela (mesmo int() de Propriedade): a conta em float64
+        # sobre K * N casas alocaria 8 bytes por casa só de temporário
+        casa_por_preco = np.array(
+            [preco | int(preco * Tabuleiro.PORCENTAGEM_ALUGUEL) << DESLOCAMENTO_ALUGUEL for preco in range(100, 301)],
+            dtype=np.int32)
+        self.casas = casa_por_preco[self.rng.integers(0, 201, size=K * N, dtype=np.int16)]
+
+        # Posição e rodada no menor inteiro que as comporta: as operações por
+        # jogada sobre int8/int16 custam uma fração das mesmas sobre int32
+        self.posicao = np.zeros((P, K), dtype=menor_inteiro(N - 1 + FACES))
+        self.saldo = np.full((P, K), Jogador.SALDO_INICIAL, dtype=np.int32)
+        self.vivo = np.ones((P, K), dtype=bool)
+
+        self.ativo = np.ones(K, dtype=bool)
+        self.qtd_vivos = np.full(K, P, dtype=np.int32)
+        self.rodada = np.zeros(K, dtype=menor_inteiro(max_rodadas))
+        self.ids = np.arange(K, dtype=np.intp)
+        self._inicio_tabuleiro = np.arange(K, dtype=np.intp) * N
+        # A rodada de uma partida sobe no máximo 1 por jogada: enquanto este
+        # contador for positivo nenhuma partida pode ter atingido max_rodadas
+        self._passos_ate_limite = max_rodadas - 1
+
+        # Resultados indexados pelo id original da partida
+        self.vencedor = np.full(K, -1, dtype=np.intp)
+        self.termino_por_tempo = np.zeros(K, dtype=bool)
+        self.rodadas = np.zeros(K, dtype=np.int32)
+
+    def _regras_por_assento(self):
+        # As regras de compra de cada assento em todas as partidas, com a
+        # mesma forma (jogadores, partidas) do saldo: a decisão de compra
+        # vira comparação entre linhas, sem gathers pelo jogador a cada jogada
+        self._reserva_assento = self._reserva_efetiva[self.jogador_no_assento]
+        self._aluguel_minimo_assento = self._aluguel_minimo[self.jogador_no_assento]
+        self._sorteia_assento = self._probabilidade[self.jogador_no_assento] < 1.0
+        self._sem_regra_assento = self._sem_regra[self.jogador_no_assento]
+
+    def _compactar(self):
+        manter = np.flatnonzero(self.ativo)
+        K_atual, N = self.ativo.size, self.qtd_casas
+
+        # ascontiguousarray: a indexação [:, manter] pode devolver layout
+        # Fortran, e as linhas por assento precisam ser contíguas
+        self.jogador_no_assento = np.ascontiguousarray(self.jogador_no_assento[:, manter])
+        self._regras_por_assento()
+        self.posicao = np.ascontiguousarray(self.posicao[:, manter])
+        self.saldo = np.ascontiguousarray(self.saldo[:, manter])
+        self.vivo = np.ascontiguousarray(self.vivo[:, manter])
+        self.casas = self.casas.reshape(K_atual, N)[manter].ravel()
+        self.ativo = self.ativo[manter]
+        self.qtd_vivos = self.qtd_vivos[manter]
+        self.rodada = self.rodada[manter]
+        self.ids = self.ids[manter]
+        self._inicio_tabuleiro = np.arange(manter.size, dtype=np.intp) * N
+
+    def _finalizar(self, jogos: np.ndarray, por_tempo: bool):
+        if por_tempo:
+            # Maior saldo entre os vivos; argmax devolve o primeiro assento em
+            # caso de empate, como o desempate por ordem de turno do Jogo
+            saldos = np.where(self.vivo[:, jogos], self.saldo[:, jogos], np.iinfo(np.int32).min)
+            assento = saldos.argmax(axis=0)
+        else:
+            assento = self.vivo[:, jogos].argmax(axis=0)
+
+        ids = self.ids[jogos]
+        self.vencedor[ids] = self.jogador_no_assento[assento, jogos]
+        self.termino_por_tempo[ids] = por_tempo
+        self.rodadas[ids] = self.rodada[jogos]
+        self.ativo[jogos] = False
+
+    def _jogada(self, s: int, dado: np.ndarray):
+        move = self.ativo & self.vivo[s]
+
+        # Posição e saldo de assentos eliminados ou de partidas encerradas não
+        # importam mais, então o movimento não precisa da máscara e é feito
+        # direto na linha do assento
+        posicao = self.posicao[s]
+        saldo = self.saldo[s]
+        # Escalares do mesmo tipo das linhas evitam promoção dos temporários
+        N = posicao.dtype.type(self.qtd_casas)
+        if self.qtd_casas > 6:
+            # Um dado não dá mais de uma volta: passar de N é dar a volta
+            np.add(posicao, dado, out=posicao)
+            volta = posicao >= N
+            posicao -= volta * N
+        else:
+            anterior = posicao.copy()
+            np.add(posicao, dado, out=posicao)
+            posicao %= N
+            volta = posicao < anterior
+
+        # Deu uma volta completa
+        saldo += volta * np.int32(self.recompensa_volta)
+        self.rodada += move
+
+        if self.qtd_jogadores == 1:
+            # Como Jogo.jogo_finalizado ao fim da jogada: com um só jogador
+            # vivo a partida acaba na primeira rodada, antes de qualquer compra
+            self._finalizar(np.flatnonzero(move), por_tempo=False)
+            return
+
+        # take é mais barato que a indexação [] para os gathers por casa
+        casa = self._inicio_tabuleiro + posicao
+        estado = self.casas.take(casa)
+        dono = estado >> DESLOCAMENTO_DONO
+        aluguel = (estado >> DESLOCAMENTO_ALUGUEL) & MASCARA_ALUGUEL
+
+        # Se tem dono e não é o próprio, paga aluguel
+        livre = dono == 0
+        paga = move & ~livre & (dono != s + 1)
+        if self.qtd_jogadores <= self.JOGADORES_CREDITO_DENSO:
+            # Operações densas custam uma fração de um gather/scatter sobre
+            # o subconjunto que paga: com poucos jogadores, cada credor é uma
+            # passada mascarada sobre todas as partidas
+            valor = aluguel * paga
+            saldo -= valor
+            for credor in range(self.qtd_jogadores):
+                if credor != s:
+                    self.saldo[credor] += valor * (dono == credor + 1)
+            falidos = np.flatnonzero(paga & (saldo < 0))
+        else:
+            jogos = np.flatnonzero(paga)
+            valor = aluguel.take(jogos)
+            restante = saldo.take(jogos) - valor
+            saldo[jogos] = restante
+            self.saldo.reshape(-1)[(dono.take(jogos) - 1).astype(np.intp) * self.ativo.size + jogos] += valor
+            falidos = jogos[restante < 0]
+        if falidos.size:
+            self._eliminar(s, falidos)
+
+        # Quem pagou aluguel não está em casa sem dono, então eliminações não
+        # mudam os candidatos à compra; só o fim por tempo precisa ser refiltrado
+        compra = move & livre
+        if self._passos_ate_limite > 0:
+            self._passos_ate_limite -= 1
+        elif self._verificar_limite():
+            compra &= self.ativo
+
+        self._comprar(s, compra, casa, estado & MASCARA_PRECO, aluguel)
+
+    def _verificar_limite(self) -> bool:
+        tempo = np.flatnonzero(self.ativo & (self.rodada >= self.max_rodadas))
+        if tempo.size:
+            self._finalizar(tempo, por_tempo=True)
+        # Partidas já encerradas ficam com a rodada congelada (<= max_rodadas)
+        # até a compactação: incluí-las só antecipa a próxima verificação
+        self._passos_ate_limite = self.max_rodadas - int(self.rodada.max()) - 1
+        return bool(tempo.size)
+
+    def _eliminar(self, s: int, falidos: np.ndarray):
+        self.vivo[s, falidos] = False
+        self.qtd_vivos[falidos] -= 1
+
+        tabuleiros = self.casas.reshape(self.ativo.size, self.qtd_casas)
+        linhas = tabuleiros[falidos]
+        codigo = (s + 1) << DESLOCAMENTO_DONO
+        linhas -= ((linhas >> DESLOCAMENTO_DONO) == s + 1) * np.int32(codigo)
+        tabuleiros[falidos] = linhas
+
+        restou_um = falidos[self.qtd_vivos[falidos] == 1]
+        if restou_um.size:
+            self._finalizar(restou_um, por_tempo=False)
+
+    def _comprar(self, s: int, compra: np.ndarray, casa: np.ndarray, preco: np.ndarray, aluguel: np.ndarray):
+        # Regras declaradas avaliadas sobre todas as partidas com máscaras;
+        # só o sorteio e as estratégias sem regra olham partida a partida
+        saldo = self.saldo[s]
+        decide = compra & (saldo - preco >= self._reserva_assento[s])
+        if self._filtra_aluguel:
+            decide &= aluguel > self._aluguel_minimo_assento[s]
+        if self._sorteia:
+            sorteados = np.flatnonzero(decide & self._sorteia_assento[s])
+            if sorteados.size:
+                jogador = self.jogador_no_assento[s].take(sorteados)
+                decide[sorteados] = self.rng.random(sorteados.size) < self._probabilidade[jogador]
+        if self._algum_sem_regra:
+            for j in np.flatnonzero(compra & self._sem_regra_assento[s] & (saldo >= preco)):
+                jogador_j = self._jogador_objeto(s, int(j))
+                propriedade_j = self._propriedade_objeto(int(j), int(self.posicao[s, j]))
+                propriedade_j.proprietario = None
+                decide[j] = jogador_j.estrategia.decide_compra(jogador_j, propriedade_j)
+
+        saldo -= preco * decide
+        self.casas[casa[decide]] += np.int32((s + 1) << DESLOCAMENTO_DONO)
+
+    def _propriedade_objeto(self, j: int, posicao: int) -> Propriedade:
+        chave = (int(self.ids[j]), posicao)
+        propriedade = self._propriedades_objeto.get(chave)
+        if propriedade is None:
+            casa = self._inicio_tabuleiro[j] + posicao
+            estado = int(self.casas[casa])
+            propriedade = Propriedade(estado & MASCARA_PRECO,
+                                      (estado >> DESLOCAMENTO_ALUGUEL) & MASCARA_ALUGUEL, posicao)
+            self._propriedades_objeto[chave] = propriedade
+        return propriedade
+
+    def _jogador_objeto(self, s: int, j: int) -> Jogador:
+        # Estado do assento s na partida j copiado dos arrays: saldo, posição e
+        # propriedades (com proprietario apontando para o jogador)
+        chave = (int(self.ids[j]), s)
+        jogador = self._jogadores_objeto.get(chave)
+        if jogador is None:
+            jogador = Jogador(self.estrategias[self.jogador_no_assento[s, j]])
+            self._jogadores_objeto[chave] = jogador
+        jogador.saldo = int(self.saldo[s, j])
+        jogador.posicao = int(self.posicao[s, j])
+        inicio = self._inicio_tabuleiro[j]
+        jogador.propriedades.clear()
+        donos = self.casas[inicio:inicio + self.qtd_casas] >> DESLOCAMENTO_DONO
+        for posicao in np.flatnonzero(donos == s + 1):
+            propriedade = self._propriedade_objeto(j, int(posicao))
+            propriedade.proprietario = jogador
+            jogador.adicionar_propriedade(propriedade)
+        return jogador
+
+    def _sortear_dados(self, qtd: int) -> np.ndarray:
+        # Método de Lemire sobre bytes brutos do gerador: face = b * 6 >> 8,
+        # exata quando o byte baixo de b * 6 é >= 256 % 6; os ~1,6% rejeitados
+        # são sorteados de novo. Custa ~1/3 de rng.integers(1, 7, int8).
+        # "<u8" fixa a ordem dos bytes: a mesma seed dá os mesmos dados em
+        # qualquer máquina
+        brutos = self.rng.bit_generator.random_raw(-(-qtd // 8)).astype("<u8", copy=False)
+        produto = brutos.view(np.uint8)[:qtd].astype(np.uint16)
+        produto *= np.uint16(FACES)
+        dados = (produto >> 8).astype(np.int8)
+        dados += 1
+        rejeitados = np.flatnonzero((produto & 0xFF) < 256 % FACES)
+        if rejeitados.size:
+            dados[rejeitados] = self.rng.integers(1, FACES + 1, size=rejeitados.size, dtype=np.int8)
+        return dados
+
+    def executar(self) -> 'MotorVetorizado':
+        P = self.qtd_jogadores
+        while self.ativo.any():
+            if self.ativo.sum() < self.FRACAO_COMPACTACAO * self.ativo.size:
+                self._compactar()
+
+            dados = self._sortear_dados(P * self.ativo.size).reshape(P, self.ativo.size)
+            for s in range(P):
+                self._jogada(s, dados[s])
+        return self
+
+    def agregado(self) -> Agregado:
+        agregado = Agregado()
+        agregado.jogos = self.qtd_jogos
+        vitorias = np.bincount(self.vencedor, minlength=self.qtd_jogadores)
+        for i, nome in enumerate(self.nomes):
+            agregado.vitorias[nome] = agregado.vitorias.get(nome, 0) + int(vitorias[i])
+        agregado.terminos_por_tempo = int(self.termino_por_tempo.sum())
+        agregado.soma_rodadas = int(self.rodadas.sum(dtype=np.int64))
+        valores, contagens = np.unique(self.rodadas, return_counts=True)
+        agregado.histograma_rodadas = {int(v): int(c) for v, c in zip(valores, contagens)}
+        return agregado
+
+    def resultados(self) -> Iterator[Dict[str, object]]:
+        for k in range(self.qtd_jogos):
+            yield {
+                "vencedor": self.nomes[self.vencedor[k]],
+                "jogadores": list(self.nomes),
+                "termino_por_tempo": bool(self.termino_por_tempo[k]),
+                "rodadas": int(self.rodadas[k]),
+            }
+
+
+def menor_inteiro(limite: int) -> type:
+    for tipo in (np.int8, np.int16, np.int32):
+        if limite <= np.iinfo(tipo).max:
+            return tipo
+    return np.int64
+
+
+def tamanho_bloco(qtd_casas: int) -> int:
+    # Partidas por motor: TAMANHO_BLOCO, ou menos se o tabuleiro não couber
+    # no orçamento. Depende só de qtd_casas, então uma seed continua
+    # definindo as mesmas partidas
+    return max(1, min(TAMANHO_BLOCO, ORCAMENTO_CASAS // qtd_casas))
+
+
+def motores_em_blocos(n: int, qtd_casas=20, jogadores=4, seed: Optional[int] = None,
+                      estrategias: Optional[List[type[Estrategia]]] = None,
+                      **regras) -> Iterator[MotorVetorizado]:
+    # Única definição de quais partidas um lote vetorizado joga: blocos de
+    # tamanho_bloco(qtd_casas) partidas, cada um com a seed sorteada de
+    # default_rng(seed) na ordem dos blocos. Agregado e NDJSON passam por
+    # aqui, então com a mesma seed são as mesmas partidas
+    rng = np.random.default_rng(seed)
+    bloco = tamanho_bloco(qtd_casas)
+    restantes = n
+    while restantes > 0:
+        qtd = min(bloco, restantes)
+        yield MotorVetorizado(qtd, qtd_casas, jogadores, seed=int(rng.integers(2**63)),
+                              estrategias=estrategias, **regras).executar()
+        restantes -= qtd
+
+
+def gerar_resultados_vetorizado(n: int, qtd_casas=20, jogadores=4, seed: Optional[int] = None,
+                                estrategias: Optional[List[type[Estrategia]]] = None) -> Iterator[Dict[str, object]]:
+    # Memória limitada a um bloco de partidas por vez
+    for motor in motores_em_blocos(n, qtd_casas, jogadores, seed, estrategias):
+        yield from motor.resultados()
+
+
+def simular_vetorizado(n: int, qtd_casas=20, jogadores=4, seed: Optional[int] = None,
+                       detalhes=False, estrategias: Optional[List[type[Estrategia]]] = None) -> Dict[str, object]:
+    agregado = Agregado()
+    partidas = []
+
+    inicio = time.perf_counter()
+    for motor in motores_em_blocos(n, qtd_casas, jogadores, seed, estrategias):
+        agregado.mesclar(motor.agregado())
+        if detalhes:
+            partidas.extend(motor.resultados())
+    duracao = time.perf_counter() - inicio
+
+    resposta = agregado.resumo()
+    resposta["duracao_segundos"] = duracao
+    resposta["jogos_por_segundo"] = n / duracao if duracao > 0 else None
+    if detalhes:
+        resposta["partidas"] = partidas
+    return resposta
@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("flask")
+
+import app as servidor
+
+
+@pytest.fixture
+def cliente(monkeypatch):
+    # Cache novo e sem disco por teste: acertos de um teste não vazam para outro
+    monkeypatch.setattr(servidor, "_cache", None)
+    monkeypatch.delenv("SIMULADOR_CACHE_DIR", raising=False)
+    return servidor.app.test_client()
+
+
+@pytest.mark.parametrize("consulta", [
+    "n=0",
+    f"n={servidor.MAX_JOGOS_LOTE + 1}",
+    "n=10&motor=turbo",
+    "n=10&formato=xml",
+    "n=10&qtd_casas=0",
+    f"n=10&jogadores={servidor.MAX_JOGADORES + 1}",
+])
+def test_lote_com_parametros_invalidos(cliente, consulta):
+    resposta = cliente.get(f"/jogo/simular/lote?{consulta}")
+    assert resposta.status_code == 400
+    assert resposta.get_json()["sucesso"] is False
+
+
+@pytest.mark.parametrize("consulta", ["top=0", f"top={servidor.MAX_TOP_PERFIL + 1}", "top=-1", "modo=tracer"])
+def test_perfil_com_parametros_invalidos(cliente, consulta):
+    assert cliente.get(f"/jogo/perfil?n=10&{consulta}").status_code == 400
+
+
+@pytest.mark.parametrize("rota", [
+    "/jogo/simular/adaptativo?precisao=0.05&comparar=impulsivo",
+    "/jogo/simular/adaptativo?precisao=0.9",
+    "/jogo/simular/adaptativo?comparar=impulsivo,desconhecido",
+    f"/jogo/analise?turnos={servidor.Jogo.MAX_RODADAS + 1}",
+    "/jogo/simular?qtd_casas=0",
+])
+def test_outras_rotas_com_parametros_invalidos(cliente, rota):
+    assert cliente.get(rota).status_code == 400
+
+
+@pytest.mark.parametrize("corpo", [{"n": "muitos"}, {"n": 0}, {"n": 10, "motor": "turbo"}])
+def test_job_com_parametros_invalidos(cliente, corpo):
+    assert cliente.post("/jogo/jobs", json=corpo).status_code == 400
+
+
+def test_acerto_do_cache_informa_o_proprio_tempo(cliente):
+    primeira = cliente.get("/jogo/simular/lote?n=50&seed=3")
+    segunda = cliente.get("/jogo/simular/lote?n=50&seed=3")
+    assert primeira.headers["X-Cache"] == "falha"
+    assert segunda.headers["X-Cache"] == "memoria"
+
+    calculada, servida = primeira.get_json(), segunda.get_json()
+    assert calculada["cache"] is False and servida["cache"] is True
+    assert "jogos_por_segundo" in calculada and "jogos_por_segundo" not in servida
+    assert servida["vitorias"] == calculada["vitorias"]
@@ -0,0 +1,85 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.controller import criar_jogadores, executar, simulador
+from src.core import Jogador, Jogo, Tabuleiro
+from src.estrategias import Cauteloso, Impulsivo
+
+
+def _partida(seed: int, qtd_casas: int = 20, jogadores: int = 4, compacto: bool = False) -> Jogo:
+    return executar(Jogo(criar_jogadores(jogadores), qtd_casas, seed=seed, compacto=compacto))
+
+
+def test_mesma_seed_mesma_partida():
+    for compacto in (False, True):
+        a, b = _partida(11, compacto=compacto), _partida(11, compacto=compacto)
+        assert a.resultado() == b.resultado()
+        assert [j.saldo for j in a.jogadores_iniciais] == [j.saldo for j in b.jogadores_iniciais]
+
+
+def test_tabuleiros_sao_independentes_entre_partidas():
+    pequeno = Jogo(criar_jogadores(2), 5, seed=1)
+    grande = Jogo(criar_jogadores(2), 40, seed=1)
+    assert len(pequeno.tabuleiro) == 5 and len(grande.tabuleiro) == 40
+    assert pequeno.tabuleiro.nova_posicao(4, 3) == 2
+    assert grande.tabuleiro.nova_posicao(4, 3) == 7
+
+    Tabuleiro.inicializar(7)
+    assert len(pequeno.tabuleiro) == 5 and len(grande.tabuleiro) == 40
+
+
+def test_partidas_em_threads_coincidem_com_as_sequenciais():
+    configuracoes = [(seed, 5 + seed % 30, 2 + seed % 5) for seed in range(200)]
+    sequenciais = [simulador(casas, jogadores, seed) for seed, casas, jogadores in configuracoes]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        concorrentes = list(executor.map(lambda c: simulador(c[1], c[2], c[0]), configuracoes))
+    assert concorrentes == sequenciais
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+def test_eliminacao_devolve_as_propriedades_ao_banco(compacto):
+    jogo = Jogo([Jogador(Impulsivo), Jogador(Cauteloso)], 20, seed=1, embaralhar=False, compacto=compacto)
+    falido, outro = jogo.jogadores_iniciais
+    for posicao in (0, 3, 5):
+        jogo.tabuleiro[posicao].definir_proprietario(falido)
+    jogo.tabuleiro[7].definir_proprietario(outro)
+
+    jogo.remover_jogador(falido)
+
+    assert not jogo.esta_vivo(falido)
+    assert not falido.propriedades
+    assert [p.posicao for p in jogo.tabuleiro if p.proprietario is not None] == [7]
+    assert jogo.tabuleiro[7].proprietario is outro
+
+
+def test_tabuleiro_compacto_e_propriedades_dos_jogadores_concordam():
+    for seed in range(20):
+        jogo = _partida(seed, qtd_casas=3000, compacto=True)
+        for jogador in jogo.jogadores:
+            posicoes = {p.posicao for p in jogador.propriedades}
+            assert posicoes == {pos for pos, dono in jogo.tabuleiro.donos.items() if dono is jogador}
+            assert all(jogo.tabuleiro[pos].preco == jogo.tabuleiro.preco(pos) for pos in posicoes)
+
+
+def test_ranking_incremental_coincide_com_a_ordenacao():
+    jogadores = criar_jogadores(Jogo.JOGADORES_RANKING_INCREMENTAL + 16)
+    jogo = Jogo(jogadores, 200, seed=3)
+    assert jogo._ranking is not None
+    ordem = {j: i for i, j in enumerate(jogo.ordem_turnos)}
+    sorteio = random.Random(0)
+
+    turnos = 0
+    while not jogo.finished and turnos < 5000:
+        for jogador in list(jogo.jogadores):
+            if jogo.finished:
+                break
+            jogo.jogada(jogador, jogo.jogar_dado())
+            if not jogo.finished and jogo.esta_vivo(jogador):
+                jogo.comprar_propiedade(jogador)
+            turnos += 1
+            # Consultas esparsas: as marcas acumulam entre uma e outra
+            if sorteio.random() < 0.2:
+                esperado = min(jogo.jogadores, key=lambda j: (-j.saldo, ordem[j]))
+                assert jogo.lider() is esperado
@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.markov import analisar, lances_por_volta, tabuleiro_da_seed
+
+
+def _lances_por_volta_simulados(qtd_casas: int, lances: int = 100_000) -> float:
+    # Mesma contagem de volta do Jogo.jogada: nova posição abaixo da anterior
+    sorteio = random.Random(0)
+    posicao = voltas = 0
+    for _ in range(lances):
+        anterior = posicao
+        posicao = (posicao + sorteio.randint(1, 6)) % qtd_casas
+        voltas += posicao < anterior
+    return lances / voltas
+
+
+@pytest.mark.parametrize("qtd_casas", [2, 3, 5, 6, 7, 20])
+def test_lances_por_volta_coincidem_com_a_contagem_do_jogo(qtd_casas):
+    assert lances_por_volta(qtd_casas) == pytest.approx(_lances_por_volta_simulados(qtd_casas), rel=0.02)
+
+
+def test_tabuleiro_de_uma_casa_nao_tem_renda_por_volta():
+    assert lances_por_volta(1) is None
+    analise = analisar(tabuleiro_da_seed(1, 0), jogadores=2)
+    assert analise["casas"][0]["renda_por_volta_adversario"] is None
@@ -0,0 +1,27 @@
+import random
+
+import pytest
+
+from src.controller import criar_jogadores
+from src.core import Jogo
+from src.reproducao import ReproducaoAoVivo, estado_do_jogo
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+def test_casas_alteradas_reconstroem_os_donos(compacto):
+    # Como a interface: pinta tudo no primeiro quadro e depois só `alteradas`,
+    # inclusive voltando no tempo e reiniciando com outra seed
+    fonte = ReproducaoAoVivo(Jogo(criar_jogadores(4), 30, seed=2, compacto=compacto))
+    pintadas = list(fonte.estado().proprietarios)
+    sorteio = random.Random(0)
+    for _ in range(300):
+        acao = sorteio.random()
+        if acao < 0.8:
+            fonte.avancar(sorteio.randint(1, 8))
+        elif acao < 0.95:
+            fonte.ir_para(sorteio.randint(0, fonte.turno))
+        else:
+            fonte.reiniciar(seed=sorteio.getrandbits(32))
+        for casa, dono in fonte.estado().alteradas.items():
+            pintadas[casa] = dono
+        assert pintadas == estado_do_jogo(fonte.jogo).proprietarios
@@ -0,0 +1,56 @@
+import pytest
+
+from src import runner
+from src.adaptativo import estimar
+from src.checkpoint import CheckpointIncompativel
+from src.torneio import torneio
+
+TEMPOS = ("duracao_segundos", "jogos_por_segundo", "processos", "checkpoint")
+
+
+def _sem_tempos(resposta):
+    return {chave: valor for chave, valor in resposta.items() if chave not in TEMPOS}
+
+
+def test_resultado_nao_depende_do_numero_de_processos():
+    um = runner.simular_paralelo(400, processos=1, seed=9, tamanho_fatia=100)
+    dois = runner.simular_paralelo(400, processos=2, seed=9, tamanho_fatia=100)
+    assert _sem_tempos(um) == _sem_tempos(dois)
+
+
+def test_checkpoint_retomado_chega_ao_resultado_sem_interrupcao(tmp_path, monkeypatch):
+    caminho = str(tmp_path / "lote.json")
+    original = runner.iterar_fatias_indexadas
+
+    def interrompida(*args, **kwargs):
+        fatias = original(*args, **kwargs)
+        for concluidas, fatia in enumerate(fatias):
+            if concluidas == 2:
+                fatias.close()
+                raise KeyboardInterrupt
+            yield fatia
+
+    monkeypatch.setattr(runner, "iterar_fatias_indexadas", interrompida)
+    with pytest.raises(KeyboardInterrupt):
+        runner.simular_paralelo(600, processos=1, seed=5, tamanho_fatia=100, checkpoint=caminho)
+    monkeypatch.undo()
+
+    retomado = runner.simular_paralelo(600, processos=1, seed=5, tamanho_fatia=100, checkpoint=caminho)
+    direto = runner.simular_paralelo(600, processos=1, seed=5, tamanho_fatia=100)
+    assert retomado["checkpoint"]["fatias_retomadas"] == 2
+    assert retomado["checkpoint"]["jogos_retomados"] == 200
+    assert _sem_tempos(retomado) == _sem_tempos(direto)
+
+
+def test_checkpoint_de_outra_execucao_e_recusado(tmp_path):
+    caminho = str(tmp_path / "lote.json")
+    runner.simular_paralelo(100, processos=1, seed=5, tamanho_fatia=50, checkpoint=caminho)
+    with pytest.raises(CheckpointIncompativel):
+        runner.simular_paralelo(200, processos=1, seed=5, tamanho_fatia=50, checkpoint=caminho)
+
+
+def test_lotes_vazios_sao_recusados():
+    with pytest.raises(ValueError):
+        estimar(precisao=0.05, max_jogos=0, processos=1)
+    with pytest.raises(ValueError):
+        torneio(["impulsivo", "cauteloso"], n=0, processos=1)
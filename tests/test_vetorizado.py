@@ -0,0 +1,31 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.controller import simular_lote
+from src.vetorizado import MotorVetorizado, simular_vetorizado
+
+
+def test_um_jogador_termina_na_primeira_rodada_nos_dois_motores():
+    vetorizado = simular_vetorizado(500, qtd_casas=20, jogadores=1, seed=1)
+    objetos = simular_lote(50, 20, 1, seed=1)
+    for resumo in (vetorizado, objetos):
+        assert resumo["taxa_termino_por_tempo"] == 0.0
+        assert resumo["rodadas"]["max"] == 1
+    assert vetorizado["vitorias"] == {"impulsivo": 500}
+
+
+def test_taxas_de_vitoria_coincidem_com_o_motor_de_objetos():
+    # Tolerância de ~4 desvios padrão para 2000 partidas de objetos
+    vetorizado = simular_vetorizado(20_000, seed=3)
+    objetos = simular_lote(2000, 20, 4, seed=3)
+    for nome, vitorias in objetos["vitorias"].items():
+        assert abs(vetorizado["vitorias"][nome] / 20_000 - vitorias / 2000) < 0.045
+    assert abs(vetorizado["taxa_termino_por_tempo"] - objetos["taxa_termino_por_tempo"]) < 0.045
+
+
+def test_mesma_seed_mesmas_partidas():
+    a = MotorVetorizado(500, seed=7).executar()
+    b = MotorVetorizado(500, seed=7).executar()
+    assert (a.vencedor == b.vencedor).all()
+    assert (a.rodadas == b.rodadas).all()